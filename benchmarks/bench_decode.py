@@ -0,0 +1,121 @@
+"""
+Benchmark per-cell decoding on a generated million-cell sheet
+
+    python benchmarks/bench_decode.py --rows 50000 --cols 20
+
+The sheet is parsed into memory first, so the timings cover only turning
+<c> elements into values. The previous exception-driven decode is timed
+on the same elements for comparison.
+"""
+
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from pyxslxview.core import Document
+from pyxslxview.parser import XLSXParser, SharedStringTable
+from pyxslxview.parser.styles import Styles
+from pyxslxview.parser.xml_backend import MAIN_NS, TAG_ROW, TAG_V
+
+
+CELL_TEMPLATES = (
+    '<c r="{ref}" t="s"><v>{i}</v></c>',
+    '<c r="{ref}" s="1"><v>{i}</v></c>',
+    '<c r="{ref}"><v>{i}.25</v></c>',
+    '<c r="{ref}" t="b"><v>{b}</v></c>',
+    '<c r="{ref}" t="str"><v>text {i}</v></c>',
+    '<c r="{ref}" t="inlineStr"><is><t>inline {i}</t></is></c>',
+    '<c r="{ref}" t="e"><v>#N/A</v></c>',
+)
+
+
+def build_sheet(rows: int, cols: int, strings: int) -> bytes:
+    """Build sheet XML cycling through every cell type"""
+    from pyxslxview.utils.helpers import Helpers
+    
+    letters = [Helpers.get_column_letter(col) for col in range(1, cols + 1)]
+    parts = [f'<worksheet xmlns="{MAIN_NS}"><sheetData>']
+    for row in range(1, rows + 1):
+        parts.append(f'<row r="{row}">')
+        for col, letter in enumerate(letters):
+            template = CELL_TEMPLATES[(row + col) % len(CELL_TEMPLATES)]
+            parts.append(template.format(ref=f"{letter}{row}", i=(row * cols + col) % strings,
+                                         b=row % 2))
+        parts.append('</row>')
+    parts.append('</sheetData></worksheet>')
+    return "".join(parts).encode("utf-8")
+
+
+def legacy_decode(cell_elem, doc: Document):
+    """Decode as the parser did before typed dispatch"""
+    value = None
+    style = None
+    v_elem = cell_elem.find(TAG_V)
+    if v_elem is not None and v_elem.text:
+        value = v_elem.text
+        if value.startswith("0"):
+            try:
+                value = doc.shared_strings[int(value)]
+            except (ValueError, IndexError):
+                pass
+        if cell_elem.get("t", "s") == "s":
+            try:
+                style_idx = int(v_elem.text)
+                if 0 <= style_idx < len(doc.styles.cell_formats):
+                    style = doc.styles.cell_formats[style_idx]
+            except (ValueError, IndexError):
+                pass
+    return value, style
+
+
+def decode_all(cell_elems: list, decode) -> int:
+    """Decode every collected <c> element"""
+    for row, col, cell_elem in cell_elems:
+        decode(cell_elem, row, col)
+    return len(cell_elems)
+
+
+def best_of(repeat: int, func) -> float:
+    """Get the fastest of ``repeat`` runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--strings", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    doc = Document()
+    doc.shared_strings = SharedStringTable()
+    for i in range(args.strings):
+        doc.shared_strings.append(f"string {i}")
+    doc.styles = Styles(cell_formats=[{}, {}])
+    
+    data = build_sheet(args.rows, args.cols, args.strings)
+    xlsx = XLSXParser("unused.xlsx")
+    
+    root = ET.fromstring(data)
+    cell_elems = [(row, col, cell_elem)
+                  for _, row_elem in xlsx._iter_rows_in_window(root.iter(TAG_ROW))
+                  for row, col, cell_elem in xlsx._iter_cells_in_window(row_elem)]
+    cells = len(cell_elems)
+    
+    typed = best_of(args.repeat, lambda: decode_all(
+        cell_elems, lambda elem, row, col: xlsx._decode_fields(elem, doc)))
+    legacy = best_of(args.repeat, lambda: decode_all(
+        cell_elems, lambda elem, row, col: legacy_decode(elem, doc)))
+    
+    print(f"{cells:,} cells, sheet XML {len(data) / 1e6:.1f} MB")
+    print(f"  typed dispatch  {typed:7.3f}s  {typed / cells * 1e9:6.0f} ns/cell")
+    print(f"  legacy decode   {legacy:7.3f}s  {legacy / cells * 1e9:6.0f} ns/cell")
+
+if __name__ == "__main__":
+    main()
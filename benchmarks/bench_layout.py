@@ -0,0 +1,67 @@
+"""
+Benchmark row height and column width computation on a synthetic worksheet
+
+    python benchmarks/bench_layout.py --rows 100000 --cols 5
+
+Computes every row height and column width with LayoutCalculator, once in
+a single pass over the cells and once per row and column through the
+worksheet's row/column indexes. The full-sheet scan per row used before
+the indexes is timed on the first rows only.
+"""
+
+import argparse
+import time
+
+from pyxslxview.core import Workbook
+from pyxslxview.layout.calculator import LayoutCalculator
+
+
+def scan_row_height(calculator: LayoutCalculator, row: int) -> float:
+    """Find a row's cells by scanning the whole sheet"""
+    height = 0.0
+    for (cell_row, _), cell in calculator.worksheet.cells.items():
+        if cell_row == row:
+            height = max(height, calculator.calculate_cell_size(cell)[1])
+    return height
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--cols", type=int, default=5)
+    parser.add_argument("--scan-rows", type=int, default=20)
+    args = parser.parse_args()
+    
+    worksheet = Workbook().add_worksheet("Data")
+    for row in range(1, args.rows + 1):
+        for col in range(1, args.cols + 1):
+            worksheet.cell(row, col).value = f"item {row * col}" if col % 2 else row * col
+    print(f"{args.rows:,} rows x {args.cols} cols")
+    
+    calculator = LayoutCalculator(worksheet)
+    start = time.perf_counter()
+    calculator.calculate_dimensions()
+    single_pass = time.perf_counter() - start
+    print(f"  single pass  {single_pass:7.2f} s")
+    
+    # Cell sizes stay cached so the remaining timings cover the lookups only
+    calculator._row_heights.clear()
+    calculator._column_widths.clear()
+    start = time.perf_counter()
+    for col in range(1, args.cols + 1):
+        calculator.calculate_column_width(col)
+    for row in range(1, args.rows + 1):
+        calculator.calculate_row_height(row)
+    indexed = time.perf_counter() - start
+    print(f"  indexed      {indexed:7.2f} s")
+    
+    start = time.perf_counter()
+    for row in range(1, args.scan_rows + 1):
+        scan_row_height(calculator, row)
+    scan = time.perf_counter() - start
+    print(f"  full scan    {scan / args.scan_rows * args.rows:7.2f} s  "
+          f"(extrapolated from {args.scan_rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
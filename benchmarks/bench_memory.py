@@ -0,0 +1,81 @@
+"""
+Benchmark memory of slotted model objects on a synthetic worksheet
+
+    python benchmarks/bench_memory.py --rows 50000 --cols 20
+
+Each variant runs in its own process and fills a worksheet dict with
+rows x cols cells plus one layout Rectangle per cell. The "dict" variant
+rebuilds Cell and Rectangle as plain dataclasses with the same fields, as
+they were before __slots__; the resident size growth of each process and
+the time to read every cell value are reported.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import field, fields, make_dataclass
+
+from pyxslxview.core import Workbook, Cell
+from pyxslxview.graphics.canvas import Rectangle
+
+
+def dict_variant(cls):
+    """Rebuild a slotted dataclass as a plain one with a per-instance __dict__"""
+    return make_dataclass(cls.__name__, [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory, init=f.init))
+        for f in fields(cls)
+    ], frozen=cls.__dataclass_params__.frozen)
+
+
+def rss_kb() -> int:
+    """Get the peak resident size of this process in KB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run(variant: str, rows: int, cols: int):
+    """Build the worksheet in this process and print the measurements"""
+    cell_cls, rect_cls = (Cell, Rectangle) if variant == "slots" else (dict_variant(Cell), dict_variant(Rectangle))
+    worksheet = Workbook().add_worksheet("Data")
+    before = rss_kb()
+    
+    cells = {}
+    rects = []
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            cells[(row, col)] = cell_cls(row=row, col=col, worksheet=worksheet, value=row * col + 0.5,
+                                         data_type="number")
+            rects.append(rect_cls(col * 64.0, row * 20.0, 64.0, 20.0))
+    growth = rss_kb() - before
+    
+    start = time.perf_counter()
+    total = 0.0
+    for cell in cells.values():
+        total += cell.value
+    access = time.perf_counter() - start
+    
+    count = rows * cols
+    print(f"  {variant:6} resident +{growth / 1024:7.1f} MB  {growth * 1024 / count:6.0f} B/cell  "
+          f"read values {access * 1e3:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--variant", choices=("slots", "dict"))
+    args = parser.parse_args()
+    
+    if args.variant:
+        run(args.variant, args.rows, args.cols)
+        return
+    
+    print(f"{args.rows * args.cols:,} cells (cell + rectangle per cell)")
+    for variant in ("dict", "slots"):
+        subprocess.run([sys.executable, __file__, "--rows", str(args.rows), "--cols", str(args.cols),
+                        "--variant", variant], check=True)
+
+
+if __name__ == "__main__":
+    main()
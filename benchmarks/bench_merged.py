@@ -0,0 +1,58 @@
+"""
+Benchmark merged cell lookups on a synthetic worksheet
+
+    python benchmarks/bench_merged.py --merges 5000 --rows 20000 --cols 10
+
+Merges 2x2 blocks down the sheet, then asks every cell whether it is merged
+and whether it anchors its range, as the renderers do. The linear scan over
+worksheet.merged_cells used before the index is timed for comparison.
+"""
+
+import argparse
+import time
+
+from pyxslxview.core import Workbook
+from pyxslxview.utils.references import coordinate
+
+
+def linear_scan(worksheet, row: int, col: int) -> bool:
+    """Check a cell against every merged range"""
+    merged = any(merged_range.contains(row, col) for merged_range in worksheet.merged_cells)
+    return merged and not any(merged_range.min_row == row and merged_range.min_col == col
+                              for merged_range in worksheet.merged_cells)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--merges", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--scan-rows", type=int, default=200)
+    args = parser.parse_args()
+    
+    worksheet = Workbook().add_worksheet("Data")
+    for row in range(1, args.rows + 1):
+        for col in range(1, args.cols + 1):
+            worksheet.cell(row, col).value = row * col
+    for i in range(args.merges):
+        row = 1 + (i * 4) % args.rows
+        col = 1 + (i * 4 // args.rows) * 3 % args.cols
+        worksheet.merge_cells(f"{coordinate(row, col)}:{coordinate(row + 1, col + 1)}")
+    cells = list(worksheet.cells.values())
+    print(f"{len(cells):,} cells, {len(worksheet.merged_cells):,} merged ranges")
+    
+    start = time.perf_counter()
+    covered = sum(1 for cell in cells if cell.is_merged() and not cell.is_merged_parent())
+    indexed = time.perf_counter() - start
+    print(f"  index   {indexed / len(cells) * 1e9:10.0f} ns/cell  ({covered:,} covered cells)")
+    
+    sample = [cell for cell in cells if cell.row <= args.scan_rows]
+    start = time.perf_counter()
+    for cell in sample:
+        linear_scan(worksheet, cell.row, cell.col)
+    linear = time.perf_counter() - start
+    print(f"  linear  {linear / len(sample) * 1e9:10.0f} ns/cell  (first {args.scan_rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark process-pool worksheet parsing
+
+    python benchmarks/bench_parallel.py --sheets 4 --rows 10000 --cols 20
+
+Writes a workbook of identical sheets mixing integers, floats and shared
+strings. For one sheet it reports the worker-side scan time, the pickled
+payload size and the time the parent spends creating cells from it; then
+full parses with workers=1 and workers=--workers are compared. With
+workers the cells are created on first access, timed separately.
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+import zipfile
+
+from pyxslxview.core import Document, Workbook
+from pyxslxview.parser import XLSXParser, SharedStringsParser
+from pyxslxview.parser.xml_backend import MAIN_NS, REL_NS, PKG_REL_NS
+from pyxslxview.utils.helpers import Helpers
+
+
+def write_workbook(path: str, sheets: int, rows: int, cols: int, strings: int):
+    """Write a workbook with ``sheets`` copies of a mixed-type sheet"""
+    letters = [Helpers.get_column_letter(col) for col in range(1, cols + 1)]
+    
+    parts = [f'<worksheet xmlns="{MAIN_NS}"><dimension ref="A1:{letters[-1]}{rows}"/><sheetData>']
+    for row in range(1, rows + 1):
+        cells = []
+        for col, letter in enumerate(letters, start=1):
+            if col % 3 == 0:
+                cells.append(f'<c r="{letter}{row}" t="s"><v>{(row * col) % strings}</v></c>')
+            elif col % 3 == 1:
+                cells.append(f'<c r="{letter}{row}"><v>{row * col}</v></c>')
+            else:
+                cells.append(f'<c r="{letter}{row}" s="1"><v>{row / col}</v></c>')
+        parts.append(f'<row r="{row}" spans="1:{cols}">{"".join(cells)}</row>')
+    parts.append("</sheetData></worksheet>")
+    sheet = "".join(parts)
+    
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        entries = "".join(f'<sheet name="Sheet{i}" sheetId="{i}" r:id="rId{i}"/>'
+                          for i in range(1, sheets + 1))
+        zf.writestr("xl/workbook.xml",
+                    f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets>{entries}</sheets></workbook>')
+        rels = "".join(f'<Relationship Id="rId{i}" Target="worksheets/sheet{i}.xml" '
+                       f'Type="{REL_NS}/worksheet"/>' for i in range(1, sheets + 1))
+        zf.writestr("xl/_rels/workbook.xml.rels", f'<Relationships xmlns="{PKG_REL_NS}">{rels}</Relationships>')
+        for i in range(1, sheets + 1):
+            zf.writestr(f"xl/worksheets/sheet{i}.xml", sheet)
+        items = "".join(f"<si><t>label {i}</t></si>" for i in range(strings))
+        zf.writestr("xl/sharedStrings.xml", f'<sst xmlns="{MAIN_NS}">{items}</sst>')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sheets", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--strings", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        write_workbook(path, args.sheets, args.rows, args.cols, args.strings)
+        print(f"{args.sheets} sheets x {args.rows * args.cols:,} cells")
+        
+        xlsx = XLSXParser(path)
+        with zipfile.ZipFile(path) as zf:
+            doc = Document(path)
+            doc.shared_strings = SharedStringsParser().parse(zf)
+            
+            start = time.perf_counter()
+            payload = xlsx._scan_worksheet_data(zf, "worksheets/sheet1.xml")
+            scan = time.perf_counter() - start
+        
+        size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        worksheet = Workbook().add_worksheet("Sheet1")
+        start = time.perf_counter()
+        xlsx._apply_worksheet_payload(payload, worksheet, doc)
+        apply = time.perf_counter() - start
+        print(f"  one sheet  worker scan {scan:6.2f}s  payload {size / 1e6:6.2f} MB  "
+              f"parent apply {apply:6.2f}s")
+        
+        for workers in (1, args.workers):
+            start = time.perf_counter()
+            parsed = XLSXParser(path, workers=workers).parse()
+            parse = time.perf_counter() - start
+            start = time.perf_counter()
+            for worksheet in parsed.worksheets:
+                len(worksheet.cells)
+            print(f"  workers={workers:<3} full parse {parse:6.2f}s  "
+                  f"first access {time.perf_counter() - start:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark bulk A1 reference conversion against per-reference calls
+
+    python benchmarks/bench_references.py --count 1000000
+
+Uses the NumPy path of the batch helpers when NumPy is installed and the
+pure-Python fallback otherwise. The batch helpers mostly save per-call
+overhead: with NumPy, parsing is about 1.7x faster than per-reference
+calls; the fallback is within ~20% of them, and slower for ranges.
+"""
+
+import argparse
+import random
+import time
+
+from pyxslxview.utils.helpers import Helpers, HAS_NUMPY
+
+
+def best_of(repeat: int, func) -> float:
+    """Get the fastest of ``repeat`` runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    rows = [rng.randint(1, 1048576) for _ in range(args.count)]
+    cols = [rng.randint(1, 16384) for _ in range(args.count)]
+    refs = [Helpers.tuple_to_cell_reference(row, col) for row, col in zip(rows, cols)]
+    ranges = [f"{a}:{b}" for a, b in zip(refs, reversed(refs))]
+    
+    timings = (
+        ("tuple_to_cell_reference", best_of(args.repeat, lambda: [
+            Helpers.tuple_to_cell_reference(row, col) for row, col in zip(rows, cols)])),
+        ("tuples_to_cell_references", best_of(args.repeat, lambda: Helpers.tuples_to_cell_references(rows, cols))),
+        ("parse_cell_reference", best_of(args.repeat, lambda: [
+            Helpers.parse_cell_reference(ref) for ref in refs])),
+        ("parse_cell_references", best_of(args.repeat, lambda: Helpers.parse_cell_references(refs))),
+        ("parse_range_reference", best_of(args.repeat, lambda: [
+            Helpers.parse_range_reference(ref) for ref in ranges])),
+        ("parse_range_references", best_of(args.repeat, lambda: Helpers.parse_range_references(ranges))),
+    )
+    
+    print(f"{args.count:,} references, {'numpy' if HAS_NUMPY else 'pure Python'} batch path")
+    for name, seconds in timings:
+        print(f"  {name:26} {seconds:7.3f}s  {seconds / args.count * 1e9:6.0f} ns/ref")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark worksheet cell storage backends
+
+    python benchmarks/bench_storage.py --rows 20000 --cols 20
+
+Fills a worksheet through Worksheet.cell() with a mix of numbers and
+repeated strings, then reports traced memory per cell, a full column scan,
+random cell lookups and page-sized rectangle queries for each backend.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from pyxslxview.core import Workbook
+
+
+def fill(storage: str, rows: int, cols: int):
+    """Build a worksheet with rows x cols cells"""
+    ws = Workbook().add_worksheet("Data", storage=storage)
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            cell = ws.cell(row, col)
+            cell.value = f"label {row % 100}" if col % 4 == 0 else row * col + 0.5
+            cell.data_type = "string" if col % 4 == 0 else "number"
+    return ws
+
+
+def scan_column(ws, col: int) -> float:
+    """Sum the numeric values of one column"""
+    cells = ws.cells
+    if hasattr(cells, "column_values"):
+        return sum(value for _, value in cells.column_values(col))
+    return sum(cell.value for (_, cell_col), cell in cells.items() if cell_col == col)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+    
+    cells = args.rows * args.cols
+    rng = random.Random(0)
+    keys = [(rng.randint(1, args.rows), rng.randint(1, args.cols)) for _ in range(args.lookups)]
+    pages = [rng.randint(1, max(1, args.rows - 50)) for _ in range(args.pages)]
+    print(f"{cells:,} cells")
+    
+    for storage in ("dict", "columnar", "blocks"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        ws = fill(storage, args.rows, args.cols)
+        build = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        start = time.perf_counter()
+        scan_column(ws, 1)
+        scan = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for row, col in keys:
+            ws.cell(row, col).value
+        lookup = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for first_row in pages:
+            for cell in ws.iter_cells(first_row, first_row + 49, 1, min(args.cols, 10)):
+                cell.value
+        page = time.perf_counter() - start
+        
+        print(f"  {storage:9} {memory / cells:6.0f} B/cell  build {build:6.2f}s  "
+              f"column scan {scan * 1e3:7.1f} ms  {lookup / args.lookups * 1e9:6.0f} ns/lookup  "
+              f"{page / args.pages * 1e3:6.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark StylesParser on a generated styles.xml
+
+    python benchmarks/bench_styles.py --xfs 50000
+
+Compares the single-pass parser against a reference walk that uses the
+previous ET.parse plus './/ns:' descendant lookups.
+"""
+
+import argparse
+import io
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+from pyxslxview.parser import StylesParser
+from pyxslxview.parser.xml_backend import MAIN_NS
+
+
+NS = {"ns": MAIN_NS}
+
+
+def build_styles(xfs: int, fonts: int, fills: int, borders: int) -> bytes:
+    """Build a styles.xml with the given number of entries per section"""
+    parts = [f'<styleSheet xmlns="{MAIN_NS}">',
+             '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.000"/></numFmts>']
+    
+    parts.append(f'<fonts count="{fonts}">')
+    for i in range(fonts):
+        parts.append(f'<font><b val="{i % 2}"/><sz val="{8 + i % 20}"/>'
+                     f'<color rgb="FF{i % 256:02X}0000"/><name val="Font{i % 7}"/></font>')
+    parts.append(f'</fonts><fills count="{fills}">')
+    for i in range(fills):
+        parts.append(f'<fill><patternFill patternType="solid"><fgColor rgb="FF00{i % 256:02X}00"/>'
+                     '</patternFill></fill>')
+    parts.append(f'</fills><borders count="{borders}">')
+    for i in range(borders):
+        parts.append('<border>' + "".join(
+            f'<{side} style="thin"><color rgb="FF0000{i % 256:02X}"/></{side}>'
+            for side in ("left", "right", "top", "bottom")) + '</border>')
+    parts.append(f'</borders><cellXfs count="{xfs}">')
+    for i in range(xfs):
+        parts.append(f'<xf numFmtId="{164 if i % 3 else 0}" fontId="{i % fonts}" '
+                     f'fillId="{i % fills}" borderId="{i % borders}">'
+                     f'<alignment horizontal="center" wrapText="{i % 2}"/></xf>')
+    parts.append('</cellXfs></styleSheet>')
+    return "".join(parts).encode("utf-8")
+
+
+def descendant_walk(data: bytes) -> int:
+    """Reference walk in the style of the previous tree-based parser"""
+    root = ET.parse(io.BytesIO(data)).getroot()
+    count = 0
+    for section, item, children in (("fonts", "font", ("b", "i", "sz", "color", "name")),
+                                    ("fills", "fill", ("patternFill", "fgColor", "bgColor")),
+                                    ("borders", "border", ("left", "right", "top", "bottom", "color")),
+                                    ("cellXfs", "xf", ())):
+        section_elem = root.find(f".//ns:{section}", NS)
+        for elem in section_elem.findall(f".//ns:{item}", NS):
+            for child in children:
+                elem.find(f".//ns:{child}", NS)
+            count += 1
+    return count
+
+
+def best_of(repeat: int, func) -> float:
+    """Get the fastest of ``repeat`` runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--xfs", type=int, default=50000)
+    parser.add_argument("--fonts", type=int, default=2000)
+    parser.add_argument("--fills", type=int, default=500)
+    parser.add_argument("--borders", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    data = build_styles(args.xfs, args.fonts, args.fills, args.borders)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("xl/styles.xml", data)
+    
+    def single_pass():
+        with zipfile.ZipFile(archive) as zf:
+            return StylesParser().parse(zf)
+    
+    styles = single_pass()
+    assert len(styles.style_table) == args.xfs
+    
+    walk_time = best_of(args.repeat, lambda: descendant_walk(data))
+    parse_time = best_of(args.repeat, single_pass)
+    
+    print(f"styles.xml: {len(data) / 1e6:.1f} MB, {args.xfs} xfs, {args.fonts} fonts")
+    print(f"  descendant lookups (no objects)  {walk_time:7.3f}s")
+    print(f"  single pass + resolved table     {parse_time:7.3f}s "
+          f"({parse_time / args.xfs * 1e6:.1f} us/xf)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark XML backends on a generated worksheet
+
+    python benchmarks/bench_xml_backend.py --rows 50000 --cols 20
+
+Times tokenizing the sheet part (no Cell objects are created), a full
+parse of a smaller sheet and shared strings loading for every available
+backend.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+
+from pyxslxview.parser import XLSXParser, SharedStringsParser
+from pyxslxview.parser import xml_backend
+from pyxslxview.utils.helpers import Helpers
+
+
+MAIN_NS = xml_backend.MAIN_NS
+REL_NS = xml_backend.REL_NS
+
+
+def write_workbook(path: str, rows: int, cols: int, strings: int):
+    """Write a single-sheet workbook with numeric cells and a shared strings part"""
+    letters = [Helpers.get_column_letter(col) for col in range(1, cols + 1)]
+    
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets>'
+            '<sheet name="Data" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships xmlns="{xml_backend.PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Target="worksheets/sheet1.xml" Type="{REL_NS}/worksheet"/>'
+            '</Relationships>',
+        )
+        
+        parts = [f'<worksheet xmlns="{MAIN_NS}"><dimension ref="A1:{letters[-1]}{rows}"/><sheetData>']
+        for row in range(1, rows + 1):
+            cells = "".join(f'<c r="{letter}{row}" t="n"><v>{row * col}</v></c>'
+                            for col, letter in enumerate(letters, start=1))
+            parts.append(f'<row r="{row}" spans="1:{cols}">{cells}</row>')
+        parts.append("</sheetData></worksheet>")
+        zf.writestr("xl/worksheets/sheet1.xml", "".join(parts))
+        
+        items = "".join(f"<si><t>string {i}</t></si>" for i in range(strings))
+        zf.writestr("xl/sharedStrings.xml", f'<sst xmlns="{MAIN_NS}">{items}</sst>')
+
+
+def best_of(repeat: int, func) -> float:
+    """Get the fastest of ``repeat`` runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--strings", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    backends = ["stdlib"] + (["lxml"] if xml_backend.HAS_LXML else [])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        small = os.path.join(tmp, "small.xlsx")
+        write_workbook(path, args.rows, args.cols, args.strings)
+        write_workbook(small, max(args.rows // 20, 1), args.cols, 0)
+        
+        print(f"{args.rows} rows x {args.cols} cols, {args.strings} shared strings")
+        for name in backends:
+            xml_backend.use_backend(name)
+            
+            def scan():
+                with zipfile.ZipFile(path) as zf:
+                    XLSXParser(path)._scan_worksheet_data(zf, "worksheets/sheet1.xml")
+            
+            def strings():
+                with zipfile.ZipFile(path) as zf:
+                    SharedStringsParser().parse(zf)
+            
+            scan_time = best_of(args.repeat, scan)
+            parse_time = best_of(args.repeat, lambda: XLSXParser(small).parse())
+            strings_time = best_of(args.repeat, strings)
+            
+            cells = args.rows * args.cols
+            print(f"  {name:<7} tokenize {scan_time:7.3f}s ({cells / scan_time:,.0f} cells/s)"
+                  f"  full parse (1/20 rows) {parse_time:7.3f}s"
+                  f"  shared strings {strings_time:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
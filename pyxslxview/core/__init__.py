@@ -4,17 +4,25 @@ Core module for pyxslxview
 
 from .document import Document
 from .workbook import Workbook
-from .worksheet import Worksheet
-from .cell import Cell
-from .range import Range
+from .worksheet import Worksheet, LazyWorksheet
+from .cell import Cell, CellRecord
+from .storage import CellStore, ColumnarCellStore, BlockCellStore
+from .range import Range, MergedCellIndex, MergedCellList
 from .styles import CellStyle, Font, Alignment, Border, Fill, Color
 
 __all__ = [
     "Document",
     "Workbook",
     "Worksheet",
+    "LazyWorksheet",
     "Cell",
+    "CellRecord",
+    "CellStore",
+    "ColumnarCellStore",
+    "BlockCellStore",
     "Range",
+    "MergedCellIndex",
+    "MergedCellList",
     "CellStyle",
     "Font",
     "Alignment",
@@ -2,35 +2,82 @@
 Cell representation
 """
 
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+import copy
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+from ..utils.references import coordinate
+from ..utils.slots import slotted
 
 if TYPE_CHECKING:
     from .worksheet import Worksheet
     from .styles import CellStyle
 
 
-@dataclass
+@slotted
+@dataclass(init=False)
 class Cell:
-    """Cell representation"""
+    """Cell representation
+    
+    ``style`` gives the cell its own style, as assigning ``cell.style``
+    does; ``style_id`` is keyword-only and selects a shared table entry.
+    """
     
     row: int
     col: int
     worksheet: "Worksheet"
     value: Optional[object] = None
     data_type: Optional[str] = None
-    style: Optional[CellStyle] = None
+    style_id: int = 0
     comment: Optional[str] = None
     hyperlink: Optional[str] = None
     formula: Optional[str] = None
+    _style: Optional["CellStyle"] = field(default=None, repr=False, compare=False)
     
-    def __post_init__(self):
-        if self.style is None:
-            from .styles import CellStyle
-            self.style = CellStyle()
-        if self.data_type is None:
+    def __init__(self, row: int, col: int, worksheet: "Worksheet", value: Optional[object] = None,
+                 data_type: Optional[str] = None, style: Optional["CellStyle"] = None,
+                 comment: Optional[str] = None, hyperlink: Optional[str] = None,
+                 formula: Optional[str] = None, *, style_id: int = 0):
+        self.row = row
+        self.col = col
+        self.worksheet = worksheet
+        self.value = value
+        self.data_type = data_type
+        self.style_id = style_id
+        self.comment = comment
+        self.hyperlink = hyperlink
+        self.formula = formula
+        self._style = style
+        if data_type is None:
             self._infer_data_type()
     
+    @property
+    def style(self) -> "CellStyle":
+        """Get the cell's own, mutable style
+        
+        The shared style table entry is copied on first access; use
+        ``resolved_style`` to read the style without copying it.
+        """
+        if self._style is None:
+            self._style = copy.deepcopy(self.resolved_style)
+        return self._style
+    
+    @style.setter
+    def style(self, value: "CellStyle"):
+        self._style = value
+    
+    @property
+    def resolved_style(self) -> "CellStyle":
+        """Get the effective style (read-only): own style or shared table entry"""
+        if self._style is not None:
+            return self._style
+        
+        workbook = getattr(self.worksheet, "workbook", None)
+        style_table = workbook.style_table if workbook is not None else None
+        if style_table and 0 <= self.style_id < len(style_table):
+            return style_table[self.style_id]
+        return _default_style()
+    
     def _infer_data_type(self):
         """Infer data type from value"""
         if self.value is None:
@@ -51,31 +98,41 @@ class Cell:
     @property
     def coordinate(self) -> str:
         """Get cell coordinate (e.g., 'A1')"""
-        col_str = ""
-        col = self.col
-        while col > 0:
-            col_str = chr(64 + (col % 26 if col % 26 != 0 else 26)) + col_str
-            col = (col - 1) // 26
-        return f"{col_str}{self.row}"
+        return coordinate(self.row, self.col)
     
     def is_merged(self) -> bool:
         """Check if cell is part of merged range"""
-        for merged_range in self.worksheet.merged_cells:
-            if merged_range.contains(self.row, self.col):
-                return True
-        return False
+        return self.worksheet.merged_range_at(self.row, self.col) is not None
     
     def is_merged_parent(self) -> bool:
         """Check if cell is the top-left of merged range"""
-        for merged_range in self.worksheet.merged_cells:
-            if (merged_range.min_row == self.row and 
-                merged_range.min_col == self.col):
-                return True
-        return False
+        return self.worksheet.is_merge_anchor(self.row, self.col)
     
     def __str__(self) -> str:
         return f"{self.coordinate}: {self.value}"
     
     def __repr__(self) -> str:
         return (f"Cell(row={self.row}, col={self.col}, value={self.value}, "
-                f"data_type='{self.data_type}', style={self.style})")
\ No newline at end of file
+                f"data_type='{self.data_type}', style_id={self.style_id})")
+
+
+class CellRecord(NamedTuple):
+    """Read-only cell data streamed from sheet XML"""
+    
+    row: int
+    col: int
+    value: Optional[object] = None
+    style_id: int = 0
+    data_type: Optional[str] = None
+
+
+_DEFAULT_STYLE = None
+
+
+def _default_style() -> "CellStyle":
+    """Get the shared style used when no style table entry applies"""
+    global _DEFAULT_STYLE
+    if _DEFAULT_STYLE is None:
+        from .styles import CellStyle
+        _DEFAULT_STYLE = CellStyle()
+    return _DEFAULT_STYLE
@@ -5,10 +5,13 @@ Color management for cell styles
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+from ..utils.slots import slotted
 
-@dataclass
+
+@slotted
+@dataclass(frozen=True)
 class Color:
-    """Color representation"""
+    """Color representation (immutable)"""
     
     red: int = 0
     green: int = 0
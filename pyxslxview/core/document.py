@@ -3,7 +3,7 @@ Document representation
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, List, Optional
 from .workbook import Workbook
 
 
@@ -16,24 +16,72 @@ class Document:
     shared_strings: Optional[list] = field(default_factory=list)
     styles: Optional[dict] = field(default_factory=dict)
     theme: Optional[dict] = field(default_factory=dict)
+    part_crcs: Dict[str, int] = field(default_factory=dict, repr=False)
+    _load_options: dict = field(default_factory=dict, repr=False, compare=False)
     
-    def load(self, filepath: str):
-        """Load XLSX file"""
+    def load(self, filepath: str, lazy: bool = False, window=None, workers: int = 1,
+             cache_dir: Optional[str] = None, storage: str = "dict"):
+        """Load XLSX file
+        
+        With ``lazy=True`` worksheets are returned as handles that parse their
+        sheet XML on first access to cells, rows, columns or merged cells,
+        and shared strings are only decoded when a cell first needs them.
+        ``window`` ('A1:Z60', a Range or a (min_row, max_row, min_col, max_col)
+        tuple) limits parsing to that block of cells. ``workers`` > 1 parses
+        sheets in that many processes and creates their cells on first
+        access. ``storage`` selects the cell backend of the worksheets
+        ('dict', 'columnar' or 'blocks').
+        
+        With ``cache_dir`` set, eager loads are served from a binary snapshot
+        of the parsed document when the file is unchanged, and a snapshot is
+        written after a parse otherwise. Restored worksheets create their
+        cells on first access.
+        """
         from ..parser.xlsx_parser import XLSXParser
+        from ..parser.snapshot import SnapshotCache
         
         self.filepath = filepath
-        parser = XLSXParser(filepath)
-        parsed_doc = parser.parse()
+        self._load_options = {"lazy": lazy, "window": window, "workers": workers,
+                              "storage": storage}
+        parser = XLSXParser(filepath, **self._load_options)
+        
+        cache = SnapshotCache(cache_dir) if cache_dir and not lazy else None
+        key = cache.key(filepath, parser.window) if cache else None
+        parsed_doc = cache.load(filepath, storage=storage, key=key) if cache else None
+        if parsed_doc is None:
+            parsed_doc = parser.parse()
+            if cache:
+                cache.store(parsed_doc, key=key)
         
         self.workbook = parsed_doc.workbook
         self.shared_strings = parsed_doc.shared_strings
         self.styles = parsed_doc.styles
         self.theme = parsed_doc.theme
+        self.part_crcs = parsed_doc.part_crcs
+    
+    def reload(self) -> List[str]:
+        """Re-parse the parts of the file that changed since it was loaded
+        
+        Parts are compared by the CRC32 in the zip central directory, so an
+        edit to one sheet only re-parses that sheet. Returns the names of the
+        changed parts.
+        """
+        from ..parser.xlsx_parser import XLSXParser
+        
+        parser = XLSXParser(self.filepath, **self._load_options)
+        return parser.reparse(self)
     
     def save(self, filepath: str):
         """Save document"""
         pass
     
+    @property
+    def style_table(self) -> list:
+        """Get the shared cell styles, indexed by Cell.style_id"""
+        if self.workbook:
+            return self.workbook.style_table
+        return []
+    
     @property
     def worksheets(self):
         """Get all worksheets"""
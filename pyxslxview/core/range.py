@@ -2,10 +2,16 @@
 Cell range representation
 """
 
-from dataclasses import dataclass
-from typing import Iterator, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
+from ..utils.slots import slotted
 
+if TYPE_CHECKING:
+    from .worksheet import Worksheet
+
+
+@slotted
 @dataclass
 class Range:
     """Cell range representation"""
@@ -14,7 +20,7 @@ class Range:
     max_row: int
     min_col: int
     max_col: int
-    worksheet = None
+    worksheet: Optional["Worksheet"] = field(default=None, compare=False)
     
     @property
     def size(self) -> Tuple[int, int]:
@@ -48,4 +54,124 @@ class Range:
         return f"{col_to_letter(self.min_col)}{self.min_row}:{col_to_letter(self.max_col)}{self.max_row}"
     
     def __repr__(self) -> str:
-        return f"Range(min_row={self.min_row}, max_row={self.max_row}, min_col={self.min_col}, max_col={self.max_col})"
\ No newline at end of file
+        return f"Range(min_row={self.min_row}, max_row={self.max_row}, min_col={self.min_col}, max_col={self.max_col})"
+
+
+class MergedCellList(list):
+    """List of merged ranges that counts changes to its items
+    
+    ``mutations`` lets a worksheet tell whether its merged cell index still
+    matches the list, whoever modified it.
+    """
+    
+    mutations = 0
+    
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.mutations += 1
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.mutations += 1
+    
+    def __iadd__(self, ranges):
+        self.mutations += 1
+        return super().__iadd__(ranges)
+    
+    def __imul__(self, count):
+        self.mutations += 1
+        return super().__imul__(count)
+    
+    def append(self, merged_range: Range):
+        super().append(merged_range)
+        self.mutations += 1
+    
+    def extend(self, ranges: Iterable[Range]):
+        super().extend(ranges)
+        self.mutations += 1
+    
+    def insert(self, index: int, merged_range: Range):
+        super().insert(index, merged_range)
+        self.mutations += 1
+    
+    def pop(self, *args) -> Range:
+        self.mutations += 1
+        return super().pop(*args)
+    
+    def remove(self, merged_range: Range):
+        super().remove(merged_range)
+        self.mutations += 1
+    
+    def clear(self):
+        super().clear()
+        self.mutations += 1
+
+
+class MergedCellIndex:
+    """Lookup of merged ranges by anchor and by covered cell
+    
+    Anchors are kept in a dict; covered cells are found through a grid of
+    tiles, each listing the ranges that overlap it. Ranges spanning more
+    than ``max_tiles`` tiles (e.g. whole merged columns or rows) are listed
+    per tile row if they are wider than tall and per tile column otherwise,
+    so a lookup only checks the large ranges crossing its row or column band.
+    """
+    
+    def __init__(self, ranges: Iterable[Range] = (), tile_rows: int = 64, tile_cols: int = 16,
+                 max_tiles: int = 64):
+        self.tile_rows = tile_rows
+        self.tile_cols = tile_cols
+        self.max_tiles = max_tiles
+        self.anchors: Dict[Tuple[int, int], Range] = {}
+        self.tiles: Dict[Tuple[int, int], List[Range]] = {}
+        self.row_bands: Dict[int, List[Range]] = {}
+        self.col_bands: Dict[int, List[Range]] = {}
+        self.count = 0
+        for merged_range in ranges:
+            self.add(merged_range)
+    
+    def add(self, merged_range: Range):
+        """Index a merged range"""
+        self.count += 1
+        self.anchors[(merged_range.min_row, merged_range.min_col)] = merged_range
+        
+        first_row, last_row = merged_range.min_row // self.tile_rows, merged_range.max_row // self.tile_rows
+        first_col, last_col = merged_range.min_col // self.tile_cols, merged_range.max_col // self.tile_cols
+        if (last_row - first_row + 1) * (last_col - first_col + 1) > self.max_tiles:
+            if last_row - first_row <= last_col - first_col:
+                for tile_row in range(first_row, last_row + 1):
+                    self.row_bands.setdefault(tile_row, []).append(merged_range)
+            else:
+                for tile_col in range(first_col, last_col + 1):
+                    self.col_bands.setdefault(tile_col, []).append(merged_range)
+            return
+        
+        tiles = self.tiles
+        for tile_row in range(first_row, last_row + 1):
+            for tile_col in range(first_col, last_col + 1):
+                tiles.setdefault((tile_row, tile_col), []).append(merged_range)
+    
+    def range_at(self, row: int, col: int) -> Optional[Range]:
+        """Get the merged range covering a cell, or None"""
+        merged_range = self.anchors.get((row, col))
+        if merged_range is not None:
+            return merged_range
+        
+        tile_row, tile_col = row // self.tile_rows, col // self.tile_cols
+        for merged_range in self.tiles.get((tile_row, tile_col), ()):
+            if merged_range.contains(row, col):
+                return merged_range
+        for merged_range in self.row_bands.get(tile_row, ()):
+            if merged_range.contains(row, col):
+                return merged_range
+        for merged_range in self.col_bands.get(tile_col, ()):
+            if merged_range.contains(row, col):
+                return merged_range
+        return None
+    
+    def is_anchor(self, row: int, col: int) -> bool:
+        """Check if a cell is the top-left cell of a merged range"""
+        return (row, col) in self.anchors
+    
+    def __len__(self) -> int:
+        return self.count
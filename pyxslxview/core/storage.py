@@ -0,0 +1,726 @@
+"""
+Cell storage backends
+"""
+
+import os
+import pickle
+import secrets
+import shutil
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .cell import Cell
+
+if TYPE_CHECKING:
+    from .worksheet import Worksheet
+
+
+KIND_NONE = 0
+KIND_STR = 1
+KIND_INT = 2
+KIND_FLOAT = 3
+KIND_TRUE = 4
+KIND_FALSE = 5
+KIND_OTHER = 6
+
+MAX_EXACT_INT = 1 << 53
+
+CELL_FIELDS = ("value", "data_type", "style_id", "comment", "hyperlink", "formula", "_style")
+
+
+class CellDict(dict):
+    """Plain (row, col) -> Cell dict that counts changes to its keys
+    
+    ``mutations`` lets a worksheet tell whether its bounds and row/column
+    index still match the cells, whoever modified the mapping.
+    """
+    
+    mutations = 0
+    
+    def __setitem__(self, key: Tuple[int, int], cell: Cell):
+        if key not in self:
+            self.mutations += 1
+        super().__setitem__(key, cell)
+    
+    def __delitem__(self, key: Tuple[int, int]):
+        super().__delitem__(key)
+        self.mutations += 1
+    
+    def setdefault(self, key: Tuple[int, int], default: Optional[Cell] = None):
+        if key not in self:
+            self.mutations += 1
+        return super().setdefault(key, default)
+    
+    def pop(self, *args):
+        self.mutations += 1
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.mutations += 1
+        return super().popitem()
+    
+    def update(self, *args, **kwargs):
+        self.mutations += 1
+        super().update(*args, **kwargs)
+    
+    def clear(self):
+        self.mutations += 1
+        super().clear()
+
+
+class CellStore(MutableMapping, ABC):
+    """Base class for (row, col) -> cell mappings that own their cell data
+    
+    Worksheets create cells through ``create``, so a store can hand out
+    views onto its own representation instead of full Cell objects.
+    ``mutations`` is bumped whenever a cell is added or removed.
+    """
+    
+    mutations = 0
+    
+    def __init__(self, worksheet: Optional["Worksheet"] = None):
+        self.worksheet = worksheet
+    
+    @abstractmethod
+    def create(self, row: int, col: int) -> Cell:
+        """Get or create the cell at (row, col)"""
+        pass
+    
+    @abstractmethod
+    def __getitem__(self, key: Tuple[int, int]) -> Cell:
+        """Get the cell at (row, col)"""
+        pass
+    
+    @abstractmethod
+    def __delitem__(self, key: Tuple[int, int]):
+        """Remove the cell at (row, col)"""
+        pass
+    
+    @abstractmethod
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over cell coordinates"""
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the number of cells"""
+        pass
+    
+    def iter_row_cells(self, min_row: int, max_row: Optional[int], min_col: int,
+                       max_col: Optional[int]) -> Iterator[Tuple[int, Dict[int, Cell]]]:
+        """Yield (row, {col: cell}) pairs in row order within the window"""
+        rows: Dict[int, Dict[int, Cell]] = {}
+        for (row, col), cell in self.items():
+            if (row >= min_row and (max_row is None or row <= max_row) and
+                    col >= min_col and (max_col is None or col <= max_col)):
+                rows.setdefault(row, {})[col] = cell
+        
+        for row in sorted(rows):
+            yield row, rows[row]
+    
+    def __setitem__(self, key: Tuple[int, int], cell: Cell):
+        """Copy the data of a Cell into the store"""
+        target = self.create(*key)
+        for name in CELL_FIELDS:
+            setattr(target, name, getattr(cell, name))
+
+
+def _attribute(name: str) -> property:
+    """Property for a rarely set cell attribute, kept in the store's sparse dict"""
+    
+    def getter(self):
+        attributes = self._store._attributes.get((self.row, self.col))
+        return attributes.get(name) if attributes else None
+    
+    def setter(self, value):
+        key = (self.row, self.col)
+        attributes = self._store._attributes
+        if value is not None:
+            attributes.setdefault(key, {})[name] = value
+        elif key in attributes:
+            attributes[key].pop(name, None)
+            if not attributes[key]:
+                del attributes[key]
+    
+    return property(getter, setter)
+
+
+class CellView(Cell):
+    """Cell backed by an entry of a ColumnarCellStore
+    
+    Views are created on demand and hold no cell data of their own, so any
+    number of them can refer to the same cell.
+    """
+    
+    __slots__ = ("_store", "_index", "_version")
+    
+    comment = _attribute("comment")
+    hyperlink = _attribute("hyperlink")
+    formula = _attribute("formula")
+    _style = _attribute("_style")
+    
+    def __init__(self, store: "ColumnarCellStore", row: int, col: int, index: int):
+        self._store = store
+        self.row = row
+        self.col = col
+        self._index = index
+        self._version = store._version
+    
+    def _position(self) -> int:
+        """Get the array index of the cell, refreshed after out-of-order inserts"""
+        store = self._store
+        if self._version != store._version:
+            index = store._find(self.row, self.col)
+            if index is None:
+                raise KeyError((self.row, self.col))
+            self._index = index
+            self._version = store._version
+        return self._index
+    
+    @property
+    def worksheet(self) -> "Worksheet":
+        """Get the worksheet owning the store"""
+        return self._store.worksheet
+    
+    @property
+    def value(self):
+        """Get the cell value"""
+        return self._store._get_value(self._position())
+    
+    @value.setter
+    def value(self, value):
+        self._store._set_value(self._position(), value)
+    
+    @property
+    def data_type(self) -> Optional[str]:
+        """Get the cell data type"""
+        store = self._store
+        return store._data_type_names[store.data_types[self._position()]]
+    
+    @data_type.setter
+    def data_type(self, value: Optional[str]):
+        store = self._store
+        store.data_types[self._position()] = store._data_type_code(value)
+    
+    @property
+    def style_id(self) -> int:
+        """Get the index into the workbook style table"""
+        return self._store.style_ids[self._position()]
+    
+    @style_id.setter
+    def style_id(self, value: int):
+        self._store.style_ids[self._position()] = value
+
+
+class ColumnarCellStore(CellStore):
+    """Cell data kept in parallel typed arrays, sorted by (row, col)
+    
+    Each cell costs 26 bytes of array space: row, col, style id, value kind,
+    data type, a float for numbers and an index into the interned strings.
+    Other values, comments, hyperlinks, formulas and own styles are kept in
+    sparse dicts. Lookups bisect the row and column arrays and return
+    CellViews.
+    """
+    
+    def __init__(self, worksheet: Optional["Worksheet"] = None):
+        super().__init__(worksheet)
+        self.clear()
+    
+    def clear(self):
+        """Remove all cells"""
+        self.rows = array("I")
+        self.cols = array("I")
+        self.style_ids = array("I")
+        self.kinds = array("B")
+        self.data_types = array("B")
+        self.numbers = array("d")
+        self.string_ids = array("I")
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._data_type_names: List[Optional[str]] = []
+        self._data_type_codes: Dict[Optional[str], int] = {}
+        self._others: Dict[Tuple[int, int], object] = {}
+        self._attributes: Dict[Tuple[int, int], dict] = {}
+        self._version = getattr(self, "_version", -1) + 1
+        self.mutations += 1
+    
+    @property
+    def nbytes(self) -> int:
+        """Get the size of the per-cell arrays in bytes"""
+        return sum(values.itemsize * len(values) for values in self._arrays())
+    
+    def _arrays(self) -> tuple:
+        """Get the per-cell arrays, in insertion order of their fields"""
+        return (self.rows, self.cols, self.style_ids, self.kinds, self.data_types,
+                self.numbers, self.string_ids)
+    
+    def _find(self, row: int, col: int) -> Optional[int]:
+        """Get the array index of (row, col), or None"""
+        rows = self.rows
+        lo = bisect_left(rows, row)
+        hi = bisect_right(rows, row, lo)
+        index = bisect_left(self.cols, col, lo, hi)
+        if index < hi and self.cols[index] == col:
+            return index
+        return None
+    
+    def _data_type_code(self, data_type: Optional[str]) -> int:
+        """Intern a data type name"""
+        code = self._data_type_codes.get(data_type)
+        if code is None:
+            code = self._data_type_codes[data_type] = len(self._data_type_names)
+            self._data_type_names.append(data_type)
+        return code
+    
+    def create(self, row: int, col: int) -> CellView:
+        """Get or create the cell at (row, col)"""
+        rows, cols = self.rows, self.cols
+        blank = self._data_type_code("blank")
+        
+        if not rows or row > rows[-1] or (row == rows[-1] and col > cols[-1]):
+            index = len(rows)
+            rows.append(row)
+            cols.append(col)
+            self.style_ids.append(0)
+            self.kinds.append(KIND_NONE)
+            self.data_types.append(blank)
+            self.numbers.append(0.0)
+            self.string_ids.append(0)
+            self.mutations += 1
+            return CellView(self, row, col, index)
+        
+        lo = bisect_left(rows, row)
+        hi = bisect_right(rows, row, lo)
+        index = bisect_left(cols, col, lo, hi)
+        if index == hi or cols[index] != col:
+            for values, value in zip(self._arrays(), (row, col, 0, KIND_NONE, blank, 0.0, 0)):
+                values.insert(index, value)
+            self._version += 1
+            self.mutations += 1
+        return CellView(self, row, col, index)
+    
+    def _get_value(self, index: int):
+        """Decode the value stored at an array index"""
+        kind = self.kinds[index]
+        if kind == KIND_STR:
+            return self.strings[self.string_ids[index]]
+        if kind == KIND_FLOAT:
+            return self.numbers[index]
+        if kind == KIND_INT:
+            return int(self.numbers[index])
+        if kind == KIND_TRUE or kind == KIND_FALSE:
+            return kind == KIND_TRUE
+        if kind == KIND_OTHER:
+            return self._others[(self.rows[index], self.cols[index])]
+        return None
+    
+    def _set_value(self, index: int, value):
+        """Encode a value at an array index"""
+        if self.kinds[index] == KIND_OTHER:
+            del self._others[(self.rows[index], self.cols[index])]
+        
+        if value is None:
+            kind = KIND_NONE
+        elif isinstance(value, str):
+            kind = KIND_STR
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                string_id = self._string_ids[value] = len(self.strings)
+                self.strings.append(value)
+            self.string_ids[index] = string_id
+        elif isinstance(value, bool):
+            kind = KIND_TRUE if value else KIND_FALSE
+        elif isinstance(value, int) and -MAX_EXACT_INT <= value <= MAX_EXACT_INT:
+            kind = KIND_INT
+            self.numbers[index] = value
+        elif isinstance(value, float):
+            kind = KIND_FLOAT
+            self.numbers[index] = value
+        else:
+            kind = KIND_OTHER
+            self._others[(self.rows[index], self.cols[index])] = value
+        self.kinds[index] = kind
+    
+    def column_values(self, col: int) -> Iterator[Tuple[int, object]]:
+        """Yield (row, value) for the cells of a column in row order"""
+        rows = self.rows
+        for index, cell_col in enumerate(self.cols):
+            if cell_col == col:
+                yield rows[index], self._get_value(index)
+    
+    def iter_row_cells(self, min_row: int, max_row: Optional[int], min_col: int,
+                       max_col: Optional[int]) -> Iterator[Tuple[int, Dict[int, Cell]]]:
+        """Yield (row, {col: cell}) pairs in row order within the window"""
+        rows, cols = self.rows, self.cols
+        index = bisect_left(rows, min_row)
+        end = len(rows) if max_row is None else bisect_right(rows, max_row, index)
+        
+        while index < end:
+            row = rows[index]
+            row_end = bisect_right(rows, row, index, end)
+            lo = bisect_left(cols, min_col, index, row_end)
+            hi = row_end if max_col is None else bisect_right(cols, max_col, lo, row_end)
+            if lo < hi:
+                yield row, {cols[i]: CellView(self, row, cols[i], i) for i in range(lo, hi)}
+            index = row_end
+    
+    def items(self) -> Iterator[Tuple[Tuple[int, int], CellView]]:
+        """Iterate ((row, col), cell) pairs in row order"""
+        for index, (row, col) in enumerate(zip(self.rows, self.cols)):
+            yield (row, col), CellView(self, row, col, index)
+    
+    def values(self) -> Iterator[CellView]:
+        """Iterate cells in row order"""
+        for _, cell in self.items():
+            yield cell
+    
+    def get(self, key: Tuple[int, int], default=None):
+        """Get the cell at (row, col), or ``default``"""
+        index = self._find(*key)
+        if index is None:
+            return default
+        return CellView(self, key[0], key[1], index)
+    
+    def __getitem__(self, key: Tuple[int, int]) -> CellView:
+        index = self._find(*key)
+        if index is None:
+            raise KeyError(key)
+        return CellView(self, key[0], key[1], index)
+    
+    def __delitem__(self, key: Tuple[int, int]):
+        index = self._find(*key)
+        if index is None:
+            raise KeyError(key)
+        
+        if self.kinds[index] == KIND_OTHER:
+            del self._others[key]
+        self._attributes.pop(key, None)
+        for values in self._arrays():
+            del values[index]
+        self._version += 1
+        self.mutations += 1
+    
+    def __contains__(self, key) -> bool:
+        return self._find(*key) is not None
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.rows, self.cols)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class BlockCellStore(CellStore):
+    """Cells partitioned into fixed-size blocks of the sheet grid
+    
+    A block of ``block_rows`` x ``block_cols`` cells is allocated when its
+    first cell is created, so a sparse sheet spanning the whole grid only
+    pays for the blocks it uses. Rectangle queries visit only the blocks
+    that intersect the rectangle.
+    
+    ``evict`` writes blocks that were not accessed since the previous call
+    to ``spill_dir`` (a temporary directory by default); they are read back
+    on their next access. Spill file names start with a random per-store
+    prefix, and the files are removed when the store is freed. Full
+    iteration (``items``, ``values``, ``keys``) streams evicted blocks from
+    disk without making them resident again.
+    """
+    
+    def __init__(self, worksheet: Optional["Worksheet"] = None, block_rows: int = 256,
+                 block_cols: int = 64, spill_dir: Optional[str] = None):
+        super().__init__(worksheet)
+        self.block_rows = block_rows
+        self.block_cols = block_cols
+        self.spill_dir = spill_dir
+        self.blocks: Dict[Tuple[int, int], Dict[int, Cell]] = {}
+        self._spilled: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        self._keys: List[Tuple[int, int]] = []
+        self._touched: Set[Tuple[int, int]] = set()
+        self._size = 0
+        self._spill_prefix: Optional[str] = None
+    
+    def _locate(self, row: int, col: int) -> Tuple[Tuple[int, int], int]:
+        """Get the block key of a cell and its offset within the block"""
+        row_block, row_offset = divmod(row - 1, self.block_rows)
+        col_block, col_offset = divmod(col - 1, self.block_cols)
+        return (row_block, col_block), row_offset * self.block_cols + col_offset
+    
+    def _block(self, key: Tuple[int, int], create: bool = False) -> Optional[Dict[int, Cell]]:
+        """Get a block, reading it back from disk if it was evicted"""
+        block = self.blocks.get(key)
+        if block is None:
+            if key in self._spilled:
+                block = self.blocks[key] = self._read_block(key)
+            elif create:
+                block = self.blocks[key] = {}
+                insort(self._keys, key)
+            else:
+                return None
+        self._touched.add(key)
+        return block
+    
+    def _block_keys(self, min_row: int = 1, max_row: Optional[int] = None, min_col: int = 1,
+                    max_col: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Get the sorted keys of resident and evicted blocks meeting a rectangle"""
+        keys = self._keys
+        first_row, first_col = (min_row - 1) // self.block_rows, (min_col - 1) // self.block_cols
+        start = bisect_left(keys, (first_row, first_col))
+        end = len(keys) if max_row is None else bisect_left(keys, ((max_row - 1) // self.block_rows + 1,))
+        last_col = None if max_col is None else (max_col - 1) // self.block_cols
+        return [key for key in keys[start:end]
+                if first_col <= key[1] and (last_col is None or key[1] <= last_col)]
+    
+    @property
+    def spilled_blocks(self) -> int:
+        """Get the number of blocks currently evicted to disk"""
+        return len(self._spilled)
+    
+    def evict(self) -> int:
+        """Write blocks not accessed since the previous call to disk
+        
+        Returns the number of blocks evicted. Cells of an evicted block are
+        re-created when it is read back, so Cell objects obtained before the
+        eviction no longer belong to the sheet.
+        """
+        untouched = [key for key in self.blocks if key not in self._touched]
+        if untouched and self._spill_prefix is None:
+            self._spill_prefix = secrets.token_hex(8)
+            if self.spill_dir is None:
+                self.spill_dir = tempfile.mkdtemp(prefix="pyxslxview-blocks-")
+                weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+            else:
+                weakref.finalize(self, _remove_spill_files, self._spilled)
+        
+        for key in untouched:
+            block = self.blocks.pop(key)
+            path = os.path.join(self.spill_dir, f"{self._spill_prefix}-{key[0]}-{key[1]}.block")
+            with open(path, "wb") as f:
+                pickle.dump([(offset, tuple(getattr(cell, name) for name in CELL_FIELDS))
+                             for offset, cell in block.items()], f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._spilled[key] = (path, len(block))
+        
+        self._touched = set()
+        return len(untouched)
+    
+    def _read_block(self, key: Tuple[int, int]) -> Dict[int, Cell]:
+        """Load an evicted block and remove its spill file"""
+        block = self._load_block(key)
+        path, _ = self._spilled.pop(key)
+        os.unlink(path)
+        return block
+    
+    def _load_block(self, key: Tuple[int, int]) -> Dict[int, Cell]:
+        """Re-create the cells of an evicted block, leaving it on disk"""
+        with open(self._spilled[key][0], "rb") as f:
+            entries = pickle.load(f)
+        
+        block = {}
+        first_row, first_col = key[0] * self.block_rows + 1, key[1] * self.block_cols + 1
+        for offset, fields in entries:
+            row_offset, col_offset = divmod(offset, self.block_cols)
+            cell = Cell(row=first_row + row_offset, col=first_col + col_offset, worksheet=self.worksheet)
+            for name, value in zip(CELL_FIELDS, fields):
+                setattr(cell, name, value)
+            block[offset] = cell
+        return block
+    
+    def create(self, row: int, col: int) -> Cell:
+        """Get or create the cell at (row, col)"""
+        key, offset = self._locate(row, col)
+        block = self._block(key, create=True)
+        cell = block.get(offset)
+        if cell is None:
+            cell = block[offset] = Cell(row=row, col=col, worksheet=self.worksheet)
+            self._size += 1
+            self.mutations += 1
+        return cell
+    
+    def _block_cells(self, key: Tuple[int, int], min_row: int, max_row: Optional[int],
+                     min_col: int, max_col: Optional[int]) -> List[Cell]:
+        """Get the cells of a block within a rectangle in row-major order
+        
+        Small rectangles probe their offsets; larger ones filter the block.
+        """
+        block = self._block(key)
+        block_rows, block_cols = self.block_rows, self.block_cols
+        first_row, first_col = key[0] * block_rows + 1, key[1] * block_cols + 1
+        row_lo = max(min_row - first_row, 0)
+        row_hi = block_rows - 1 if max_row is None else min(max_row - first_row, block_rows - 1)
+        col_lo = max(min_col - first_col, 0)
+        col_hi = block_cols - 1 if max_col is None else min(max_col - first_col, block_cols - 1)
+        
+        if row_lo == 0 and col_lo == 0 and row_hi == block_rows - 1 and col_hi == block_cols - 1:
+            return [block[offset] for offset in sorted(block)]
+        if (row_hi - row_lo + 1) * (col_hi - col_lo + 1) < len(block):
+            return [block[offset]
+                    for row in range(row_lo, row_hi + 1)
+                    for offset in range(row * block_cols + col_lo, row * block_cols + col_hi + 1)
+                    if offset in block]
+        return [block[offset] for offset in sorted(block)
+                if row_lo <= offset // block_cols <= row_hi and col_lo <= offset % block_cols <= col_hi]
+    
+    def iter_range(self, min_row: int = 1, max_row: Optional[int] = None, min_col: int = 1,
+                   max_col: Optional[int] = None) -> Iterator[Cell]:
+        """Yield the cells of a rectangle, block by block"""
+        for key in self._block_keys(min_row, max_row, min_col, max_col):
+            yield from self._block_cells(key, min_row, max_row, min_col, max_col)
+    
+    def iter_row_cells(self, min_row: int, max_row: Optional[int], min_col: int,
+                       max_col: Optional[int]) -> Iterator[Tuple[int, Dict[int, Cell]]]:
+        """Yield (row, {col: cell}) pairs in row order within the window"""
+        keys = self._block_keys(min_row, max_row, min_col, max_col)
+        for _, band in groupby(keys, key=lambda key: key[0]):
+            rows: Dict[int, Dict[int, Cell]] = {}
+            for key in band:
+                for cell in self._block_cells(key, min_row, max_row, min_col, max_col):
+                    rows.setdefault(cell.row, {})[cell.col] = cell
+            
+            for row in sorted(rows):
+                yield row, rows[row]
+    
+    def _stream(self) -> Iterator[Cell]:
+        """Yield every cell block by block, reading evicted blocks without keeping them
+        
+        Cells of an evicted block are temporary copies; changes to them are
+        not written back.
+        """
+        for key in list(self._keys):
+            block = self.blocks.get(key)
+            if block is None:
+                if key not in self._spilled:
+                    continue
+                block = self._load_block(key)
+            for offset in sorted(block):
+                yield block[offset]
+    
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Cell]]:
+        """Iterate ((row, col), cell) pairs, block by block"""
+        for cell in self._stream():
+            yield (cell.row, cell.col), cell
+    
+    def values(self) -> Iterator[Cell]:
+        """Iterate cells, block by block"""
+        return self._stream()
+    
+    def get(self, key: Tuple[int, int], default=None):
+        """Get the cell at (row, col), or ``default``"""
+        block_key, offset = self._locate(*key)
+        block = self._block(block_key)
+        if block is None:
+            return default
+        return block.get(offset, default)
+    
+    def __getitem__(self, key: Tuple[int, int]) -> Cell:
+        cell = self.get(key)
+        if cell is None:
+            raise KeyError(key)
+        return cell
+    
+    def __delitem__(self, key: Tuple[int, int]):
+        block_key, offset = self._locate(*key)
+        block = self._block(block_key)
+        if block is None or offset not in block:
+            raise KeyError(key)
+        
+        del block[offset]
+        self._size -= 1
+        self.mutations += 1
+        if not block:
+            del self.blocks[block_key]
+            del self._keys[bisect_left(self._keys, block_key)]
+    
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for cell in self._stream():
+            yield cell.row, cell.col
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+def _remove_spill_files(spilled: Dict[Tuple[int, int], Tuple[str, int]]):
+    """Delete the spill files of a freed BlockCellStore"""
+    for path, _ in spilled.values():
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class CellIndex:
+    """Sorted row -> columns and column -> rows maps of the stored cells"""
+    
+    def __init__(self, keys=()):
+        row_cols: Dict[int, List[int]] = {}
+        col_rows: Dict[int, List[int]] = {}
+        count = 0
+        for row, col in keys:
+            cols = row_cols.get(row)
+            if cols is None:
+                row_cols[row] = [col]
+            else:
+                cols.append(col)
+            rows = col_rows.get(col)
+            if rows is None:
+                col_rows[col] = [row]
+            else:
+                rows.append(row)
+            count += 1
+        
+        for cols in row_cols.values():
+            cols.sort()
+        for rows in col_rows.values():
+            rows.sort()
+        self.row_cols = row_cols
+        self.col_rows = col_rows
+        self.count = count
+    
+    def add(self, row: int, col: int):
+        """Index a new cell, appending when it sorts last"""
+        cols = self.row_cols.setdefault(row, [])
+        if not cols or col > cols[-1]:
+            cols.append(col)
+        else:
+            insort(cols, col)
+        
+        rows = self.col_rows.setdefault(col, [])
+        if not rows or row > rows[-1]:
+            rows.append(row)
+        else:
+            insort(rows, row)
+        self.count += 1
+    
+    def __contains__(self, key) -> bool:
+        row, col = key
+        cols = self.row_cols.get(row)
+        if not cols:
+            return False
+        i = bisect_left(cols, col)
+        return i < len(cols) and cols[i] == col
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+CELL_STORES = {
+    "columnar": ColumnarCellStore,
+    "blocks": BlockCellStore,
+}
+
+
+def create_cell_store(storage: str, worksheet: Optional["Worksheet"] = None):
+    """Create the cell mapping for a storage mode: 'dict' or a CELL_STORES name"""
+    if storage == "dict":
+        return CellDict()
+    if storage not in CELL_STORES:
+        raise ValueError(f"Unknown cell storage: {storage}")
+    return CELL_STORES[storage](worksheet)
+
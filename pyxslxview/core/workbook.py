@@ -7,6 +7,7 @@ from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .worksheet import Worksheet
+    from .styles import CellStyle
 
 
 @dataclass
@@ -16,11 +17,12 @@ class Workbook:
     worksheets: List["Worksheet"] = field(default_factory=list)
     active_sheet_index: int = 0
     calculation_mode: str = "auto"
+    style_table: List["CellStyle"] = field(default_factory=list, repr=False)
     
-    def add_worksheet(self, name: str) -> "Worksheet":
-        """Add a new worksheet"""
+    def add_worksheet(self, name: str, storage: str = "dict") -> "Worksheet":
+        """Add a new worksheet, keeping its cells in the given storage backend"""
         from .worksheet import Worksheet
-        ws = Worksheet(name=name, workbook=self)
+        ws = Worksheet(name=name, workbook=self, storage=storage)
         self.worksheets.append(ws)
         return ws
     
@@ -3,10 +3,12 @@ Worksheet representation
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, TYPE_CHECKING, Tuple
+from typing import Callable, Dict, Iterator, List, MutableMapping, Optional, TYPE_CHECKING, Tuple
 
 from ..core.cell import Cell
-from ..core.range import Range
+from ..core.range import MergedCellIndex, MergedCellList, Range
+from ..core.storage import CellDict, CellIndex, CellStore, create_cell_store
+from ..utils.references import split_range, split_reference
 
 if TYPE_CHECKING:
     from ..core.workbook import Workbook
@@ -87,8 +89,8 @@ class Worksheet:
     
     name: str
     workbook: "Workbook"
-    cells: Dict[Tuple[int, int], Cell] = field(default_factory=dict)
-    merged_cells: List[Range] = field(default_factory=list)
+    cells: MutableMapping[Tuple[int, int], Cell] = field(default_factory=dict)
+    merged_cells: List[Range] = field(default_factory=MergedCellList)
     rows: Dict[int, Row] = field(default_factory=dict)
     columns: Dict[int, Column] = field(default_factory=dict)
     page_setup: PageSetup = field(default_factory=PageSetup)
@@ -96,12 +98,114 @@ class Worksheet:
     hidden: bool = False
     selected: bool = False
     tab_color: object = None
+    dimension: Optional[Range] = None
+    storage: str = "dict"
+    _max_row: int = field(default=0, init=False, repr=False, compare=False)
+    _max_col: int = field(default=0, init=False, repr=False, compare=False)
+    _bounds_source: object = field(default=None, init=False, repr=False, compare=False)
+    _bounds_mutations: int = field(default=-1, init=False, repr=False, compare=False)
+    _merged_index: Optional[MergedCellIndex] = field(default=None, init=False, repr=False, compare=False)
+    _merged_source: Optional[List[Range]] = field(default=None, init=False, repr=False, compare=False)
+    _merged_mutations: int = field(default=-1, init=False, repr=False, compare=False)
+    _cell_index: Optional[CellIndex] = field(default=None, init=False, repr=False, compare=False)
+    _cell_index_source: object = field(default=None, init=False, repr=False, compare=False)
+    _cell_index_mutations: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.storage != "dict" or not isinstance(self.cells, CellDict):
+            cells = create_cell_store(self.storage, self)
+            for (row, col), cell in self.cells.items():
+                cells[(row, col)] = cell
+            self.cells = cells
+        if not isinstance(self.merged_cells, MergedCellList):
+            self.merged_cells = MergedCellList(self.merged_cells)
+        self._sync_bounds()
     
     def cell(self, row: int, col: int) -> Cell:
-        """Get or create cell"""
-        if (row, col) not in self.cells:
-            self.cells[(row, col)] = Cell(row=row, col=col, worksheet=self)
-        return self.cells[(row, col)]
+        """Get or create cell
+        
+        The sheet bounds are extended here; cells added to or removed from
+        ``cells`` directly are picked up through its mutation counter. With
+        ``storage='columnar'`` the returned cell is a view onto the store.
+        """
+        cells = self.cells
+        mutations = getattr(cells, "mutations", None)
+        index = self._cell_index
+        if (index is not None and (self._cell_index_source is not cells or
+                                   self._cell_index_mutations != mutations)):
+            index = None
+        
+        if isinstance(cells, CellStore):
+            cell = cells.create(row, col)
+        else:
+            cell = cells.get((row, col))
+            if cell is None:
+                cell = Cell(row=row, col=col, worksheet=self)
+                cells[(row, col)] = cell
+        
+        if index is not None and cells.mutations != mutations:
+            index.add(row, col)
+            self._cell_index_mutations = cells.mutations
+        if (mutations is not None and self._bounds_source is cells and
+                self._bounds_mutations == mutations):
+            if row > self._max_row:
+                self._max_row = row
+            if col > self._max_col:
+                self._max_col = col
+            self._bounds_mutations = cells.mutations
+        return cell
+    
+    def clear_cells(self):
+        """Remove all cells and reset the tracked bounds"""
+        self.cells = create_cell_store(self.storage, self)
+        self._max_row = 0
+        self._max_col = 0
+        self._bounds_source = self.cells
+        self._bounds_mutations = self.cells.mutations
+    
+    def _sync_bounds(self):
+        """Recompute the sheet bounds if cells were added or removed elsewhere"""
+        cells = self.cells
+        mutations = getattr(cells, "mutations", None)
+        if mutations is not None and self._bounds_source is cells and self._bounds_mutations == mutations:
+            return
+        
+        max_row = max_col = 0
+        for row, col in cells.keys():
+            if row > max_row:
+                max_row = row
+            if col > max_col:
+                max_col = col
+        self._max_row = max_row
+        self._max_col = max_col
+        self._bounds_source = cells
+        self._bounds_mutations = -1 if mutations is None else mutations
+    
+    @property
+    def cell_index(self) -> CellIndex:
+        """Get the row -> columns and column -> rows index of the stored cells
+        
+        The index is updated by ``cell`` and rebuilt when ``cells`` is
+        replaced or its mutation counter shows changes made elsewhere.
+        """
+        cells = self.cells
+        mutations = getattr(cells, "mutations", None)
+        index = self._cell_index
+        if (index is None or self._cell_index_source is not cells or
+                (len(index) != len(cells) if mutations is None else
+                 self._cell_index_mutations != mutations)):
+            index = self._cell_index = CellIndex(cells.keys())
+            self._cell_index_source = cells
+            self._cell_index_mutations = -1 if mutations is None else mutations
+        return index
+    
+    def row_columns(self, row: int) -> List[int]:
+        """Get the sorted columns holding cells in a row"""
+        return self.cell_index.row_cols.get(row, [])
+    
+    def column_rows(self, col: int) -> List[int]:
+        """Get the sorted rows holding cells in a column"""
+        return self.cell_index.col_rows.get(col, [])
     
     def get_row(self, row: int) -> Row:
         """Get or create row configuration"""
@@ -122,50 +226,199 @@ class Worksheet:
             min_row=min_row, max_row=max_row,
             min_col=min_col, max_col=max_col, worksheet=self
         )
-        self.merged_cells.append(merged_range)
+        index = self.merged_index
+        merged_cells = self.merged_cells
+        merged_cells.append(merged_range)
+        index.add(merged_range)
+        self._merged_mutations = merged_cells.mutations
+    
+    @property
+    def merged_index(self) -> MergedCellIndex:
+        """Get the index of merged ranges
+        
+        The index is updated by ``merge_cells`` and rebuilt when
+        ``merged_cells`` is replaced or its mutation counter shows changes
+        made elsewhere. A plain list assigned to ``merged_cells`` is swapped
+        for a MergedCellList here, so later changes must go through the
+        attribute.
+        """
+        merged_cells = self.merged_cells
+        if not isinstance(merged_cells, MergedCellList):
+            merged_cells = self.merged_cells = MergedCellList(merged_cells)
+        
+        index = self._merged_index
+        if (index is None or self._merged_source is not merged_cells or
+                self._merged_mutations != merged_cells.mutations):
+            index = self._merged_index = MergedCellIndex(merged_cells)
+            self._merged_source = merged_cells
+            self._merged_mutations = merged_cells.mutations
+        return index
+    
+    def merged_range_at(self, row: int, col: int) -> Optional[Range]:
+        """Get the merged range covering a cell, or None"""
+        return self.merged_index.range_at(row, col)
+    
+    def is_merge_anchor(self, row: int, col: int) -> bool:
+        """Check if a cell is the top-left cell of a merged range"""
+        return self.merged_index.is_anchor(row, col)
     
     def _parse_cell_range(self, range_str: str):
         """Parse cell range string"""
-        parts = range_str.split(":")
-        start = self._parse_cell_reference(parts[0])
-        end = self._parse_cell_reference(parts[1])
-        return (start[0], end[0], start[1], end[1])
+        min_row, min_col, max_row, max_col = split_range(range_str)
+        return (min_row, max_row, min_col, max_col)
     
     def _parse_cell_reference(self, ref: str):
         """Parse cell reference (e.g., 'A1') to row, col"""
-        col_str = ""
-        row_str = ""
+        return split_reference(ref)
+    
+    def iter_rows(self, min_row: int = 1, max_row: Optional[int] = None,
+                  min_col: int = 1, max_col: Optional[int] = None,
+                  values_only: bool = False) -> Iterator[tuple]:
+        """Iterate over rows as tuples of cells (or values)
         
-        for char in ref:
-            if char.isalpha():
-                col_str += char
-            elif char.isdigit():
-                row_str += char
+        Rows are yielded from ``min_row`` up to the last row holding data in
+        the window; missing cells are returned as None. Without ``max_col``
+        each row tuple ends at its last populated column.
+        """
+        row_cells = self._iter_row_cells(min_row, max_row, min_col, max_col)
+        empty_row = tuple([None] * (max_col - min_col + 1)) if max_col is not None else ()
+        next_row = min_row
         
-        col = 0
-        for char in col_str:
-            col = col * 26 + (ord(char.upper()) - ord('A') + 1)
+        for row, cells in row_cells:
+            while next_row < row:
+                yield empty_row
+                next_row += 1
+            
+            last_col = max_col if max_col is not None else max(cells, default=min_col - 1)
+            if values_only:
+                yield tuple(cells[col].value if col in cells else None
+                            for col in range(min_col, last_col + 1))
+            else:
+                yield tuple(cells.get(col) for col in range(min_col, last_col + 1))
+            next_row = row + 1
+    
+    def iter_cells(self, min_row: int = 1, max_row: Optional[int] = None,
+                   min_col: int = 1, max_col: Optional[int] = None) -> Iterator[Cell]:
+        """Iterate over the existing cells of a rectangle in row-major order
         
-        row = int(row_str)
-        return (row, col)
+        Only stored cells are visited: a CellStore answers the query from its
+        own index, and a dict is probed cell by cell when the rectangle is
+        smaller than the sheet.
+        """
+        cells = self.cells
+        if (not isinstance(cells, CellStore) and max_row is not None and max_col is not None
+                and (max_row - min_row + 1) * (max_col - min_col + 1) < len(cells)):
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    cell = cells.get((row, col))
+                    if cell is not None:
+                        yield cell
+            return
+        
+        for _, row_cells in self._iter_row_cells(min_row, max_row, min_col, max_col):
+            for col in sorted(row_cells):
+                yield row_cells[col]
+    
+    def _iter_row_cells(self, min_row: int, max_row: Optional[int], min_col: int,
+                        max_col: Optional[int]) -> Iterator[Tuple[int, Dict[int, Cell]]]:
+        """Yield (row, {col: cell}) pairs in row order within the window"""
+        cells = self.cells
+        if isinstance(cells, CellStore):
+            yield from cells.iter_row_cells(min_row, max_row, min_col, max_col)
+            return
+        
+        rows: Dict[int, Dict[int, Cell]] = {}
+        for (row, col), cell in cells.items():
+            if (row >= min_row and (max_row is None or row <= max_row) and
+                    col >= min_col and (max_col is None or col <= max_col)):
+                rows.setdefault(row, {})[col] = cell
+        
+        for row in sorted(rows):
+            yield row, rows[row]
     
     @property
     def max_row(self) -> int:
         """Get maximum row number with data"""
-        if not self.cells:
-            return 0
-        return max(row for row, _ in self.cells.keys())
+        self._sync_bounds()
+        return self._max_row
     
     @property
     def max_col(self) -> int:
         """Get maximum column number with data"""
-        if not self.cells:
-            return 0
-        return max(col for _, col in self.cells.keys())
+        self._sync_bounds()
+        return self._max_col
     
     def __str__(self) -> str:
         return f"Worksheet('{self.name}', {len(self.cells)} cells)"
     
     def __repr__(self) -> str:
         return (f"Worksheet(name='{self.name}', workbook={self.workbook}, "
-                f"cells={len(self.cells)}, merged_cells={len(self.merged_cells)})")
\ No newline at end of file
+                f"cells={len(self.cells)}, merged_cells={len(self.merged_cells)})")
+
+
+def _lazy_attribute(name: str) -> property:
+    """Property that loads the sheet data before returning the attribute"""
+    attr = f"_{name}"
+    
+    def getter(self):
+        self.load()
+        return getattr(self, attr)
+    
+    def setter(self, value):
+        setattr(self, attr, value)
+    
+    return property(getter, setter)
+
+
+class LazyWorksheet(Worksheet):
+    """Worksheet handle whose sheet data is parsed on first access"""
+    
+    cells = _lazy_attribute("cells")
+    merged_cells = _lazy_attribute("merged_cells")
+    rows = _lazy_attribute("rows")
+    columns = _lazy_attribute("columns")
+    
+    def __init__(self, name: str, workbook: "Workbook",
+                 loader: Optional[Callable[[Worksheet], None]] = None,
+                 row_source: Optional[Callable[..., Iterator[tuple]]] = None, **kwargs):
+        self.loader = None
+        self.row_source = row_source
+        super().__init__(name=name, workbook=workbook, **kwargs)
+        self.loader = loader
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Check if sheet data has been parsed"""
+        return self.loader is None
+    
+    def load(self):
+        """Parse sheet data if it has not been loaded yet"""
+        loader = self.loader
+        if loader is not None:
+            self.loader = None
+            loader(self)
+    
+    def _iter_row_cells(self, min_row: int, max_row: Optional[int], min_col: int,
+                        max_col: Optional[int]) -> Iterator[Tuple[int, Dict[int, Cell]]]:
+        """Stream rows from the archive while the sheet is not loaded"""
+        if self.is_loaded or self.row_source is None:
+            return super()._iter_row_cells(min_row, max_row, min_col, max_col)
+        return self.row_source(min_row, max_row, min_col, max_col)
+    
+    @property
+    def max_row(self) -> int:
+        """Get maximum row number, from the declared dimension until loaded"""
+        if not self.is_loaded and self.dimension is not None:
+            return self.dimension.max_row
+        self.load()
+        self._sync_bounds()
+        return self._max_row
+    
+    @property
+    def max_col(self) -> int:
+        """Get maximum column number, from the declared dimension until loaded"""
+        if not self.is_loaded and self.dimension is not None:
+            return self.dimension.max_col
+        self.load()
+        self._sync_bounds()
+        return self._max_col
@@ -4,7 +4,7 @@ Graphics module
 
 from .canvas import Canvas, Point, Rectangle
 from .color import ColorManager
-from .font import FontManager, FontMetrics
+from .font import FontManager, FontMetrics, TextMeasureCache, clear_measure_cache
 from .image import ImageManager
 
 __all__ = [
@@ -14,5 +14,7 @@ __all__ = [
     "ColorManager",
     "FontManager",
     "FontMetrics",
+    "TextMeasureCache",
+    "clear_measure_cache",
     "ImageManager",
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ from ..core.font import Font
 from .color import ColorManager
 from .font import FontManager
 from .image import ImageManager
+from ..utils.slots import slotted
 
 try:
     from PIL import ImageDraw
@@ -16,7 +17,8 @@ except Exception:
     ImageDraw = None
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class Point:
     """Point in 2D space"""
     
@@ -24,7 +26,8 @@ class Point:
     y: float
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class Rectangle:
     """Rectangle in 2D space"""
     
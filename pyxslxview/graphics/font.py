@@ -2,9 +2,13 @@
 Font management for graphics
 """
 
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from ..core.font import Font
+from ..utils.cache import LRUCache
+
+
+ADVANCE_TABLE_SIZE = 0x250
 
 
 @dataclass
@@ -17,12 +21,98 @@ class FontMetrics:
     max_width: float
 
 
+class GlyphAdvances:
+    """Advance widths of one font, indexed by code point
+    
+    Basic Latin through Latin Extended-B is measured up front; other code
+    points are measured on first use. Text width is the plain sum of the
+    advances, without kerning. Without a font file every glyph gets
+    ``default``.
+    """
+    
+    def __init__(self, pil_font, default: float):
+        self.pil_font = pil_font
+        self.default = default
+        self.extra: Dict[str, float] = {}
+        if pil_font is None:
+            self.widths: List[float] = [0.0] * 32 + [default] * (ADVANCE_TABLE_SIZE - 32)
+        else:
+            self.widths = [0.0] * 32 + [float(pil_font.getlength(chr(code)))
+                                        for code in range(32, ADVANCE_TABLE_SIZE)]
+    
+    def advance(self, char: str) -> float:
+        """Get the advance width of one character"""
+        code = ord(char)
+        if code < ADVANCE_TABLE_SIZE:
+            return self.widths[code]
+        
+        width = self.extra.get(char)
+        if width is None:
+            width = self.default if self.pil_font is None else float(self.pil_font.getlength(char))
+            self.extra[char] = width
+        return width
+    
+    def measure(self, text: str) -> float:
+        """Get the width of a single line of text"""
+        if text.isascii():
+            return sum(map(self.widths.__getitem__, text.encode("ascii")))
+        return sum(map(self.advance, text))
+
+
+class TextMeasureCache:
+    """Bounded cache of text measurements keyed by (font key, text)"""
+    
+    def __init__(self, max_size: int = 65536):
+        self._cache = LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[float, float]]:
+        """Get a cached (width, height), counting the hit or miss"""
+        size = self._cache.get(key)
+        if size is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return size
+    
+    def set(self, key: Tuple[str, str], size: Tuple[float, float]):
+        """Store a measurement"""
+        self._cache.set(key, size)
+    
+    def clear(self):
+        """Clear the measurements and counters"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self) -> Dict[str, int]:
+        """Get the hit/miss counters and current size"""
+        return {"hits": self.hits, "misses": self.misses, "size": self._cache.size()}
+
+
+TEXT_MEASURE_CACHE = TextMeasureCache()
+
+
+def clear_measure_cache():
+    """Clear the text measurements shared by the default font managers"""
+    TEXT_MEASURE_CACHE.clear()
+
+
 class FontManager:
-    """Font manager for graphics operations"""
+    """Font manager for graphics operations
     
-    def __init__(self):
+    Text measurements go through ``measure_cache``, by default the module's
+    TEXT_MEASURE_CACHE, so the layout and renderer managers share them.
+    clear_cache() leaves that shared cache alone; use clear_measure_cache()
+    to empty it.
+    """
+    
+    def __init__(self, measure_cache: Optional[TextMeasureCache] = None):
+        self.measure_cache = measure_cache if measure_cache is not None else TEXT_MEASURE_CACHE
         self._font_cache: Dict[str, any] = {}
         self._metrics_cache: Dict[str, FontMetrics] = {}
+        self._advance_cache: Dict[str, GlyphAdvances] = {}
     
     def get_font_key(self, font: Font) -> str:
         """Get unique key for font"""
@@ -119,17 +209,29 @@ class FontManager:
             max_width=font.size * 0.6,
         )
     
+    def get_advances(self, font: Font) -> GlyphAdvances:
+        """Get the glyph advance table of a font"""
+        key = self.get_font_key(font)
+        
+        advances = self._advance_cache.get(key)
+        if advances is None:
+            advances = GlyphAdvances(self.get_font(font)["font"], self.get_metrics(font).max_width)
+            self._advance_cache[key] = advances
+        
+        return advances
+    
     def measure_text(self, font: Font, text: str):
         """Measure text dimensions"""
-        metrics = self.get_metrics(font)
-        
-        char_width = metrics.max_width
-        width = char_width * len(text)
-        height = metrics.height
+        key = (self.get_font_key(font), text)
+        size = self.measure_cache.get(key)
+        if size is None:
+            size = (self.get_advances(font).measure(text), self.get_metrics(font).height)
+            self.measure_cache.set(key, size)
         
-        return (width, height)
+        return size
     
     def clear_cache(self):
-        """Clear font cache"""
+        """Clear this manager's font, metrics and glyph advance caches"""
         self._font_cache.clear()
-        self._metrics_cache.clear()
\ No newline at end of file
+        self._metrics_cache.clear()
+        self._advance_cache.clear()
\ No newline at end of file
@@ -2,14 +2,23 @@
 Layout calculator
 """
 
-from typing import Tuple, Dict
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
 from ..core.cell import Cell
+from ..core.range import Range
 from ..core.worksheet import Worksheet
+from ..utils.references import MAX_COLUMN, MAX_ROW
 from .measurer import Measurer
 
 
 class LayoutCalculator:
-    """Layout calculator"""
+    """Layout calculator
+    
+    Cell positions come from cumulative offset tables: ``_column_offsets[c]``
+    is the x of column ``c + 1`` (hidden columns have zero width), and
+    likewise for rows. The tables grow on demand and are patched in place
+    by ``set_row_height``/``set_column_width``.
+    """
     
     def __init__(self, worksheet: Worksheet):
         self.worksheet = worksheet
@@ -17,6 +26,9 @@ class LayoutCalculator:
         self._cell_sizes: Dict[Tuple[int, int], Tuple[float, float]] = {}
         self._column_widths: Dict[int, float] = {}
         self._row_heights: Dict[int, float] = {}
+        self._merged_sizes: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self._column_offsets: List[float] = [0.0]
+        self._row_offsets: List[float] = [0.0]
     
     def calculate_cell_size(self, cell: Cell) -> Tuple[float, float]:
         """Calculate cell size"""
@@ -29,16 +41,12 @@ class LayoutCalculator:
         if col not in self._column_widths:
             max_width = 0.0
             
-            for (row, c), cell in self.worksheet.cells.items():
-                if c == col:
-                    width, _ = self.calculate_cell_size(cell)
-                    max_width = max(max_width, width)
-            
-            col_obj = self.worksheet.columns.get(col)
-            if col_obj and col_obj.width > 0:
-                max_width = max(max_width, col_obj.width * 7.5)
+            cells = self.worksheet.cells
+            for row in self.worksheet.column_rows(col):
+                width, _ = self.calculate_cell_size(cells[(row, col)])
+                max_width = max(max_width, width)
             
-            self._column_widths[col] = max(max_width, 64.0)
+            self._column_widths[col] = self._column_width(col, max_width)
         
         return self._column_widths[col]
     
@@ -47,72 +55,202 @@ class LayoutCalculator:
         if row not in self._row_heights:
             max_height = 0.0
             
-            for (r, col), cell in self.worksheet.cells.items():
-                if r == row:
-                    _, height = self.calculate_cell_size(cell)
-                    max_height = max(max_height, height)
-            
-            row_obj = self.worksheet.rows.get(row)
-            if row_obj and row_obj.height > 0:
-                max_height = max(max_height, row_obj.height)
+            cells = self.worksheet.cells
+            for col in self.worksheet.row_columns(row):
+                _, height = self.calculate_cell_size(cells[(row, col)])
+                max_height = max(max_height, height)
             
-            self._row_heights[row] = max(max_height, 20.0)
+            self._row_heights[row] = self._row_height(row, max_height)
         
         return self._row_heights[row]
     
+    def _column_width(self, col: int, content_width: float) -> float:
+        """Apply the column setting and minimum to the widest cell content"""
+        col_obj = self.worksheet.columns.get(col)
+        if col_obj and col_obj.width > 0:
+            content_width = max(content_width, col_obj.width * 7.5)
+        return max(content_width, 64.0)
+    
+    def _row_height(self, row: int, content_height: float) -> float:
+        """Apply the row setting and minimum to the tallest cell content"""
+        row_obj = self.worksheet.rows.get(row)
+        if row_obj and row_obj.height > 0:
+            content_height = max(content_height, row_obj.height)
+        return max(content_height, 20.0)
+    
+    def calculate_dimensions(self):
+        """Calculate every row height and column width in one pass over the cells"""
+        widths: Dict[int, float] = {}
+        heights: Dict[int, float] = {}
+        for (row, col), cell in self.worksheet.cells.items():
+            width, height = self.calculate_cell_size(cell)
+            if width > widths.get(col, 0.0):
+                widths[col] = width
+            if height > heights.get(row, 0.0):
+                heights[row] = height
+        
+        column_widths = self._column_widths
+        for col in range(1, self.worksheet.max_col + 1):
+            if col not in column_widths:
+                column_widths[col] = self._column_width(col, widths.get(col, 0.0))
+        row_heights = self._row_heights
+        for row in range(1, self.worksheet.max_row + 1):
+            if row not in row_heights:
+                row_heights[row] = self._row_height(row, heights.get(row, 0.0))
+    
     def calculate_merged_cells(self):
         """Calculate merged cell layout"""
         for merged_range in self.worksheet.merged_cells:
-            max_width = 0.0
-            max_height = 0.0
-            
-            for row in range(merged_range.min_row, merged_range.max_row + 1):
-                height = self.calculate_row_height(row)
-                max_height += height
-            
-            for col in range(merged_range.min_col, merged_range.max_col + 1):
-                width = self.calculate_column_width(col)
-                max_width += width
-            
-            merged_range.width = max_width
-            merged_range.height = max_height
+            self._merged_sizes[(merged_range.min_row, merged_range.min_col)] = self.range_extent(
+                merged_range.min_row, merged_range.min_col, merged_range.max_row, merged_range.max_col)
+    
+    def merged_cell_size(self, row: int, col: int) -> Tuple[float, float]:
+        """Get the size of the merged range anchored at a cell"""
+        return self._merged_sizes[(row, col)]
     
     def calculate_worksheet_size(self) -> Tuple[float, float]:
         """Calculate total worksheet size"""
-        total_width = 0.0
-        total_height = 0.0
-        
-        for col in range(1, self.worksheet.max_col + 1):
-            total_width += self.calculate_column_width(col)
-        
-        for row in range(1, self.worksheet.max_row + 1):
-            total_height += self.calculate_row_height(row)
-        
-        return (total_width, total_height)
+        self.calculate_dimensions()
+        return (self.column_x(self.worksheet.max_col + 1), self.row_y(self.worksheet.max_row + 1))
+    
+    def _column_extent(self, col: int) -> float:
+        """Get the width a column takes in the layout (zero when hidden)"""
+        col_obj = self.worksheet.columns.get(col)
+        if col_obj is not None and col_obj.hidden:
+            return 0.0
+        return self.calculate_column_width(col)
+    
+    def _row_extent(self, row: int) -> float:
+        """Get the height a row takes in the layout (zero when hidden)"""
+        row_obj = self.worksheet.rows.get(row)
+        if row_obj is not None and row_obj.hidden:
+            return 0.0
+        return self.calculate_row_height(row)
+    
+    @staticmethod
+    def _offset(offsets: List[float], index: int, extent: Callable[[int], float]) -> float:
+        """Get the cumulative offset before ``index``, extending the table as needed"""
+        if index > len(offsets):
+            total = offsets[-1]
+            for i in range(len(offsets), index):
+                total += extent(i)
+                offsets.append(total)
+        return offsets[index - 1]
+    
+    def column_x(self, col: int) -> float:
+        """Get the x offset of a column's left edge"""
+        offsets = self._column_offsets
+        if col <= len(offsets):
+            return offsets[col - 1]
+        return self._offset(offsets, col, self._column_extent)
+    
+    def row_y(self, row: int) -> float:
+        """Get the y offset of a row's top edge"""
+        offsets = self._row_offsets
+        if row <= len(offsets):
+            return offsets[row - 1]
+        return self._offset(offsets, row, self._row_extent)
+    
+    def range_extent(self, min_row: int, min_col: int, max_row: int, max_col: int) -> Tuple[float, float]:
+        """Get the (width, height) of a cell range"""
+        return (self.column_x(max_col + 1) - self.column_x(min_col),
+                self.row_y(max_row + 1) - self.row_y(min_row))
     
     def get_cell_position(self, row: int, col: int) -> Tuple[float, float]:
         """Get cell position (x, y)"""
-        x = 0.0
-        for c in range(1, col):
-            x += self.calculate_column_width(c)
-        
-        y = 0.0
-        for r in range(1, row):
-            y += self.calculate_row_height(r)
-        
-        return (x, y)
+        return (self.column_x(col), self.row_y(row))
     
     def get_cell_rect(self, row: int, col: int):
         """Get cell rectangle"""
-        x, y = self.get_cell_position(row, col)
-        width = self.calculate_column_width(col)
-        height = self.calculate_row_height(row)
+        x = self.column_x(col)
+        y = self.row_y(row)
+        width = self.column_x(col + 1) - x
+        height = self.row_y(row + 1) - y
         
         from ..graphics.canvas import Rectangle
         return Rectangle(x, y, width, height)
     
+    @staticmethod
+    def _index_at(offsets: List[float], position: float, extent: Callable[[int], float],
+                  limit: int, end: bool = False) -> int:
+        """Find the row/column spanning a position by bisecting the offsets
+        
+        The table is extended until it passes ``position`` or reaches
+        ``limit``. With ``end`` the position is an exclusive far edge, so
+        a row ending exactly there is the last one returned.
+        """
+        if offsets[-1] <= position and len(offsets) <= limit:
+            total = offsets[-1]
+            for i in range(len(offsets), limit + 1):
+                total += extent(i)
+                offsets.append(total)
+                if total > position:
+                    break
+        
+        index = bisect_left(offsets, position) if end else bisect_right(offsets, position)
+        return min(max(index, 1), limit)
+    
+    def column_at(self, x: float) -> int:
+        """Get the column under an x offset"""
+        return self._index_at(self._column_offsets, x, self._column_extent, MAX_COLUMN)
+    
+    def row_at(self, y: float) -> int:
+        """Get the row under a y offset"""
+        return self._index_at(self._row_offsets, y, self._row_extent, MAX_ROW)
+    
+    def cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Get the (row, col) under a point, or None outside the sheet
+        
+        A point over a merged range resolves to the range's top-left cell.
+        Points past the last row or column are outside the sheet.
+        """
+        if x < 0 or y < 0:
+            return None
+        row = self.row_at(y)
+        col = self.column_at(x)
+        if y >= self.row_y(row + 1) or x >= self.column_x(col + 1):
+            return None
+        merged_range = self.worksheet.merged_range_at(row, col)
+        if merged_range is not None:
+            return (merged_range.min_row, merged_range.min_col)
+        return (row, col)
+    
+    def visible_range(self, x: float, y: float, width: float, height: float) -> Range:
+        """Get the rows and columns intersecting a viewport"""
+        x = max(x, 0.0)
+        y = max(y, 0.0)
+        min_row = self.row_at(y)
+        min_col = self.column_at(x)
+        max_row = self._index_at(self._row_offsets, y + height, self._row_extent, MAX_ROW, end=True)
+        max_col = self._index_at(self._column_offsets, x + width, self._column_extent, MAX_COLUMN, end=True)
+        return Range(min_row=min_row, max_row=max(max_row, min_row),
+                     min_col=min_col, max_col=max(max_col, min_col), worksheet=self.worksheet)
+    
+    def set_row_height(self, row: int, height: float):
+        """Set a row's height and shift the offsets of the rows below it"""
+        self._row_heights[row] = height
+        self._shift(self._row_offsets, row, self._row_extent)
+    
+    def set_column_width(self, col: int, width: float):
+        """Set a column's width and shift the offsets of the columns after it"""
+        self._column_widths[col] = width
+        self._shift(self._column_offsets, col, self._column_extent)
+    
+    @staticmethod
+    def _shift(offsets: List[float], index: int, extent: Callable[[int], float]):
+        """Patch the offsets after ``index`` for a changed extent"""
+        if index >= len(offsets):
+            return
+        delta = extent(index) - (offsets[index] - offsets[index - 1])
+        if delta:
+            for i in range(index, len(offsets)):
+                offsets[i] += delta
+    
     def clear_cache(self):
         """Clear calculation cache"""
         self._cell_sizes.clear()
         self._column_widths.clear()
-        self._row_heights.clear()
\ No newline at end of file
+        self._row_heights.clear()
+        self._merged_sizes.clear()
+        del self._column_offsets[1:]
+        del self._row_offsets[1:]
@@ -20,12 +20,12 @@ class Measurer:
         if not cell.value or cell.data_type == "blank":
             return (0.0, 0.0)
         
-        font = cell.style.font
+        font = cell.resolved_style.font
         text = str(cell.value)
         
         text_width, text_height = self.font_manager.measure_text(font, text)
         
-        if cell.style.alignment.wrap_text:
+        if cell.resolved_style.alignment.wrap_text:
             max_width = self._get_max_cell_width(cell)
             lines = self._wrap_text(text, max_width, font)
             text_width = max_width
@@ -37,7 +37,7 @@ class Measurer:
         """Measure cell dimensions including padding"""
         content_width, content_height = self.measure_content(cell)
         
-        indent = cell.style.alignment.indent
+        indent = cell.resolved_style.alignment.indent
         padding = indent * self.indent_width
         
         width = content_width + padding * 2
@@ -49,6 +49,7 @@ class Paginator:
         printable_width = self._get_printable_width()
         printable_height = self._get_printable_height()
         
+        self.calculator.calculate_dimensions()
         self.calculator.calculate_merged_cells()
         
         total_rows = self.worksheet.max_row
@@ -72,6 +73,8 @@ class Paginator:
                     row_end=row_end,
                     col_start=col_start,
                     col_end=col_end,
+                    x_offset=self.calculator.column_x(col_start),
+                    y_offset=self.calculator.row_y(row_start),
                     width=self._get_page_width(col_start, col_end),
                     height=self._get_page_height(row_start, row_end),
                 )
@@ -132,17 +135,11 @@ class Paginator:
     
     def _get_page_width(self, start_col: int, end_col: int) -> float:
         """Get page width"""
-        width = 0.0
-        for col in range(start_col, end_col + 1):
-            width += self.calculator.calculate_column_width(col)
-        return width
+        return self.calculator.column_x(end_col + 1) - self.calculator.column_x(start_col)
     
     def _get_page_height(self, start_row: int, end_row: int) -> float:
         """Get page height"""
-        height = 0.0
-        for row in range(start_row, end_row + 1):
-            height += self.calculator.calculate_row_height(row)
-        return height
+        return self.calculator.row_y(end_row + 1) - self.calculator.row_y(start_row)
     
     def get_page_for_cell(self, row: int, col: int, pages: List[Page]) -> Page:
         """Get page containing cell"""
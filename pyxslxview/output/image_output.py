@@ -2,6 +2,7 @@
 Image output
 """
 
+from typing import Optional
 from ..core.worksheet import Worksheet
 from ..graphics.canvas import Rectangle, Canvas
 from ..renderer.cell_renderer import CellRenderer
@@ -33,15 +34,19 @@ class ImageOutput:
         return canvas.save(filepath, format)
     
     def render_page(self, worksheet: Worksheet, page, filepath: str,
-                    format: str = "PNG") -> bool:
-        """Render single page to image file"""
+                    format: str = "PNG", calculator: Optional[LayoutCalculator] = None) -> bool:
+        """Render single page to image file
+        
+        When rendering many pages, pass one calculator (e.g. the paginator's)
+        so cell sizes are not measured again for every page.
+        """
         canvas_width = int(page.width * self.scale)
         canvas_height = int(page.height * self.scale)
         
         canvas = Canvas(canvas_width, canvas_height)
         canvas.create()
         
-        self._render_page(worksheet, page, canvas)
+        self._render_page(worksheet, page, canvas, calculator)
         
         return canvas.save(filepath, format)
     
@@ -71,40 +76,36 @@ class ImageOutput:
             
             cell_renderer.render(context)
     
-    def _render_page(self, worksheet: Worksheet, page, canvas: Canvas):
+    def _render_page(self, worksheet: Worksheet, page, canvas: Canvas,
+                     calculator: Optional[LayoutCalculator] = None):
         """Render single page"""
         cell_renderer = CellRenderer(canvas)
+        if calculator is None:
+            calculator = LayoutCalculator(worksheet)
         
-        for row in range(page.row_start, page.row_end + 1):
-            for col in range(page.col_start, page.col_end + 1):
-                if (row, col) not in worksheet.cells:
-                    continue
-                
-                cell = worksheet.cells[(row, col)]
-                
-                if cell.is_merged() and not cell.is_merged_parent():
-                    continue
-                
-                from ..layout.calculator import LayoutCalculator
-                calculator = LayoutCalculator(worksheet)
-                rect = calculator.get_cell_rect(row, col)
-                
-                scaled_rect = Rectangle(
-                    (rect.x - page.x_offset) * self.scale,
-                    (rect.y - page.y_offset) * self.scale,
-                    rect.width * self.scale,
-                    rect.height * self.scale
-                )
-                
-                context = RenderContext(
-                    cell=cell,
-                    rect=scaled_rect,
-                    scale=self.scale,
-                    worksheet=worksheet,
-                    page_number=page.page_number
-                )
-                
-                cell_renderer.render(context)
+        for cell in worksheet.iter_cells(page.row_start, page.row_end,
+                                         page.col_start, page.col_end):
+            if cell.is_merged() and not cell.is_merged_parent():
+                continue
+            
+            rect = calculator.get_cell_rect(cell.row, cell.col)
+            
+            scaled_rect = Rectangle(
+                (rect.x - page.x_offset) * self.scale,
+                (rect.y - page.y_offset) * self.scale,
+                rect.width * self.scale,
+                rect.height * self.scale
+            )
+            
+            context = RenderContext(
+                cell=cell,
+                rect=scaled_rect,
+                scale=self.scale,
+                worksheet=worksheet,
+                page_number=page.page_number
+            )
+            
+            cell_renderer.render(context)
     
     def get_image(self, worksheet: Worksheet):
         """Get image object"""
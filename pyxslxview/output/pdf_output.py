@@ -2,6 +2,7 @@
 PDF output
 """
 
+from typing import Optional
 from ..core.worksheet import Worksheet
 from ..layout.calculator import LayoutCalculator
 from ..layout.paginator import Paginator
@@ -25,7 +26,7 @@ class PDFOutput:
             c = pdf_canvas.Canvas(filepath, pagesize=A4)
             
             for page in pages:
-                self._render_page(worksheet, page, c)
+                self._render_page(worksheet, page, c, paginator.calculator)
                 c.showPage()
             
             c.save()
@@ -34,32 +35,33 @@ class PDFOutput:
         except Exception:
             return False
     
-    def _render_page(self, worksheet: Worksheet, page, pdf_canvas):
-        """Render single page to PDF"""
+    def _render_page(self, worksheet: Worksheet, page, pdf_canvas,
+                     calculator: Optional[LayoutCalculator] = None):
+        """Render single page to PDF
+        
+        Pass the paginator's calculator so cell sizes are measured once per
+        export rather than once per page.
+        """
         margin = 36
         pdf_canvas._pagesize[0] - 2 * margin
         pdf_canvas._pagesize[1] - 2 * margin
         
-        calculator = LayoutCalculator(worksheet)
+        if calculator is None:
+            calculator = LayoutCalculator(worksheet)
         
-        for row in range(page.row_start, page.row_end + 1):
-            for col in range(page.col_start, page.col_end + 1):
-                if (row, col) not in worksheet.cells:
-                    continue
-                
-                cell = worksheet.cells[(row, col)]
-                
-                if cell.is_merged() and not cell.is_merged_parent():
-                    continue
-                
-                rect = calculator.get_cell_rect(row, col)
-                
-                x = margin + (rect.x - page.x_offset) * self.scale
-                y = pdf_canvas._pagesize[1] - margin - (rect.y - page.y_offset + rect.height) * self.scale
-                width = rect.width * self.scale
-                height = rect.height * self.scale
-                
-                self._draw_cell_to_pdf(cell, x, y, width, height, pdf_canvas)
+        for cell in worksheet.iter_cells(page.row_start, page.row_end,
+                                         page.col_start, page.col_end):
+            if cell.is_merged() and not cell.is_merged_parent():
+                continue
+            
+            rect = calculator.get_cell_rect(cell.row, cell.col)
+            
+            x = margin + (rect.x - page.x_offset) * self.scale
+            y = pdf_canvas._pagesize[1] - margin - (rect.y - page.y_offset + rect.height) * self.scale
+            width = rect.width * self.scale
+            height = rect.height * self.scale
+            
+            self._draw_cell_to_pdf(cell, x, y, width, height, pdf_canvas)
     
     def _draw_cell_to_pdf(self, cell, x: float, y: float, 
                           width: float, height: float, pdf_canvas):
@@ -71,7 +73,7 @@ class PDFOutput:
     def _draw_cell_background(self, cell, x: float, y: float,
                               width: float, height: float, pdf_canvas):
         """Draw cell background"""
-        fill = cell.style.fill
+        fill = cell.resolved_style.fill
         
         if fill and fill.fill_type == "solid":
             pdf_canvas.setFillColorRGB(
@@ -84,7 +86,7 @@ class PDFOutput:
     def _draw_cell_border(self, cell, x: float, y: float,
                            width: float, height: float, pdf_canvas):
         """Draw cell border"""
-        border = cell.style.border
+        border = cell.resolved_style.border
         
         if not border or not border.has_any_border():
             return
@@ -117,8 +119,8 @@ class PDFOutput:
         if not cell.value or cell.data_type == "blank":
             return
         
-        font = cell.style.font
-        alignment = cell.style.alignment
+        font = cell.resolved_style.font
+        alignment = cell.resolved_style.alignment
         
         pdf_canvas.setFont(font.name, font.size)
         pdf_canvas.setFillColorRGB(
@@ -4,6 +4,7 @@ Print output
 
 from typing import Optional, List
 from ..core.worksheet import Worksheet
+from ..layout.calculator import LayoutCalculator
 from ..layout.paginator import Paginator, Page
 from .image_output import ImageOutput
 
@@ -23,13 +24,14 @@ class PrintOutput:
         page_images = []
         
         for page in pages:
-            image_data = self._render_page(worksheet, page)
+            image_data = self._render_page(worksheet, page, paginator.calculator)
             if image_data:
                 page_images.append(image_data)
         
         return page_images
     
-    def _render_page(self, worksheet: Worksheet, page: Page) -> Optional[bytes]:
+    def _render_page(self, worksheet: Worksheet, page: Page,
+                     calculator: Optional[LayoutCalculator] = None) -> Optional[bytes]:
         """Render single page to image bytes"""
         try:
             from io import BytesIO
@@ -37,7 +39,7 @@ class PrintOutput:
             image_output = ImageOutput(scale=self.scale, dpi=self.dpi)
             
             temp_file = BytesIO()
-            success = image_output.render_page(worksheet, page, temp_file, "PNG")
+            success = image_output.render_page(worksheet, page, temp_file, "PNG", calculator)
             
             if success:
                 temp_file.seek(0)
@@ -3,13 +3,17 @@ Parser module
 """
 
 from .xlsx_parser import XLSXParser
-from .shared_strings import SharedStringsParser
+from .shared_strings import SharedStringsParser, SharedStringTable, LazySharedStringTable
 from .styles import StylesParser
+from .snapshot import SnapshotCache
 from .formulas import FormulaParser
 
 __all__ = [
     "XLSXParser",
     "SharedStringsParser",
+    "SharedStringTable",
+    "LazySharedStringTable",
     "StylesParser",
+    "SnapshotCache",
     "FormulaParser",
 ]
\ No newline at end of file
@@ -2,44 +2,206 @@
 Shared strings parser
 """
 
+import re
 import zipfile
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from array import array
+from typing import Dict, Iterator, Optional
+
+from ..utils.cache import LRUCache
+from . import xml_backend as xml
+from .xml_backend import TAG_SI, TAG_T
+
+_SST_TAG = re.compile(rb"<(?:[\w.-]+:)?sst\b[^>]*>")
+_SI_TAG = re.compile(rb"<((?:[\w.-]+:)?)si\b[^>]*?(/?)>")
+_XMLNS_ATTR = re.compile(rb"""\sxmlns(?::[\w.-]+)?\s*=\s*(?:"[^"]*"|'[^']*')""")
+
+
+class SharedStringTable:
+    """Shared strings stored as one UTF-8 blob plus an offset array
+    
+    Strings are decoded on access. A per-table LRU of ``cache_size``
+    entries hands out the same str for repeated lookups of recently used
+    indexes and is freed with the table.
+    """
+    
+    def __init__(self, cache_size: int = 256):
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+        self._cache = LRUCache(cache_size)
+    
+    @classmethod
+    def from_buffers(cls, data, offsets, cache_size: int = 256) -> "SharedStringTable":
+        """Create a read-only table over existing blob and offset buffers
+        
+        The buffers are referenced, not copied: a memoryview over an mmap keeps
+        the mapping (and its file) open for as long as the table is alive.
+        """
+        table = cls(cache_size)
+        table._data = data
+        table._offsets = offsets
+        return table
+    
+    @property
+    def buffers(self) -> tuple:
+        """Get the (blob, offsets) buffers backing the table"""
+        return self._data, self._offsets
+    
+    def append(self, text: str):
+        """Append a string to the table"""
+        self._data += text.encode("utf-8")
+        self._offsets.append(len(self._data))
+    
+    def get_string(self, index: int) -> Optional[str]:
+        """Get shared string by index"""
+        if not 0 <= index < len(self):
+            return None
+        
+        text = self._cache.get(index)
+        if text is None:
+            text = str(self._data[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+            self._cache.set(index, text)
+        return text
+    
+    @property
+    def nbytes(self) -> int:
+        """Get size of the string blob and offsets in bytes"""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+    
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        text = self.get_string(index)
+        if text is None:
+            raise IndexError("shared string index out of range")
+        return text
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.get_string(index)
+
+
+class LazySharedStringTable:
+    """Shared strings indexed by the byte span of each <si>
+    
+    The part is scanned once for <si> boundaries; a string is only parsed
+    the first time it is requested.
+    """
+    
+    def __init__(self, xml: bytes = b""):
+        self._xml = xml
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._decoded: Dict[int, str] = {}
+        self._wrapper = b"<sst>"
+        
+        if xml:
+            self._index()
+    
+    def _index(self):
+        """Record the byte span of every <si> in a single pass"""
+        xml = self._xml
+        
+        root = _SST_TAG.search(xml)
+        if root is not None:
+            self._wrapper = b"<sst" + b"".join(_XMLNS_ATTR.findall(root.group(0))) + b">"
+        
+        pos = root.end() if root is not None else 0
+        while True:
+            match = _SI_TAG.search(xml, pos)
+            if match is None:
+                break
+            
+            if match.group(2):
+                end = match.end()
+            else:
+                close = b"</" + match.group(1) + b"si>"
+                end = xml.find(close, match.end())
+                if end < 0:
+                    break
+                end += len(close)
+            
+            self._starts.append(match.start())
+            self._ends.append(end)
+            pos = end
+    
+    def get_string(self, index: int) -> Optional[str]:
+        """Get shared string by index, decoding it on first use"""
+        if not 0 <= index < len(self):
+            return None
+        
+        text = self._decoded.get(index)
+        if text is None:
+            fragment = self._xml[self._starts[index]:self._ends[index]]
+            si = xml.fromstring(self._wrapper + fragment + b"</sst>")
+            text = "".join(t.text for t in si.iter(TAG_T) if t.text)
+            self._decoded[index] = text
+        return text
+    
+    @property
+    def decoded_count(self) -> int:
+        """Get number of strings decoded so far"""
+        return len(self._decoded)
+    
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        text = self.get_string(index)
+        if text is None:
+            raise IndexError("shared string index out of range")
+        return text
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.get_string(index)
 
 
 class SharedStringsParser:
     """Parser for shared strings table"""
     
-    def __init__(self):
-        self.strings: List[str] = []
+    def __init__(self, cache_size: int = 256, lazy: bool = False):
+        self.lazy = lazy
+        self.cache_size = cache_size
+        self.strings = LazySharedStringTable() if lazy else SharedStringTable(cache_size)
+        self.namespace = {
+            'ns': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+        }
     
-    def parse(self, zf: zipfile.ZipFile) -> List[str]:
-        """Parse shared strings from XLSX file"""
+    def parse(self, zf: zipfile.ZipFile):
+        """Parse shared strings from XLSX file, one <si> at a time
+        
+        Each call starts a new table. In lazy mode only the <si> offsets
+        are indexed.
+        """
+        if self.lazy:
+            try:
+                self.strings = LazySharedStringTable(zf.read("xl/sharedStrings.xml"))
+            except KeyError:
+                self.strings = LazySharedStringTable()
+            return self.strings
+        
+        self.strings = SharedStringTable(self.cache_size)
         try:
             with zf.open("xl/sharedStrings.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-                
-                namespace = {
-                    'ns': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
-                }
+                root = None
                 
-                for si in root.findall(".//ns:si", namespace):
-                    text_parts = []
-                    
-                    for t in si.findall(".//ns:t", namespace):
-                        if t.text:
-                            text_parts.append(t.text)
-                    
-                    self.strings.append("".join(text_parts))
+                for event, elem in xml.iterparse(f, events=("start", "end")):
+                    if root is None:
+                        root = elem
+                    elif event == "end" and elem.tag == TAG_SI:
+                        self.strings.append("".join(t.text for t in elem.iter(TAG_T) if t.text))
+                        root.clear()
                 
                 return self.strings
                 
         except KeyError:
-            return []
+            return self.strings
     
     def get_string(self, index: int) -> Optional[str]:
         """Get shared string by index"""
-        if 0 <= index < len(self.strings):
-            return self.strings[index]
-        return None
\ No newline at end of file
+        return self.strings.get_string(index)
@@ -0,0 +1,353 @@
+"""
+Binary snapshot cache of parsed documents
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from array import array
+from functools import partial
+from typing import Callable, Optional
+
+from ..core.document import Document
+from ..core.workbook import Workbook
+from ..core.worksheet import LazyWorksheet, Worksheet
+from ..core.range import MergedCellList, Range
+from .shared_strings import SharedStringTable
+
+
+MAGIC = b"PXVSNAP4"
+HEADER = struct.Struct("<8sQ")
+
+VALUE_NONE = 0
+VALUE_STR = 1
+VALUE_OTHER = 2
+VALUE_INT = 3
+VALUE_FLOAT = 4
+VALUE_TRUE = 5
+VALUE_FALSE = 6
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+SHEET_ATTRIBUTES = ("rows", "columns", "page_setup", "page_margins", "hidden",
+                    "selected", "tab_color", "dimension", "sheet_id", "r_id", "target")
+SHEET_SECTIONS = ("rows", "cols", "kinds", "type_codes", "ints", "floats", "style_ids",
+                  "text", "text_offsets")
+
+
+class SnapshotCache:
+    """Directory of binary document snapshots
+    
+    A snapshot is keyed by file path and window and records the size, mtime
+    and content hash of the workbook it was taken from. A load with the same
+    size and mtime is a hit without reading the workbook; the content is only
+    hashed when the mtime differs or ``verify`` is set. At most
+    ``max_snapshots`` files are kept, dropping the least recently used.
+    
+    The layout is a pickled header followed by 8-byte aligned arrays (cell
+    coordinates, value kinds, style indexes, UTF-8 text blobs and offsets).
+    Sections are copied out of the mapping, so no snapshot file stays open
+    after a load, and cells are created on first access to each worksheet.
+    
+    The header is unpickled on load, so ``cache_dir`` must be a trusted
+    location: a crafted snapshot file can run arbitrary code.
+    """
+    
+    def __init__(self, cache_dir: str, max_snapshots: int = 64, verify: bool = False):
+        self.cache_dir = cache_dir
+        self.max_snapshots = max_snapshots
+        self.verify = verify
+    
+    def key(self, filepath: str, window: Optional[Range] = None) -> str:
+        """Get the snapshot key of a workbook file"""
+        key = hashlib.sha1()
+        key.update(os.path.abspath(filepath).encode("utf-8"))
+        if window is not None:
+            key.update(f"|{window.min_row},{window.max_row},{window.min_col},{window.max_col}".encode("ascii"))
+        return key.hexdigest()
+    
+    def path(self, key: str) -> str:
+        """Get the snapshot file path for a key"""
+        return os.path.join(self.cache_dir, f"{key}.pxsnap")
+    
+    def load(self, filepath: str, window: Optional[Range] = None,
+             storage: str = "dict", key: Optional[str] = None) -> Optional[Document]:
+        """Load the snapshot of a workbook, or None on a cache miss"""
+        path = self.path(key or self.key(filepath, window))
+        if not os.path.exists(path):
+            return None
+        
+        stat = os.stat(filepath)
+        
+        def is_current(source: Optional[dict]) -> bool:
+            if not source or source["size"] != stat.st_size:
+                return False
+            if source["mtime_ns"] == stat.st_mtime_ns and not self.verify:
+                return True
+            return source["sha1"] == _file_digest(filepath)
+        
+        doc = read_snapshot(path, storage, is_current)
+        if doc is not None:
+            doc.filepath = filepath
+            os.utime(path)
+        return doc
+    
+    def store(self, doc: Document, window: Optional[Range] = None,
+              key: Optional[str] = None) -> str:
+        """Write a snapshot of a parsed document and return its path"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key or self.key(doc.filepath, window))
+        stat = os.stat(doc.filepath)
+        source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                  "sha1": _file_digest(doc.filepath)}
+        write_snapshot(doc, path, source)
+        self.prune()
+        return path
+    
+    def prune(self):
+        """Remove the least recently used snapshots beyond ``max_snapshots``"""
+        snapshots = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pxsnap"):
+                try:
+                    snapshots.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    pass
+        
+        snapshots.sort(reverse=True)
+        for _, path in snapshots[self.max_snapshots:]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+def write_snapshot(doc: Document, path: str, source: Optional[dict] = None):
+    """Write a document snapshot, replacing ``path`` atomically
+    
+    ``source`` describes the workbook file (size, mtime_ns and sha1) and is
+    checked by ``read_snapshot`` before any cells are restored.
+    """
+    sections = []
+    
+    def add(data) -> tuple:
+        """Queue a data section, returning its (offset, length, typecode)"""
+        offset = sum(_padded(len(section)) for section in sections)
+        raw = data.tobytes() if isinstance(data, array) else bytes(data)
+        sections.append(raw)
+        typecode = data.typecode if isinstance(data, array) else "B"
+        return offset, len(raw), typecode
+    
+    strings = SharedStringTable()
+    for text in (doc.shared_strings or []):
+        strings.append(text)
+    
+    sheets = []
+    data_types = {}
+    
+    for ws in doc.worksheets:
+        rows, cols = array("I"), array("I")
+        kinds, type_codes, style_ids = array("B"), array("B"), array("I")
+        ints, floats = array("q"), array("d")
+        text, text_offsets = bytearray(), array("Q", [0])
+        others = {}
+        own_styles = {}
+        
+        for index, ((row, col), cell) in enumerate(ws.cells.items()):
+            rows.append(row)
+            cols.append(col)
+            
+            value = cell.value
+            if value is None:
+                kinds.append(VALUE_NONE)
+            elif isinstance(value, str):
+                kinds.append(VALUE_STR)
+                text += value.encode("utf-8")
+            elif isinstance(value, bool):
+                kinds.append(VALUE_TRUE if value else VALUE_FALSE)
+            elif isinstance(value, int) and INT64_MIN <= value <= INT64_MAX:
+                kinds.append(VALUE_INT)
+                ints.append(value)
+            elif isinstance(value, float):
+                kinds.append(VALUE_FLOAT)
+                floats.append(value)
+            else:
+                kinds.append(VALUE_OTHER)
+                others[index] = value
+            text_offsets.append(len(text))
+            type_codes.append(data_types.setdefault(cell.data_type, len(data_types)))
+            
+            style_ids.append(cell.style_id)
+            if cell._style is not None:
+                own_styles[index] = cell._style
+        
+        sheets.append({
+            "name": ws.name,
+            "attributes": {name: getattr(ws, name, None) for name in SHEET_ATTRIBUTES},
+            "merged_cells": [(r.min_row, r.max_row, r.min_col, r.max_col) for r in ws.merged_cells],
+            "others": others,
+            "own_styles": own_styles,
+            "rows": add(rows),
+            "cols": add(cols),
+            "kinds": add(kinds),
+            "type_codes": add(type_codes),
+            "ints": add(ints),
+            "floats": add(floats),
+            "style_ids": add(style_ids),
+            "text": add(text),
+            "text_offsets": add(text_offsets),
+        })
+    
+    meta = pickle.dumps({
+        "workbook": {
+            "active_sheet_index": doc.workbook.active_sheet_index,
+            "calculation_mode": doc.workbook.calculation_mode,
+            "style_table": doc.workbook.style_table,
+        } if doc.workbook else None,
+        "styles": doc.styles,
+        "theme": doc.theme,
+        "part_crcs": doc.part_crcs,
+        "sheets": sheets,
+        "data_types": list(data_types),
+        "shared_strings": tuple(add(buffer) for buffer in strings.buffers),
+        "source": source,
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(meta)))
+            f.write(meta)
+            f.write(b"\0" * (_padded(f.tell()) - f.tell()))
+            for section in sections:
+                f.write(section)
+                f.write(b"\0" * (_padded(len(section)) - len(section)))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path: str, storage: str = "dict",
+                  is_current: Optional[Callable[[Optional[dict]], bool]] = None) -> Optional[Document]:
+    """Read a document snapshot, or None if it is not a valid snapshot
+    
+    ``is_current`` is called with the recorded source of the snapshot and
+    rejects it by returning False. The snapshot header is unpickled, so only
+    read files from a trusted location.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+    
+    try:
+        with mm:
+            return _read_sections(mm, storage, is_current)
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError,
+            KeyError, IndexError, AttributeError):
+        return None
+
+
+def _read_sections(mm: mmap.mmap, storage: str,
+                   is_current: Optional[Callable[[Optional[dict]], bool]]) -> Optional[Document]:
+    """Rebuild a document from a mapped snapshot, copying every section out"""
+    if len(mm) < HEADER.size:
+        return None
+    magic, meta_len = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        return None
+    
+    meta = pickle.loads(mm[HEADER.size:HEADER.size + meta_len])
+    if is_current is not None and not is_current(meta["source"]):
+        return None
+    base = _padded(HEADER.size + meta_len)
+    
+    def section(ref: tuple):
+        offset, length, typecode = ref
+        if base + offset + length > len(mm):
+            raise ValueError("truncated snapshot section")
+        data = mm[base + offset:base + offset + length]
+        if typecode == "B":
+            return data
+        values = array(typecode)
+        values.frombytes(data)
+        return values
+    
+    doc = Document()
+    sst_data, sst_offsets = meta["shared_strings"]
+    doc.shared_strings = SharedStringTable.from_buffers(section(sst_data), section(sst_offsets))
+    doc.styles = meta["styles"]
+    doc.theme = meta["theme"]
+    doc.part_crcs = meta["part_crcs"]
+    
+    workbook_meta = meta["workbook"]
+    if workbook_meta is None:
+        return doc
+    
+    doc.workbook = Workbook(**workbook_meta)
+    data_types = meta["data_types"]
+    
+    for sheet in meta["sheets"]:
+        ws = LazyWorksheet(name=sheet["name"], workbook=doc.workbook, storage=storage)
+        for name, value in sheet["attributes"].items():
+            setattr(ws, name, value)
+        ws.merged_cells = MergedCellList(
+            Range(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col,
+                  worksheet=ws)
+            for min_row, max_row, min_col, max_col in sheet["merged_cells"]
+        )
+        columns = {name: section(sheet[name]) for name in SHEET_SECTIONS}
+        ws.loader = partial(_restore_cells, columns, sheet["others"], sheet["own_styles"],
+                            data_types)
+        doc.workbook.worksheets.append(ws)
+    
+    return doc
+
+
+def _restore_cells(columns: dict, others: dict, own_styles: dict, data_types: list,
+                   ws: Worksheet):
+    """Create the cells of a restored worksheet from its snapshot sections"""
+    text = columns["text"]
+    text_offsets = columns["text_offsets"]
+    ints = iter(columns["ints"])
+    floats = iter(columns["floats"])
+    cell_at = ws.cell
+    
+    for index, (row, col, kind, type_code, style_id) in enumerate(zip(
+            columns["rows"], columns["cols"], columns["kinds"],
+            columns["type_codes"], columns["style_ids"])):
+        cell = cell_at(row, col)
+        if kind == VALUE_STR:
+            cell.value = str(text[text_offsets[index]:text_offsets[index + 1]], "utf-8")
+        elif kind == VALUE_INT:
+            cell.value = next(ints)
+        elif kind == VALUE_FLOAT:
+            cell.value = next(floats)
+        elif kind == VALUE_TRUE or kind == VALUE_FALSE:
+            cell.value = kind == VALUE_TRUE
+        elif kind == VALUE_OTHER:
+            cell.value = others[index]
+        cell.data_type = data_types[type_code]
+        if style_id:
+            cell.style_id = style_id
+        if index in own_styles:
+            cell.style = own_styles[index]
+
+
+def _file_digest(filepath: str) -> str:
+    """Get the SHA-1 of a file's content"""
+    digest = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _padded(size: int) -> int:
+    """Round a byte size up to a multiple of 8"""
+    return (size + 7) & ~7
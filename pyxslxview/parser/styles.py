@@ -3,14 +3,64 @@ Styles parser
 """
 
 import zipfile
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from ..core.font import Font
+from ..core.alignment import Alignment
 from ..core.border import Border, SideBorder
 from ..core.fill import Fill, GradientFill, GradientStop
 from ..core.color import Color
+from ..core.styles import CellStyle
+from . import xml_backend as xml
+from .xml_backend import (
+    qname, TAG_NUM_FMTS, TAG_NUM_FMT, TAG_FONTS, TAG_FONT, TAG_FILLS, TAG_FILL,
+    TAG_PATTERN_FILL, TAG_FG_COLOR, TAG_BG_COLOR, TAG_BORDERS, TAG_BORDER, TAG_CELL_XFS,
+    TAG_XF, TAG_ALIGNMENT, TAG_PROTECTION, TAG_B, TAG_I, TAG_SZ, TAG_COLOR, TAG_NAME,
+)
+
+
+BUILTIN_NUMBER_FORMATS = {
+    0: "General",
+    1: "0",
+    2: "0.00",
+    3: "#,##0",
+    4: "#,##0.00",
+    9: "0%",
+    10: "0.00%",
+    11: "0.00E+00",
+    12: "# ?/?",
+    13: "# ??/??",
+    14: "mm-dd-yy",
+    15: "d-mmm-yy",
+    16: "d-mmm",
+    17: "mmm-yy",
+    18: "h:mm AM/PM",
+    19: "h:mm:ss AM/PM",
+    20: "h:mm",
+    21: "h:mm:ss",
+    22: "m/d/yy h:mm",
+    37: "#,##0 ;(#,##0)",
+    38: "#,##0 ;[Red](#,##0)",
+    39: "#,##0.00;(#,##0.00)",
+    40: "#,##0.00;[Red](#,##0.00)",
+    45: "mm:ss",
+    46: "[h]:mm:ss",
+    47: "mmss.0",
+    48: "##0.0E+0",
+    49: "@",
+}
+
+BORDER_SIDES = {qname(side): side for side in ("left", "right", "top", "bottom", "diagonal")}
+
+SECTIONS = (TAG_NUM_FMTS, TAG_FONTS, TAG_FILLS, TAG_BORDERS, TAG_CELL_XFS)
+
+
+def _is_true(value: Optional[str], default: bool = True) -> bool:
+    """Parse an xsd:boolean attribute"""
+    if value is None:
+        return default
+    return value in ("1", "true")
 
 
 @dataclass
@@ -22,6 +72,9 @@ class Styles:
     borders: List[Border] = None
     cell_styles: List[dict] = None
     cell_formats: List[dict] = None
+    number_formats: Dict[int, str] = None
+    style_table: List[CellStyle] = None
+    _defaults: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.fonts is None:
@@ -34,125 +87,205 @@ class Styles:
             self.cell_styles = []
         if self.cell_formats is None:
             self.cell_formats = []
+        if self.number_formats is None:
+            self.number_formats = {}
+        if self.style_table is None:
+            self.style_table = []
+    
+    def resolve_cell_styles(self) -> List[CellStyle]:
+        """Get the shared style table, one CellStyle per cellXfs entry"""
+        if not self.style_table:
+            self.style_table = [self.resolve_cell_format(fmt) for fmt in self.cell_formats]
+        return self.style_table or [CellStyle()]
+    
+    def resolve_cell_format(self, cell_format: dict) -> CellStyle:
+        """Resolve an xf entry into a CellStyle
+        
+        Entries missing from the xf share one set of default objects, so
+        table entries must be treated as read-only.
+        """
+        defaults = self._defaults
+        if defaults is None:
+            defaults = self._defaults = {
+                'font': Font(), 'fill': Fill(), 'border': Border(), 'alignment': Alignment(),
+            }
+        
+        get = cell_format.get
+        return CellStyle(
+            font=get('font') or defaults['font'],
+            alignment=get('alignment') or defaults['alignment'],
+            border=get('border') or defaults['border'],
+            fill=get('fill') or defaults['fill'],
+            number_format=get('number_format', "General"),
+            protection_locked=get('locked', True),
+            protection_hidden=get('hidden', False),
+            quote_prefix=get('quote_prefix', False),
+        )
 
 
 class StylesParser:
-    """Parser for styles"""
+    """Parser for styles
+    
+    styles.xml is walked once with iterparse. Fonts, fills, borders and
+    number formats precede cellXfs in the schema, so each xf is resolved to
+    a CellStyle as soon as it ends.
+    """
     
     def __init__(self):
         self.namespace = {
             'ns': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
         }
+        self._alignments: Dict[tuple, Alignment] = {}
     
     def parse(self, zf: zipfile.ZipFile) -> Styles:
         """Parse styles from XLSX file"""
         styles = Styles()
+        self._alignments = {}
         
         try:
             with zf.open("xl/styles.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-                
-                fonts_elem = root.find(".//ns:fonts", self.namespace)
-                if fonts_elem is not None:
-                    for font_elem in fonts_elem.findall(".//ns:font", self.namespace):
-                        font = Font()
-                        
-                        bold_elem = font_elem.find(".//ns:b", self.namespace)
-                        if bold_elem is not None:
-                            font.bold = bold_elem.get("val", "0") == "1"
-                        
-                        italic_elem = font_elem.find(".//ns:i", self.namespace)
-                        if italic_elem is not None:
-                            font.italic = italic_elem.get("val", "0") == "1"
-                        
-                        size_elem = font_elem.find(".//ns:sz", self.namespace)
-                        if size_elem is not None:
-                            font.size = float(size_elem.get("val", "11"))
-                        
-                        color_elem = font_elem.find(".//ns:color", self.namespace)
-                        if color_elem is not None:
-                            rgb = color_elem.get("rgb")
-                            if rgb:
-                                font.color = Color.from_hex(rgb)
-                        
-                        name_elem = font_elem.find(".//ns:name", self.namespace)
-                        if name_elem is not None:
-                            font.name = name_elem.get("val", "Calibri")
-                        
-                        styles.fonts.append(font)
-                
-                fills_elem = root.find(".//ns:fills", self.namespace)
-                if fills_elem is not None:
-                    for fill_elem in fills_elem.findall(".//ns:fill", self.namespace):
-                        fill = Fill()
-                        
-                        pattern_fill_elem = fill_elem.find(".//ns:patternFill", self.namespace)
-                        if pattern_fill_elem is not None:
-                            fill.fill_type = "pattern"
-                            fill.pattern_type = pattern_fill_elem.get("patternType", "none")
-                            
-                            fg_color_elem = pattern_fill_elem.find(".//ns:fgColor", self.namespace)
-                            if fg_color_elem is not None:
-                                rgb = fg_color_elem.get("rgb")
-                                if rgb:
-                                    fill.fg_color = Color.from_hex(rgb)
-                            
-                            bg_color_elem = pattern_fill_elem.find(".//ns:bgColor", self.namespace)
-                            if bg_color_elem is not None:
-                                rgb = bg_color_elem.get("rgb")
-                                if rgb:
-                                    fill.bg_color = Color.from_hex(rgb)
-                        
-                        styles.fills.append(fill)
-                
-                borders_elem = root.find(".//ns:borders", self.namespace)
-                if borders_elem is not None:
-                    for border_elem in borders_elem.findall(".//ns:border", self.namespace):
-                        border = Border()
-                        
-                        for side in ['left', 'right', 'top', 'bottom']:
-                            side_elem = border_elem.find(f".//ns:{side}", self.namespace)
-                            if side_elem is not None:
-                                side_border = SideBorder()
-                                side_border.style = side_elem.get("style", "none")
-                                
-                                color_elem = side_elem.find(".//ns:color", self.namespace)
-                                if color_elem is not None:
-                                    rgb = color_elem.get("rgb")
-                                    if rgb:
-                                        side_border.color = Color.from_hex(rgb)
-                                
-                                setattr(border, side, side_border)
-                        
-                        styles.borders.append(border)
-                
-                cell_xfs = root.find(".//ns:cellXfs", self.namespace)
-                if cell_xfs is not None:
-                    for xf in cell_xfs.findall(".//ns:xf", self.namespace):
-                        cell_format = {}
-                        
-                        font_id = xf.get("fontId")
-                        if font_id is not None:
-                            idx = int(font_id)
-                            if 0 <= idx < len(styles.fonts):
-                                cell_format['font'] = styles.fonts[idx]
-                        
-                        fill_id = xf.get("fillId")
-                        if fill_id is not None:
-                            idx = int(fill_id)
-                            if 0 <= idx < len(styles.fills):
-                                cell_format['fill'] = styles.fills[idx]
-                        
-                        border_id = xf.get("borderId")
-                        if border_id is not None:
-                            idx = int(border_id)
-                            if 0 <= idx < len(styles.borders):
-                                cell_format['border'] = styles.borders[idx]
-                        
-                        styles.cell_formats.append(cell_format)
-                
+                self._parse_events(xml.iterparse(f, events=("start", "end")), styles)
         except KeyError:
             pass
         
-        return styles
\ No newline at end of file
+        return styles
+    
+    def _parse_events(self, events, styles: Styles):
+        """Build the style arrays and resolved table from iterparse events"""
+        section = None
+        current = None
+        side = None
+        
+        for event, elem in events:
+            tag = elem.tag
+            
+            if event == "end":
+                if tag == section:
+                    section = None
+                elif section == TAG_FONTS and tag == TAG_FONT:
+                    styles.fonts.append(current)
+                elif section == TAG_FILLS and tag == TAG_FILL:
+                    styles.fills.append(current)
+                elif section == TAG_BORDERS:
+                    if tag == TAG_BORDER:
+                        styles.borders.append(current)
+                    elif tag in BORDER_SIDES:
+                        side = None
+                elif section == TAG_CELL_XFS and tag == TAG_XF:
+                    styles.cell_formats.append(current)
+                    styles.style_table.append(styles.resolve_cell_format(current))
+                else:
+                    continue
+                elem.clear()
+                continue
+            
+            if tag in SECTIONS:
+                section = tag
+                if tag == TAG_FONTS:
+                    styles.fonts = []
+                elif tag == TAG_FILLS:
+                    styles.fills = []
+                elif tag == TAG_BORDERS:
+                    styles.borders = []
+            elif section == TAG_NUM_FMTS:
+                if tag == TAG_NUM_FMT:
+                    styles.number_formats[int(elem.get("numFmtId", "0"))] = elem.get("formatCode", "General")
+            elif section == TAG_FONTS:
+                current = self._font_start(tag, elem, current)
+            elif section == TAG_FILLS:
+                current = self._fill_start(tag, elem, current)
+            elif section == TAG_BORDERS:
+                if tag == TAG_BORDER:
+                    current = Border()
+                elif tag in BORDER_SIDES:
+                    side = SideBorder(style=elem.get("style", "none"))
+                    setattr(current, BORDER_SIDES[tag], side)
+                elif tag == TAG_COLOR and side is not None:
+                    rgb = elem.get("rgb")
+                    if rgb:
+                        side.color = Color.from_hex(rgb)
+            elif section == TAG_CELL_XFS:
+                current = self._xf_start(tag, elem, current, styles)
+    
+    def _font_start(self, tag: str, elem, font: Optional[Font]) -> Font:
+        """Handle a start event inside <fonts>"""
+        if tag == TAG_FONT:
+            return Font()
+        
+        if tag == TAG_B:
+            font.bold = _is_true(elem.get("val"))
+        elif tag == TAG_I:
+            font.italic = _is_true(elem.get("val"))
+        elif tag == TAG_SZ:
+            font.size = float(elem.get("val", "11"))
+        elif tag == TAG_COLOR:
+            rgb = elem.get("rgb")
+            if rgb:
+                font.color = Color.from_hex(rgb)
+        elif tag == TAG_NAME:
+            font.name = elem.get("val", "Calibri")
+        return font
+    
+    def _fill_start(self, tag: str, elem, fill: Optional[Fill]) -> Fill:
+        """Handle a start event inside <fills>"""
+        if tag == TAG_FILL:
+            return Fill()
+        
+        if tag == TAG_PATTERN_FILL:
+            pattern_type = elem.get("patternType", "none")
+            fill.pattern_type = pattern_type
+            fill.fill_type = pattern_type if pattern_type in ("none", "solid") else "pattern"
+        elif tag in (TAG_FG_COLOR, TAG_BG_COLOR):
+            rgb = elem.get("rgb")
+            if rgb:
+                color = Color.from_hex(rgb)
+                if tag == TAG_FG_COLOR:
+                    fill.fg_color = color
+                else:
+                    fill.bg_color = color
+        return fill
+    
+    def _xf_start(self, tag: str, elem, cell_format: Optional[dict], styles: Styles) -> dict:
+        """Handle a start event inside <cellXfs>"""
+        if tag == TAG_XF:
+            cell_format = {}
+            get = elem.get
+            
+            font_id = get("fontId")
+            if font_id is not None and 0 <= int(font_id) < len(styles.fonts):
+                cell_format['font'] = styles.fonts[int(font_id)]
+            fill_id = get("fillId")
+            if fill_id is not None and 0 <= int(fill_id) < len(styles.fills):
+                cell_format['fill'] = styles.fills[int(fill_id)]
+            border_id = get("borderId")
+            if border_id is not None and 0 <= int(border_id) < len(styles.borders):
+                cell_format['border'] = styles.borders[int(border_id)]
+            
+            num_fmt_id = int(get("numFmtId", "0"))
+            number_format = styles.number_formats.get(num_fmt_id) or BUILTIN_NUMBER_FORMATS.get(num_fmt_id)
+            if number_format is not None:
+                cell_format['number_format'] = number_format
+            if _is_true(get("quotePrefix"), False):
+                cell_format['quote_prefix'] = True
+        elif tag == TAG_ALIGNMENT:
+            key = tuple(elem.items())
+            alignment = self._alignments.get(key)
+            if alignment is None:
+                alignment = self._alignments[key] = self._parse_alignment(elem)
+            cell_format['alignment'] = alignment
+        elif tag == TAG_PROTECTION:
+            cell_format['locked'] = _is_true(elem.get("locked"))
+            cell_format['hidden'] = _is_true(elem.get("hidden"), False)
+        return cell_format
+    
+    def _parse_alignment(self, elem) -> Alignment:
+        """Create an Alignment from an <alignment> element"""
+        return Alignment(
+            horizontal=elem.get("horizontal", "left"),
+            vertical=elem.get("vertical", "bottom"),
+            text_rotation=int(elem.get("textRotation", "0")),
+            wrap_text=_is_true(elem.get("wrapText"), False),
+            shrink_to_fit=_is_true(elem.get("shrinkToFit"), False),
+            indent=int(elem.get("indent", "0")),
+            justify_last_line=_is_true(elem.get("justifyLastLine"), False),
+        )
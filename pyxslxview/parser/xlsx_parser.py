@@ -3,24 +3,143 @@ XLSX file parser
 """
 
 import zipfile
-import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from ..core.document import Document
 from ..core.workbook import Workbook
-from ..core.worksheet import Worksheet
-from ..core.cell import Cell
-from ..core.styles import CellStyle
+from ..core.worksheet import Worksheet, LazyWorksheet
+from ..core.cell import Cell, CellRecord
+from ..core.range import Range
 from ..core.alignment import Alignment
+from ..utils.helpers import Helpers
+from ..utils.references import parse_references, split_range, split_reference
 from .shared_strings import SharedStringsParser
 from .styles import StylesParser
+from . import xml_backend as xml
+from .xml_backend import (
+    TAG_DIMENSION, TAG_SHEET_DATA, TAG_ROW, TAG_C, TAG_V, TAG_IS, TAG_T, TAG_SHEET,
+    TAG_RELATIONSHIP, ATTR_R_ID,
+)
+
+
+def _shared_string(index: int, doc: Document, strings=None) -> str:
+    """Look up a shared string by index, keeping the index text when out of range"""
+    if strings is None:
+        strings = doc.shared_strings
+    if index < len(strings):
+        return strings[index]
+    return str(index)
+
+
+def _decode_shared_string(text: str, doc: Optional[Document]):
+    """Decode t="s": an index into the shared strings table
+    
+    Without a document (a worker scan) the index itself is returned. Text
+    that is not an index, or has more digits than int() converts, is kept
+    as is.
+    """
+    if not text.isdecimal():
+        return text
+    try:
+        index = int(text)
+    except ValueError:
+        return text
+    if doc is None:
+        return index
+    return _shared_string(index, doc)
+
+
+def _decode_number(text: str, doc: Document):
+    """Decode t="n" (the default): int when integral, float otherwise
+    
+    Integers with more digits than int() converts are decoded as floats.
+    """
+    if text.isdecimal() or (text[:1] == "-" and text[1:].isdecimal()):
+        try:
+            return int(text)
+        except ValueError:
+            pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _decode_boolean(text: str, doc: Document):
+    """Decode t="b": '1' or '0'"""
+    return text == "1"
+
+
+def _decode_text(text: str, doc: Document):
+    """Decode t="str", "inlineStr", "e" and "d": the text itself"""
+    return text
+
+
+# Cell type attribute -> (value decoder, Cell.data_type)
+CELL_TYPES = {
+    "s": (_decode_shared_string, "string"),
+    "n": (_decode_number, "number"),
+    "b": (_decode_boolean, "boolean"),
+    "str": (_decode_text, "string"),
+    "inlineStr": (_decode_text, "string"),
+    "e": (_decode_text, "error"),
+    "d": (_decode_text, "date"),
+}
+TEXT_TYPE = (_decode_text, "string")
+
+# Value kinds of a SheetPayload cell
+PAYLOAD_EMPTY = 0
+PAYLOAD_INT = 1
+PAYLOAD_FLOAT = 2
+PAYLOAD_SHARED = 3
+PAYLOAD_TRUE = 4
+PAYLOAD_FALSE = 5
+PAYLOAD_OTHER = 6
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+class SheetPayload(NamedTuple):
+    """Decoded cells of a sheet part as typed columns, built in a worker process
+    
+    Rows are stored once with their cell count (``row_numbers`` and
+    ``row_lengths``); ``cols``, ``styles`` and ``kinds`` have one entry
+    per cell. ``kinds`` says where each cell's value is: integers and
+    shared string indices are read in order from ``ints``, floats from
+    ``floats``, and anything else from ``others`` as (value, data_type)
+    pairs.
+    """
+    
+    dimension: Optional[Range]
+    row_numbers: array
+    row_lengths: array
+    cols: array
+    styles: array
+    kinds: array
+    ints: array
+    floats: array
+    others: list
 
 
 class XLSXParser:
     """XLSX file parser"""
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, streaming: bool = True, lazy: bool = False,
+                 window: Union[str, Range, tuple, None] = None,
+                 lazy_strings: Optional[bool] = None, workers: int = 1,
+                 storage: str = "dict"):
         self.filepath = filepath
-        self.shared_strings_parser = SharedStringsParser()
+        self.streaming = streaming
+        self.lazy = lazy
+        self.workers = workers
+        self.storage = storage
+        self.lazy_strings = lazy if lazy_strings is None else lazy_strings
+        self.window = self._parse_window(window)
+        self.shared_strings_parser = SharedStringsParser(lazy=self.lazy_strings)
         self.styles_parser = StylesParser()
         self.namespace = {
             'ns': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
@@ -31,30 +150,123 @@ class XLSXParser:
         """Parse XLSX file"""
         with zipfile.ZipFile(self.filepath, 'r') as zf:
             doc = Document(self.filepath)
+            doc.part_crcs = self._read_part_crcs(zf)
             
             doc.shared_strings = self.shared_strings_parser.parse(zf)
             doc.styles = self.styles_parser.parse(zf)
             
             doc.workbook = self._parse_workbook(zf)
+            doc.workbook.style_table = doc.styles.resolve_cell_styles()
             self._parse_worksheets(zf, doc)
             
             return doc
     
+    def _parse_window(self, window: Union[str, Range, tuple, None]) -> Optional[Range]:
+        """Normalize a cell window given as 'A1:Z60', a Range or a
+        (min_row, max_row, min_col, max_col) tuple"""
+        if window is None or isinstance(window, Range):
+            return window
+        
+        if isinstance(window, str):
+            min_row, min_col, max_row, max_col = Helpers.parse_range_reference(window)
+        else:
+            min_row, max_row, min_col, max_col = window
+        
+        return Range(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+    
+    def reparse(self, doc: Document) -> List[str]:
+        """Re-parse only the parts of a loaded document whose CRC32 changed
+        
+        Unchanged worksheets are kept as they are. Changed sheets are parsed
+        again in place; a styles change only rebuilds the style table, while
+        a shared strings change that is not a pure append or a
+        workbook/relationships change re-parses every sheet. Returns the
+        names of the changed parts.
+        """
+        with zipfile.ZipFile(self.filepath, 'r') as zf:
+            crcs = self._read_part_crcs(zf)
+            changed = sorted(name for name in set(crcs) | set(doc.part_crcs)
+                             if crcs.get(name) != doc.part_crcs.get(name))
+            if not changed:
+                return changed
+            
+            if "xl/workbook.xml" in changed or "xl/_rels/workbook.xml.rels" in changed:
+                parsed = self.parse()
+                doc.workbook = parsed.workbook
+                doc.shared_strings = parsed.shared_strings
+                doc.styles = parsed.styles
+                doc.workbook.style_table = parsed.workbook.style_table
+                doc.part_crcs = parsed.part_crcs
+                return changed
+            
+            reparse_all = False
+            if "xl/sharedStrings.xml" in changed:
+                old_strings = doc.shared_strings or []
+                doc.shared_strings = self.shared_strings_parser.parse(zf)
+                reparse_all = not self._is_prefix(old_strings, doc.shared_strings)
+            if "xl/styles.xml" in changed:
+                doc.styles = self.styles_parser.parse(zf)
+                doc.workbook.style_table = doc.styles.resolve_cell_styles()
+            
+            pending = []
+            for ws in doc.worksheets:
+                target = getattr(ws, 'target', None)
+                if target is None or not (reparse_all or f"xl/{target}" in changed):
+                    continue
+                
+                if isinstance(ws, LazyWorksheet):
+                    ws.loader = None
+                ws.clear_cells()
+                ws.dimension = None
+                if self.lazy:
+                    ws.dimension = self._read_dimension(zf, target)
+                    ws.loader = partial(self._load_worksheet, target, doc)
+                    ws.row_source = partial(self._iter_worksheet_cells, target, doc)
+                else:
+                    pending.append((ws, target))
+            
+            if self.workers > 1 and len(pending) > 1:
+                self._parse_worksheets_parallel(pending, doc)
+            else:
+                for ws, target in pending:
+                    self._parse_worksheet_data(zf, target, ws, doc)
+            
+            doc.part_crcs = crcs
+            return changed
+    
+    def _read_part_crcs(self, zf: zipfile.ZipFile) -> Dict[str, int]:
+        """Get the CRC32 of every part from the zip central directory"""
+        return {info.filename: info.CRC for info in zf.infolist()}
+    
+    def _is_prefix(self, old_strings, new_strings) -> bool:
+        """Check if a shared strings table only had strings appended"""
+        if len(old_strings) > len(new_strings):
+            return False
+        return all(old == new for old, new in zip(old_strings, new_strings))
+    
+    def _window_bounds(self) -> tuple:
+        """Get (min_row, max_row, min_col, max_col) of the window, open-ended if unset"""
+        window = self.window
+        if window is None:
+            return 1, None, 1, None
+        return window.min_row, window.max_row, window.min_col, window.max_col
+    
     def _parse_workbook(self, zf: zipfile.ZipFile) -> Workbook:
         """Parse workbook"""
         workbook = Workbook()
         
         try:
             with zf.open("xl/workbook.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
+                root = xml.parse(f).getroot()
                 
-                sheets = root.findall(".//ns:sheets/ns:sheet", self.namespace)
-                for sheet in sheets:
+                for sheet in root.iter(TAG_SHEET):
                     name = sheet.get("name", f"Sheet{len(workbook.worksheets) + 1}")
-                    ws = Worksheet(name=name, workbook=workbook)
+                    if self.lazy or self.workers > 1:
+                        ws = LazyWorksheet(name=name, workbook=workbook, storage=self.storage)
+                    else:
+                        ws = Worksheet(name=name, workbook=workbook, storage=self.storage)
                     ws.sheet_id = sheet.get("sheetId")
-                    ws.r_id = sheet.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
+                    ws.r_id = sheet.get(ATTR_R_ID)
                     workbook.worksheets.append(ws)
                 
         except KeyError:
@@ -65,18 +277,155 @@ class XLSXParser:
     def _parse_worksheets(self, zf: zipfile.ZipFile, doc: Document):
         """Parse worksheets"""
         try:
-            with zf.open("xl/workbook.xml") as f:
-                ET.parse(f)
-                
-                rels = self._parse_relationships(zf)
-                
-                for ws in doc.workbook.worksheets:
-                    if hasattr(ws, 'r_id') and ws.r_id in rels:
-                        target = rels[ws.r_id]
-                        self._parse_worksheet_data(zf, target, ws, doc)
+            zf.getinfo("xl/workbook.xml")
+            
+            rels = self._parse_relationships(zf)
+            
+            pending = []
+            for ws in doc.workbook.worksheets:
+                if hasattr(ws, 'r_id') and ws.r_id in rels:
+                    target = rels[ws.r_id]
+                    ws.target = target
+                    if self.lazy:
+                        ws.dimension = self._read_dimension(zf, target)
+                        ws.loader = partial(self._load_worksheet, target, doc)
+                        ws.row_source = partial(self._iter_worksheet_cells, target, doc)
+                    else:
+                        pending.append((ws, target))
+            
+            if self.workers > 1 and len(pending) > 1:
+                self._parse_worksheets_parallel(pending, doc)
+            else:
+                for ws, target in pending:
+                    self._parse_worksheet_data(zf, target, ws, doc)
+        
+        except KeyError:
+            pass
+    
+    def _parse_worksheets_parallel(self, pending: list, doc: Document):
+        """Parse sheet parts in worker processes and apply their payloads
+        
+        Workers decode every value into typed columns; shared string indices
+        are resolved and cells created here, so the string table never has
+        to be pickled. Lazy worksheets keep their payload and only create
+        cells on first access, so the parent's share of the work does not
+        grow with the sheet size.
+        """
+        bounds = self._window_bounds()
+        
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+            futures = [
+                pool.submit(_scan_worksheet_part, self.filepath, target, bounds, self.streaming)
+                for _, target in pending
+            ]
+            
+            for (ws, _), future in zip(pending, futures):
+                payload = future.result()
+                if isinstance(ws, LazyWorksheet):
+                    ws.dimension = payload.dimension
+                    ws.loader = partial(self._apply_worksheet_payload, payload, doc=doc)
+                else:
+                    self._apply_worksheet_payload(payload, ws, doc)
+    
+    def _apply_worksheet_payload(self, payload: SheetPayload, worksheet: Worksheet, doc: Document):
+        """Create the cells of a payload produced by _scan_worksheet_data"""
+        if payload.dimension is not None:
+            worksheet.dimension = payload.dimension
         
+        strings = doc.shared_strings
+        ints = iter(payload.ints)
+        floats = iter(payload.floats)
+        others = iter(payload.others)
+        cell_at = worksheet.cell
+        rows = (row for row, length in zip(payload.row_numbers, payload.row_lengths)
+                for _ in range(length))
+        
+        for row, col, style_id, kind in zip(rows, payload.cols, payload.styles, payload.kinds):
+            cell = cell_at(row, col)
+            if kind == PAYLOAD_SHARED:
+                cell.value = _shared_string(next(ints), doc, strings)
+                cell.data_type = "string"
+            elif kind == PAYLOAD_INT:
+                cell.value = next(ints)
+                cell.data_type = "number"
+            elif kind == PAYLOAD_FLOAT:
+                cell.value = next(floats)
+                cell.data_type = "number"
+            elif kind == PAYLOAD_TRUE or kind == PAYLOAD_FALSE:
+                cell.value = kind == PAYLOAD_TRUE
+                cell.data_type = "boolean"
+            elif kind == PAYLOAD_OTHER:
+                cell.value, cell.data_type = next(others)
+            if style_id:
+                cell.style_id = style_id
+    
+    def _scan_worksheet_data(self, zf: zipfile.ZipFile, target: str) -> SheetPayload:
+        """Decode a sheet part into a compact, picklable SheetPayload
+        
+        Values are decoded by _decode_fields like a serial parse, except
+        that shared strings are kept as indices into the table.
+        """
+        dimensions = []
+        row_numbers, row_lengths = array("I"), array("I")
+        cols, styles, kinds = array("I"), array("I"), array("B")
+        ints, floats = array("q"), array("d")
+        others = []
+        
+        min_row, max_row, min_col, max_col = self._window_bounds()
+        
+        try:
+            with zf.open(f"xl/{target}") as f:
+                if self.streaming:
+                    row_elems = self._iter_row_elements(f, dimensions.append)
+                else:
+                    root = xml.parse(f).getroot()
+                    dimension = root.find(f".//{TAG_DIMENSION}")
+                    if dimension is not None:
+                        dimensions.append(self._parse_range(dimension.get("ref", "")))
+                    row_elems = root.iter(TAG_ROW)
+                
+                for row, row_elem in self._iter_rows_in_window(row_elems, min_row, max_row,
+                                                               min_col, max_col):
+                    for row, col, cell_elem in self._iter_cells_in_window(row_elem, row, min_col, max_col):
+                        value, style_id, data_type = self._decode_fields(cell_elem, None)
+                        if row_numbers and row_numbers[-1] == row:
+                            row_lengths[-1] += 1
+                        else:
+                            row_numbers.append(row)
+                            row_lengths.append(1)
+                        cols.append(col)
+                        styles.append(style_id)
+                        
+                        if value is None:
+                            kinds.append(PAYLOAD_EMPTY)
+                        elif value is True or value is False:
+                            kinds.append(PAYLOAD_TRUE if value else PAYLOAD_FALSE)
+                        elif data_type == "string" and type(value) is int:
+                            if value <= INT64_MAX:
+                                kinds.append(PAYLOAD_SHARED)
+                                ints.append(value)
+                            else:
+                                kinds.append(PAYLOAD_OTHER)
+                                others.append((str(value), data_type))
+                        elif data_type == "number" and type(value) is int and INT64_MIN <= value <= INT64_MAX:
+                            kinds.append(PAYLOAD_INT)
+                            ints.append(value)
+                        elif data_type == "number" and type(value) is float:
+                            kinds.append(PAYLOAD_FLOAT)
+                            floats.append(value)
+                        else:
+                            kinds.append(PAYLOAD_OTHER)
+                            others.append((value, data_type))
         except KeyError:
             pass
+        
+        return SheetPayload(dimensions[-1] if dimensions else None, row_numbers, row_lengths,
+                            cols, styles, kinds, ints, floats, others)
+    
+    def _load_worksheet(self, target: str, doc: Document, worksheet: Worksheet):
+        """Parse a lazily loaded worksheet, reopening the archive"""
+        with zipfile.ZipFile(self.filepath, 'r') as zf:
+            self._parse_worksheet_data(zf, target, worksheet, doc)
     
     def _parse_relationships(self, zf: zipfile.ZipFile) -> dict:
         """Parse relationships"""
@@ -84,10 +433,9 @@ class XLSXParser:
         
         try:
             with zf.open("xl/_rels/workbook.xml.rels") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
+                root = xml.parse(f).getroot()
                 
-                for rel in root.findall(".//{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"):
+                for rel in root.iter(TAG_RELATIONSHIP):
                     rel_id = rel.get("Id")
                     target = rel.get("Target")
                     rels[rel_id] = target
@@ -98,61 +446,189 @@ class XLSXParser:
         return rels
     
     def _parse_worksheet_data(self, zf: zipfile.ZipFile, target: str, worksheet: Worksheet, doc: Document):
-        """Parse worksheet data"""
+        """Parse worksheet data, restricted to the parser window if one is set"""
+        min_row, max_row, min_col, max_col = self._window_bounds()
+        
         try:
             with zf.open(f"xl/{target}") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
+                if self.streaming:
+                    row_elems = self._iter_row_elements(f, partial(setattr, worksheet, "dimension"))
+                else:
+                    root = xml.parse(f).getroot()
+                    
+                    dimension = root.find(f".//{TAG_DIMENSION}")
+                    if dimension is not None:
+                        worksheet.dimension = self._parse_range(dimension.get("ref", ""))
+                    
+                    sheet_data = root.find(f".//{TAG_SHEET_DATA}")
+                    if sheet_data is None:
+                        return
+                    row_elems = sheet_data.iter(TAG_ROW)
                 
-                sheet_data = root.find(".//ns:sheetData", self.namespace)
-                
-                if sheet_data is not None:
-                    for row_elem in sheet_data.findall(".//ns:row", self.namespace):
-                        
-                        for cell_elem in row_elem.findall(".//ns:c", self.namespace):
-                            cell_ref = cell_elem.get("r", "")
-                            row, col = self._parse_cell_reference(cell_ref)
-                            
-                            cell = worksheet.cell(row, col)
-                            
-                            v_elem = cell_elem.find(".//ns:v", self.namespace)
-                            if v_elem is not None and v_elem.text:
-                                value = v_elem.text
-                                
-                                if value.startswith("0"):
-                                    try:
-                                        idx = int(value)
-                                        value = doc.shared_strings[idx]
-                                    except (ValueError, IndexError):
-                                        pass
-                                
-                                cell.value = value
-                                
-                                t_elem = cell_elem.get("t", "s")
-                                if t_elem == "s":
-                                    try:
-                                        style_idx = int(v_elem.text)
-                                        if 0 <= style_idx < len(doc.styles.cell_formats):
-                                            cell.style = doc.styles.cell_formats[style_idx]
-                                    except (ValueError, IndexError):
-                                        pass
+                for row, row_elem in self._iter_rows_in_window(row_elems, min_row, max_row,
+                                                               min_col, max_col):
+                    for row, col, cell_elem in self._iter_cells_in_window(row_elem, row, min_col, max_col):
+                        self._parse_cell(cell_elem, row, col, worksheet, doc)
         except KeyError:
             pass
     
-    def _parse_cell_reference(self, ref: str):
-        """Parse cell reference (e.g., 'A1') to row, col"""
-        col_str = ""
-        row_str = ""
+    def _read_dimension(self, zf: zipfile.ZipFile, target: str) -> Optional[Range]:
+        """Read <dimension ref> from the head of a sheet part without parsing rows"""
+        try:
+            with zf.open(f"xl/{target}") as f:
+                for _, elem in xml.iterparse(f, events=("start",)):
+                    if elem.tag == TAG_DIMENSION:
+                        return self._parse_range(elem.get("ref", ""))
+                    if elem.tag == TAG_SHEET_DATA:
+                        break
+        except KeyError:
+            pass
         
-        for char in ref:
-            if char.isalpha():
-                col_str += char
-            elif char.isdigit():
-                row_str += char
+        return None
+    
+    def _iter_row_elements(self, f, on_dimension: Optional[Callable[[Range], None]] = None):
+        """Stream <row> elements from sheet XML, discarding each once consumed
         
-        col = 0
-        for char in col_str:
-            col = col * 26 + (ord(char.upper()) - ord('A') + 1)
+        When ``on_dimension`` is given it is called with the declared
+        <dimension> range.
+        """
+        sheet_data = None
         
-        row = int(row_str)
-        return (row, col)
\ No newline at end of file
+        for event, elem in xml.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if elem.tag == TAG_SHEET_DATA:
+                    sheet_data = elem
+            elif elem.tag == TAG_ROW:
+                yield elem
+                
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.clear()
+            elif elem.tag == TAG_DIMENSION and on_dimension is not None:
+                on_dimension(self._parse_range(elem.get("ref", "")))
+    
+    def _iter_rows_in_window(self, row_elems, min_row: int = 1, max_row: Optional[int] = None,
+                             min_col: int = 1, max_col: Optional[int] = None):
+        """Yield (row, element) pairs within the row bounds, stopping past max_row
+        
+        Rows whose ``spans`` attribute lies outside the column bounds are
+        skipped without looking at their cells.
+        """
+        check_spans = min_col > 1 or max_col is not None
+        row = 0
+        for row_elem in row_elems:
+            row_ref = row_elem.get("r")
+            row = int(row_ref) if row_ref else row + 1
+            
+            if row < min_row:
+                continue
+            if max_row is not None and row > max_row:
+                break
+            
+            spans = row_elem.get("spans") if check_spans else None
+            if spans:
+                first_col = int(spans.split(":", 1)[0])
+                last_col = int(spans.rsplit(":", 1)[-1])
+                if last_col < min_col or (max_col is not None and first_col > max_col):
+                    continue
+            
+            yield row, row_elem
+    
+    def _iter_cells_in_window(self, row_elem, row: int = 0, min_col: int = 1,
+                              max_col: Optional[int] = None):
+        """Yield (row, col, element) for the cells of a row within the column bounds
+        
+        The ``r`` attributes of the row are decoded in one batch; a cell
+        without one follows the previous cell of the row.
+        """
+        cell_elems = list(row_elem.iter(TAG_C))
+        rows, cols = parse_references([cell_elem.get("r") for cell_elem in cell_elems], row)
+        
+        for cell_row, col, cell_elem in zip(rows, cols, cell_elems):
+            if col >= min_col and (max_col is None or col <= max_col):
+                yield cell_row, col, cell_elem
+    
+    def _parse_cell(self, cell_elem, row: int, col: int, worksheet: Worksheet, doc: Document):
+        """Parse a single <c> element into the worksheet"""
+        value, style_id, data_type = self._decode_fields(cell_elem, doc)
+        
+        cell = worksheet.cell(row, col)
+        if value is not None:
+            cell.value = value
+            cell.data_type = data_type
+        if style_id:
+            cell.style_id = style_id
+    
+    def _decode_cell(self, cell_elem, row: int, col: int, doc: Document) -> CellRecord:
+        """Decode a <c> element without creating a Cell"""
+        return CellRecord(row, col, *self._decode_fields(cell_elem, doc))
+    
+    def _decode_fields(self, cell_elem, doc: Optional[Document]) -> tuple:
+        """Decode a <c> element to (value, style_id, data_type) via CELL_TYPES
+        
+        Every parse path decodes cells here; with ``doc=None`` shared strings
+        stay as their integer index.
+        """
+        get = cell_elem.get
+        cell_type = get("t", "n")
+        style = get("s")
+        style_id = int(style) if style else 0
+        
+        text = self._cell_text(cell_elem, cell_type)
+        if text is None:
+            return None, style_id, None
+        
+        decoder, data_type = CELL_TYPES.get(cell_type, TEXT_TYPE)
+        return decoder(text, doc), style_id, data_type
+    
+    def _cell_text(self, cell_elem, cell_type: str) -> Optional[str]:
+        """Get the raw text of a cell: <v>, or the <is> runs of an inline string"""
+        if cell_type == "inlineStr":
+            is_elem = cell_elem.find(TAG_IS)
+            if is_elem is None:
+                return None
+            return "".join(t.text for t in is_elem.iter(TAG_T) if t.text)
+        
+        v_elem = cell_elem.find(TAG_V)
+        return v_elem.text if v_elem is not None else None
+    
+    def _iter_worksheet_cells(self, target: str, doc: Document, min_row: int = 1,
+                              max_row: Optional[int] = None, min_col: int = 1,
+                              max_col: Optional[int] = None) -> Iterator[Tuple[int, Dict[int, CellRecord]]]:
+        """Stream (row, {col: record}) pairs straight from the sheet XML"""
+        with zipfile.ZipFile(self.filepath, 'r') as zf:
+            try:
+                f = zf.open(f"xl/{target}")
+            except KeyError:
+                return
+            
+            with f:
+                row_elems = self._iter_row_elements(f)
+                for row, row_elem in self._iter_rows_in_window(row_elems, min_row, max_row,
+                                                               min_col, max_col):
+                    row_cells = {
+                        col: self._decode_cell(cell_elem, cell_row, col, doc)
+                        for cell_row, col, cell_elem in self._iter_cells_in_window(row_elem, row, min_col, max_col)
+                    }
+                    
+                    if row_cells:
+                        yield row, row_cells
+    
+    def _parse_range(self, ref: str) -> Optional[Range]:
+        """Parse range reference ('A1:D10' or a single 'A1') to a Range"""
+        if not ref:
+            return None
+        
+        min_row, min_col, max_row, max_col = split_range(ref)
+        return Range(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+    
+    def _parse_cell_reference(self, ref: str):
+        """Parse cell reference (e.g., 'A1') to row, col"""
+        return split_reference(ref)
+
+def _scan_worksheet_part(filepath: str, target: str, bounds: tuple,
+                         streaming: bool = True) -> tuple:
+    """Process-pool entry point: open the archive and tokenize one sheet part"""
+    parser = XLSXParser(filepath, streaming=streaming, window=bounds)
+    with zipfile.ZipFile(filepath, 'r') as zf:
+        return parser._scan_worksheet_data(zf, target)
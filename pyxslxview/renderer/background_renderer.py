@@ -13,7 +13,7 @@ class BackgroundRenderer(BaseRenderer):
     def render(self, context: RenderContext):
         """Render background"""
         cell = context.cell
-        fill = cell.style.fill
+        fill = cell.resolved_style.fill
         
         if not fill or fill.fill_type == "none":
             return
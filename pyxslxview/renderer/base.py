@@ -9,8 +9,10 @@ from typing import Optional
 from ..core.cell import Cell
 from ..core.worksheet import Worksheet
 from ..graphics.canvas import Rectangle
+from ..utils.slots import slotted
 
 
+@slotted
 @dataclass
 class RenderContext:
     """Render context"""
@@ -12,7 +12,7 @@ class BorderRenderer(BaseRenderer):
     def render(self, context: RenderContext):
         """Render border"""
         cell = context.cell
-        border = cell.style.border
+        border = cell.resolved_style.border
         
         if not border or not border.has_any_border():
             return
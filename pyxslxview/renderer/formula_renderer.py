@@ -20,7 +20,7 @@ class FormulaRenderer(BaseRenderer):
         if not cell.formula:
             return
         
-        style = cell.style
+        style = cell.resolved_style
         alignment = style.alignment
         
         font = style.font
@@ -40,7 +40,7 @@ class FormulaRenderer(BaseRenderer):
                               alignment) -> float:
         """Calculate x position"""
         rect = context.rect
-        font = context.cell.style.font
+        font = context.cell.resolved_style.font
         
         text_width, _ = self.canvas.font_manager.measure_text(font, text)
         
@@ -56,7 +56,7 @@ class FormulaRenderer(BaseRenderer):
     def _calculate_y_position(self, context: RenderContext, alignment) -> float:
         """Calculate y position"""
         rect = context.rect
-        font = context.cell.style.font
+        font = context.cell.resolved_style.font
         
         _, text_height = self.canvas.font_manager.measure_text(font, "M")
         
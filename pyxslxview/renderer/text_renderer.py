@@ -21,7 +21,7 @@ class TextRenderer(BaseRenderer):
         if not cell.value or cell.data_type == "blank":
             return
         
-        style = cell.style
+        style = cell.resolved_style
         alignment = style.alignment
         
         font = style.font
@@ -44,7 +44,7 @@ class TextRenderer(BaseRenderer):
     def _draw_single_line_text(self, context: RenderContext, text: str, alignment: Alignment):
         """Draw single line text"""
         rect = context.rect
-        font = context.cell.style.font
+        font = context.cell.resolved_style.font
         
         text_width, text_height = self.font_manager.measure_text(font, text)
         
@@ -56,7 +56,7 @@ class TextRenderer(BaseRenderer):
     def _draw_wrapped_text(self, context: RenderContext, text: str, alignment: Alignment):
         """Draw wrapped text"""
         rect = context.rect
-        font = context.cell.style.font
+        font = context.cell.resolved_style.font
         
         lines = self._wrap_text(text, rect.width, font)
         
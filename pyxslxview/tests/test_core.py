@@ -5,6 +5,7 @@ Tests for pyxslxview
 import pytest
 from pyxslxview.core import Color, Font, Alignment, Border, Fill, CellStyle
 from pyxslxview.utils import Units, Helpers, Cache
+from pyxslxview.utils import references
 
 
 class TestColor:
@@ -44,6 +45,21 @@ class TestColor:
         assert Color.get_red().rgb == (255, 0, 0)
         assert Color.get_green().rgb == (0, 255, 0)
         assert Color.get_blue().rgb == (0, 0, 255)
+    
+    def test_color_is_slotted_and_frozen(self):
+        """Test colors are immutable value objects without an instance dict"""
+        import copy
+        import dataclasses
+        import pickle
+        
+        color = Color.from_hex("#FF8040")
+        assert not hasattr(color, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            color.red = 0
+        
+        assert {color: 1}[Color(red=255, green=128, blue=64)] == 1
+        assert pickle.loads(pickle.dumps(color)) == color
+        assert copy.deepcopy(color) == color
 
 
 class TestFont:
@@ -184,6 +200,75 @@ class TestHelpers:
         assert Helpers.get_column_number("Z") == 26
         assert Helpers.get_column_number("AA") == 27
     
+    def test_batch_references(self):
+        """Test bulk reference conversion"""
+        refs = Helpers.tuples_to_cell_references([1, 10, 3], [1, 27, 16384])
+        assert [str(ref) for ref in refs] == ["A1", "AA10", "XFD3"]
+        
+        rows, cols = Helpers.parse_cell_references(refs)
+        assert [int(row) for row in rows] == [1, 10, 3]
+        assert [int(col) for col in cols] == [1, 27, 16384]
+        
+        row1, col1, row2, col2 = Helpers.parse_range_references(["A1:B10", "C3:AA4"])
+        assert [int(v) for v in row1] == [1, 3] and [int(v) for v in col2] == [2, 27]
+        
+        with pytest.raises(ValueError):
+            Helpers.parse_cell_references(["A1", "a1"])
+        with pytest.raises(ValueError):
+            Helpers.parse_range_references(["A1"])
+    
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_batch_references_agree(self, monkeypatch, numpy):
+        """Test both batch paths return array('q') and reject int64 overflow"""
+        from array import array
+        from pyxslxview.utils import helpers
+        if not numpy:
+            monkeypatch.setattr(helpers, "np", None)
+        
+        assert isinstance(Helpers.tuples_to_cell_references([1], [1]), list)
+        rows, cols = Helpers.parse_cell_references(["A1", "B9223372036854775807", "AAAAAAAAAAAAAA2"])
+        assert isinstance(rows, array) and rows.typecode == "q"
+        assert list(rows) == [1, 9223372036854775807, 2]
+        assert cols[2] == sum(26 ** k for k in range(14))
+        assert all(isinstance(v, array) for v in Helpers.parse_range_references(["A1:B2"]))
+        
+        with pytest.raises(OverflowError):
+            Helpers.parse_cell_references(["A1", "A99999999999999999999"])
+        with pytest.raises(OverflowError):
+            Helpers.parse_range_references(["A1:A99999999999999999999"])
+    
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_batch_references_reject_same_input(self, monkeypatch, numpy):
+        """Test both batch paths reject non-ASCII digits, a trailing newline and nested input"""
+        from pyxslxview.utils import helpers
+        if not numpy:
+            monkeypatch.setattr(helpers, "np", None)
+        
+        for ref in ["A\u0661", "A\uff11", "A1\n"]:
+            with pytest.raises(ValueError):
+                Helpers.parse_cell_references(["B2", ref])
+            with pytest.raises(ValueError):
+                Helpers.parse_range_references([f"B2:{ref}"])
+            assert not Helpers.is_valid_cell_reference(ref)
+        
+        with pytest.raises(TypeError):
+            Helpers.parse_cell_references([["A1", "B2"], ["C3", "D4"]])
+        with pytest.raises(TypeError):
+            Helpers.parse_range_references([["A1:B2"]])
+        with pytest.raises(TypeError):
+            Helpers.tuples_to_cell_references([[1, 2]], [[1, 2]])
+    
+    def test_batch_references_without_numpy(self, monkeypatch):
+        """Test the pure-Python batch fallback"""
+        from pyxslxview.utils import helpers
+        monkeypatch.setattr(helpers, "np", None)
+        
+        assert Helpers.tuples_to_cell_references([5, 2], [2, 703]) == ["B5", "AAA2"]
+        rows, cols = Helpers.parse_cell_references(["B5", "AAA2"])
+        assert list(rows) == [5, 2] and list(cols) == [2, 703]
+        with pytest.raises(ValueError):
+            Helpers.tuples_to_cell_references([1], [0])
+    
     def test_clamp(self):
         """Test clamp function"""
         assert Helpers.clamp(5, 0, 10) == 5
@@ -196,6 +281,31 @@ class TestHelpers:
         assert Helpers.lerp(0, 100, 0.25) == 25.0
 
 
+class TestReferences:
+    """Test the reference decoding module"""
+    
+    def test_column_tables(self):
+        """Test the precomputed column labels round-trip"""
+        assert references.column_letter(16384) == "XFD"
+        assert references.column_number("XFD") == 16384
+        for col in (1, 26, 27, 702, 703):
+            assert references.column_number(references.column_letter(col)) == col
+    
+    def test_split_reference(self):
+        """Test decoding single references"""
+        assert references.split_reference("B10") == (10, 2)
+        assert references.split_reference("$AA$3") == (3, 27)
+        assert references.split_range("A1:C4") == (1, 1, 4, 3)
+        with pytest.raises(ValueError):
+            references.split_reference("12")
+    
+    def test_parse_references(self):
+        """Test decoding a row of references in one call"""
+        rows, cols = references.parse_references(["A2", "C2", None, "XFD2"], row=2)
+        assert list(rows) == [2, 2, 2, 2]
+        assert list(cols) == [1, 3, 4, 16384]
+
+
 class TestCache:
     """Test Cache class"""
     
@@ -260,6 +370,509 @@ class TestCell:
         
         cell = Cell(row=10, col=26, worksheet=worksheet)
         assert cell.coordinate == "Z10"
+    
+    def test_cell_is_slotted(self):
+        """Test cells and ranges keep their fields in slots"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.core.range import Range
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        cell = worksheet.cell(1, 1)
+        cell_range = Range(min_row=1, max_row=2, min_col=1, max_col=2, worksheet=worksheet)
+        
+        assert not hasattr(cell, "__dict__")
+        assert not hasattr(cell_range, "__dict__")
+        assert cell_range.worksheet is worksheet
+        with pytest.raises(AttributeError):
+            cell.extra = 1
+    
+    def test_cell_style_table(self):
+        """Test cells resolve styles through the shared style table"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.core.worksheet import Worksheet
+        
+        bold = CellStyle(font=Font(bold=True))
+        workbook = Workbook(style_table=[CellStyle(), bold])
+        worksheet = Worksheet(name="Sheet1", workbook=workbook)
+        first = worksheet.cell(1, 1)
+        second = worksheet.cell(1, 2)
+        first.style_id = second.style_id = 1
+        
+        assert first.resolved_style is bold
+        assert second.resolved_style is bold
+        
+        first.style.font = Font(italic=True)
+        
+        assert first.resolved_style.font.italic is True
+        assert second.resolved_style is bold
+        assert bold.font.italic is False
+
+    
+    def test_cell_style_keyword(self):
+        """Test style stays the sixth argument and style_id is keyword-only"""
+        from pyxslxview.core.cell import Cell
+        
+        style = CellStyle(font=Font(bold=True))
+        cell = Cell(1, 1, None, "x", None, style)
+        
+        assert cell.style is style
+        assert Cell(row=1, col=1, worksheet=None, style=style).resolved_style is style
+        assert Cell(1, 1, None, style_id=3).style_id == 3
+        with pytest.raises(TypeError):
+            Cell(1, 1, None, None, None, None, None, None, None, 3)
+
+class TestWorksheetBounds:
+    """Test max_row/max_col tracking"""
+    
+    def test_bounds_follow_direct_changes(self):
+        """Test bounds include initial cells and cells set or deleted on the mapping"""
+        from pyxslxview.core.cell import Cell
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.core.worksheet import Worksheet
+        
+        for storage in ("dict", "columnar", "blocks"):
+            workbook = Workbook()
+            worksheet = Worksheet(name="Sheet1", workbook=workbook, storage=storage,
+                                  cells={(3, 4): Cell(row=3, col=4, worksheet=None, value=1)})
+            assert (worksheet.max_row, worksheet.max_col) == (3, 4)
+            
+            worksheet.cell(5, 2)
+            worksheet.cells[(7, 1)] = Cell(row=7, col=1, worksheet=worksheet)
+            assert (worksheet.max_row, worksheet.max_col) == (7, 4)
+            
+            del worksheet.cells[(7, 1)]
+            del worksheet.cells[(3, 4)]
+            assert (worksheet.max_row, worksheet.max_col) == (5, 2)
+
+
+class TestColumnarStorage:
+    """Test the columnar cell store backend"""
+    
+    def test_cells_round_trip(self):
+        """Test values, types and attributes survive the typed arrays"""
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1", storage="columnar")
+        values = {(3, 2): "text", (1, 1): 2 ** 60, (1, 3): 1.5, (2, 1): True, (2, 2): 7, (3, 1): None}
+        for (row, col), value in values.items():
+            worksheet.cell(row, col).value = value
+        worksheet.cell(3, 2).comment = "note"
+        
+        assert list(worksheet.cells) == sorted(values)
+        assert {key: cell.value for key, cell in worksheet.cells.items()} == values
+        assert worksheet.cells[(3, 2)].comment == "note"
+        assert worksheet.cell(3, 2).coordinate == "B3"
+        assert worksheet.cell(2, 1).data_type == "blank"
+        assert (4, 4) not in worksheet.cells
+        assert worksheet.max_row == 3 and worksheet.max_col == 3
+    
+    def test_views_follow_inserts(self):
+        """Test a view stays attached to its cell when earlier cells are inserted"""
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1", storage="columnar")
+        last = worksheet.cell(5, 5)
+        last.value = "last"
+        worksheet.cell(1, 1).value = "first"
+        del worksheet.cells[(1, 1)]
+        worksheet.cell(2, 2).style_id = 3
+        
+        assert last.value == "last"
+        assert worksheet.cells[(2, 2)].style_id == 3
+        assert worksheet.cells.nbytes < 100
+    
+    def test_iter_rows_matches_dict(self):
+        """Test row iteration is the same for both backends"""
+        from pyxslxview.core.workbook import Workbook
+        
+        sheets = [Workbook().add_worksheet("Sheet1", storage=storage) for storage in ("dict", "columnar")]
+        for worksheet in sheets:
+            for row, col in ((4, 2), (1, 3), (1, 1), (2, 5)):
+                worksheet.cell(row, col).value = row * 10 + col
+        
+        dict_rows, columnar_rows = (list(ws.iter_rows(min_row=1, max_row=4, min_col=2, values_only=True))
+                                    for ws in sheets)
+        assert columnar_rows == dict_rows
+    
+    def test_store_requires_create(self):
+        """Test a cell store missing an abstract method cannot be instantiated"""
+        from pyxslxview.core.storage import CellStore
+        
+        class PartialStore(CellStore):
+            __getitem__ = __delitem__ = __iter__ = __len__ = None
+        
+        with pytest.raises(TypeError):
+            PartialStore()
+    
+    def test_unknown_storage(self):
+        """Test an unknown backend name is rejected"""
+        from pyxslxview.core.workbook import Workbook
+        
+        with pytest.raises(ValueError):
+            Workbook().add_worksheet("Sheet1", storage="unknown")
+
+
+class TestBlockStorage:
+    """Test the block-partitioned cell store backend"""
+    
+    def test_sparse_grid_allocates_blocks(self):
+        """Test only blocks holding cells are allocated"""
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1", storage="blocks")
+        worksheet.cell(1, 1).value = "first"
+        worksheet.cell(1048576, 16384).value = "last"
+        
+        assert sorted(worksheet.cells.blocks) == [(0, 0), (4095, 255)]
+        assert worksheet.cells[(1048576, 16384)].value == "last"
+        assert len(worksheet.cells) == 2
+    
+    def test_iter_cells_rectangle(self):
+        """Test rectangle queries return the cells inside in row-major order"""
+        from pyxslxview.core.workbook import Workbook
+        
+        for storage in ("dict", "blocks"):
+            worksheet = Workbook().add_worksheet("Sheet1", storage=storage)
+            for row, col in ((300, 70), (2, 2), (257, 1), (5, 65), (1, 1), (600, 3)):
+                worksheet.cell(row, col)
+            
+            cells = worksheet.iter_cells(2, 300, 1, 70)
+            assert [(cell.row, cell.col) for cell in cells] == [(2, 2), (5, 65), (257, 1), (300, 70)]
+    
+    def test_cell_index(self):
+        """Test the row/column indexes follow created and assigned cells"""
+        from pyxslxview.core.cell import Cell
+        from pyxslxview.core.workbook import Workbook
+        
+        for storage in ("dict", "columnar", "blocks"):
+            worksheet = Workbook().add_worksheet("Sheet1", storage=storage)
+            worksheet.cell(2, 5)
+            assert worksheet.row_columns(2) == [5]
+            
+            worksheet.cell(2, 1)
+            worksheet.cell(2, 1)
+            worksheet.cell(7, 1)
+            assert worksheet.row_columns(2) == [1, 5]
+            assert worksheet.column_rows(1) == [2, 7]
+            
+            worksheet.cells[(4, 1)] = Cell(row=4, col=1, worksheet=worksheet)
+            assert worksheet.column_rows(1) == [2, 4, 7]
+            assert worksheet.row_columns(3) == []
+            
+            del worksheet.cells[(7, 1)]
+            worksheet.cells[(9, 1)] = Cell(row=9, col=1, worksheet=worksheet)
+            assert worksheet.column_rows(1) == [2, 4, 9]
+            assert worksheet.row_columns(7) == []
+    
+    def test_evict_untouched_blocks(self, tmp_path):
+        """Test untouched blocks are written to disk and read back on access"""
+        from pyxslxview.core.storage import BlockCellStore
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.cells = store = BlockCellStore(worksheet, spill_dir=str(tmp_path))
+        worksheet.cell(1, 1).value = 1
+        worksheet.cell(1000, 1).comment = "note"
+        
+        assert store.evict() == 0
+        worksheet.cell(1, 1)
+        assert store.evict() == 1
+        assert store.spilled_blocks == 1 and len(list(tmp_path.iterdir())) == 1
+        
+        cell = worksheet.cells[(1000, 1)]
+        assert cell.comment == "note" and cell.worksheet is worksheet
+        assert store.spilled_blocks == 0 and not list(tmp_path.iterdir())
+    
+    def test_spill_files_removed_with_store(self, tmp_path):
+        """Test stores sharing a spill directory only remove their own files"""
+        import gc
+        from pyxslxview.core.storage import BlockCellStore
+        from pyxslxview.core.workbook import Workbook
+        
+        workbook = Workbook()
+        stores = []
+        for name in ("One", "Two"):
+            worksheet = workbook.add_worksheet(name)
+            worksheet.cells = store = BlockCellStore(worksheet, spill_dir=str(tmp_path))
+            worksheet.cell(1, 1).value = name
+            store.evict()
+            store.evict()
+            stores.append(store)
+        
+        assert len(list(tmp_path.iterdir())) == 2
+        
+        del workbook.worksheets[0], stores[0], worksheet, store
+        gc.collect()
+        
+        assert len(list(tmp_path.iterdir())) == 1
+        assert stores[0].get((1, 1)).value == "Two"
+    
+    def test_items_stream_evicted_blocks(self, tmp_path):
+        """Test full iteration reads evicted blocks without keeping them resident"""
+        from pyxslxview.core.storage import BlockCellStore
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.cells = store = BlockCellStore(worksheet, spill_dir=str(tmp_path))
+        for row in (1, 300, 600, 900):
+            worksheet.cell(row, 70).value = row
+        store.evict()
+        worksheet.cell(1, 70)
+        assert store.evict() == 3
+        
+        assert [(key, cell.value) for key, cell in store.items()] == [
+            ((1, 70), 1), ((300, 70), 300), ((600, 70), 600), ((900, 70), 900)
+        ]
+        assert list(store) == [(1, 70), (300, 70), (600, 70), (900, 70)]
+        assert store.spilled_blocks == 3 and len(store.blocks) == 1
+        
+        assert [cell.row for cell in store.iter_range(250, 650, 65, 128)] == [300, 600]
+        del worksheet.cells[(600, 70)]
+        assert [cell.row for cell in store.iter_range(250, 650, 65, 128)] == [300]
+
+
+class TestMergedCells:
+    """Test the merged cell index"""
+    
+    def test_lookup_by_covered_cell(self):
+        """Test covered cells resolve to their range across tiles"""
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.merge_cells("A1:B2")
+        worksheet.merge_cells("P60:R70")
+        worksheet.merge_cells("D1:D100000")
+        
+        assert worksheet.merged_range_at(2, 2) is worksheet.merged_cells[0]
+        assert worksheet.merged_range_at(65, 17) is worksheet.merged_cells[1]
+        assert worksheet.merged_range_at(99999, 4) is worksheet.merged_cells[2]
+        assert worksheet.merged_range_at(3, 1) is None
+        assert worksheet.is_merge_anchor(60, 16)
+        assert not worksheet.is_merge_anchor(61, 16)
+    
+    def test_index_follows_replaced_list(self):
+        """Test the index is rebuilt when merged_cells is replaced"""
+        from pyxslxview.core.range import Range
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.merge_cells("A1:B2")
+        assert worksheet.cell(2, 1).is_merged()
+        
+        worksheet.merged_cells = [Range(min_row=5, max_row=6, min_col=1, max_col=1)]
+        assert not worksheet.cell(2, 1).is_merged()
+        assert worksheet.cell(6, 1).is_merged()
+        
+        worksheet.merged_cells.append(Range(min_row=1, max_row=1, min_col=3, max_col=4))
+        assert worksheet.cell(1, 3).is_merged_parent()
+    
+    def test_index_follows_same_length_changes(self):
+        """Test replacing or swapping ranges without changing the count"""
+        from pyxslxview.core.range import Range
+        from pyxslxview.core.workbook import Workbook
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.merge_cells("A1:B2")
+        worksheet.merge_cells("D1:E2")
+        assert worksheet.cell(2, 2).is_merged()
+        
+        worksheet.merged_cells[0] = Range(min_row=10, max_row=11, min_col=1, max_col=1)
+        assert not worksheet.cell(2, 2).is_merged()
+        assert worksheet.cell(11, 1).is_merged()
+        
+        worksheet.merged_cells.pop()
+        worksheet.merged_cells.append(Range(min_row=5, max_row=6, min_col=4, max_col=4))
+        assert not worksheet.cell(2, 5).is_merged()
+        assert worksheet.cell(6, 4).is_merged()
+        
+        worksheet.merged_cells = [Range(min_row=1, max_row=2, min_col=1, max_col=2)]
+        assert worksheet.cell(2, 2).is_merged()
+        worksheet.merged_cells[0] = Range(min_row=3, max_row=3, min_col=1, max_col=2)
+        assert not worksheet.cell(2, 2).is_merged()
+    
+    def test_large_ranges_are_banded(self):
+        """Test whole-row and whole-column merges are only checked in their band"""
+        from pyxslxview.core.range import MergedCellIndex, Range
+        
+        rows = [Range(min_row=r, max_row=r, min_col=1, max_col=16384) for r in range(1, 5000, 2)]
+        column = Range(min_row=1, max_row=1048576, min_col=20000, max_col=20000)
+        index = MergedCellIndex(rows + [column])
+        
+        assert index.range_at(4999, 300) is rows[-1]
+        assert index.range_at(4998, 300) is None
+        assert index.range_at(700000, 20000) is column
+        assert max(len(band) for band in index.row_bands.values()) <= index.tile_rows
+        assert len(index.col_bands) == 1
+
+
+class TestLayoutCalculator:
+    """Test layout offsets"""
+    
+    def test_offsets_skip_hidden(self):
+        """Test positions and extents with a hidden row and column"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.layout.calculator import LayoutCalculator
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.get_column(2).hidden = True
+        worksheet.get_row(3).hidden = True
+        calculator = LayoutCalculator(worksheet)
+        
+        assert calculator.get_cell_position(4, 3) == (64.0, 40.0)
+        rect = calculator.get_cell_rect(3, 2)
+        assert (rect.width, rect.height) == (0.0, 0.0)
+        assert calculator.range_extent(1, 1, 4, 3) == (128.0, 60.0)
+    
+    def test_set_row_height_shifts_rows_below(self):
+        """Test changing one row height patches the later offsets"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.layout.calculator import LayoutCalculator
+        
+        calculator = LayoutCalculator(Workbook().add_worksheet("Sheet1"))
+        assert calculator.row_y(10) == 180.0
+        
+        calculator.set_row_height(2, 50.0)
+        assert calculator.row_y(2) == 20.0
+        assert calculator.row_y(10) == 210.0
+        assert calculator.get_cell_rect(2, 1).height == 50.0
+    
+    def test_dimensions_match_per_column_computation(self):
+        """Test the single-pass sizes equal the per-row/column ones"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.layout.calculator import LayoutCalculator
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.cell(1, 1).value = "a fairly long piece of text"
+        worksheet.cell(3, 2).value = 42
+        worksheet.get_row(2).height = 30.0
+        
+        single_pass = LayoutCalculator(worksheet)
+        single_pass.calculate_dimensions()
+        per_index = LayoutCalculator(worksheet)
+        for col in (1, 2):
+            assert single_pass._column_widths[col] == per_index.calculate_column_width(col)
+        for row in (1, 2, 3):
+            assert single_pass._row_heights[row] == per_index.calculate_row_height(row)
+    
+    def test_hit_testing(self):
+        """Test points and viewports map to the rows and columns under them"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.layout.calculator import LayoutCalculator
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        worksheet.get_row(2).hidden = True
+        worksheet.merge_cells("C5:D6")
+        calculator = LayoutCalculator(worksheet)
+        
+        assert calculator.cell_at(0, 0) == (1, 1)
+        assert calculator.cell_at(63.9, 20.0) == (3, 1)
+        assert calculator.cell_at(200.0, 75.0) == (5, 3)
+        assert calculator.cell_at(-1, 5) is None
+        
+        visible = calculator.visible_range(64.0, 10.0, 128.0, 50.0)
+        assert (visible.min_row, visible.max_row, visible.min_col, visible.max_col) == (1, 4, 2, 3)
+
+    
+    def test_hit_testing_past_sheet_edge(self, monkeypatch):
+        """Test points beyond the last row or column are outside the sheet"""
+        from pyxslxview.core.workbook import Workbook
+        from pyxslxview.layout import calculator as calculator_module
+        from pyxslxview.layout.calculator import LayoutCalculator
+        from pyxslxview.utils.references import MAX_COLUMN
+        
+        monkeypatch.setattr(calculator_module, "MAX_ROW", 100)
+        calculator = LayoutCalculator(Workbook().add_worksheet("Sheet1"))
+        right = calculator.column_x(MAX_COLUMN + 1)
+        bottom = calculator.row_y(101)
+        
+        assert calculator.cell_at(right - 1, 5) == (1, MAX_COLUMN)
+        assert calculator.cell_at(right, 5) is None
+        assert calculator.cell_at(5, bottom - 1) == (100, 1)
+        assert calculator.cell_at(5, bottom + 1000) is None
+
+class TestTextMeasurement:
+    """Test glyph advance text measurement"""
+    
+    def test_width_is_sum_of_advances(self):
+        """Test text width sums per-character advances, including uncommon code points"""
+        from pyxslxview.graphics.font import GlyphAdvances
+        
+        class NarrowFont:
+            def getlength(self, text):
+                return sum(3.0 if char in "il" else 8.0 for char in text)
+        
+        advances = GlyphAdvances(NarrowFont(), default=6.0)
+        assert advances.measure("ill") == 9.0
+        assert advances.measure("Mail") == 22.0
+        assert advances.measure("i\u4e2d\u6587") == 19.0
+        assert "\u4e2d" in advances.extra
+    
+    def test_fallback_without_font_file(self):
+        """Test every glyph gets the metrics width when no font is loaded"""
+        from pyxslxview.graphics.font import FontManager
+        
+        manager = FontManager()
+        font = Font(name="NoSuchFont", size=10)
+        manager._font_cache[manager.get_font_key(font)] = {"font": None}
+        
+        width, height = manager.measure_text(font, "ab\u00e9")
+        assert width == 3 * manager.get_metrics(font).max_width
+        assert height == manager.get_metrics(font).height
+    
+    def test_measurements_are_shared(self):
+        """Test managers share measurements through the bounded cache"""
+        from pyxslxview.graphics.font import FontManager, TextMeasureCache
+        
+        cache = TextMeasureCache(max_size=2)
+        layout, renderer = FontManager(cache), FontManager(cache)
+        font = Font(name="Arial", size=11)
+        
+        size = layout.measure_text(font, "North")
+        assert renderer.measure_text(font, "North") == size
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1}
+        
+        layout.measure_text(font, "South")
+        layout.measure_text(font, "East")
+        assert cache.info()["size"] == 2
+        assert FontManager().measure_cache is not cache
+    
+    def test_clear_cache_keeps_shared_measurements(self):
+        """Test clearing one manager leaves the shared measurements alone"""
+        from pyxslxview.graphics.font import FontManager, TextMeasureCache
+        
+        cache = TextMeasureCache()
+        layout, renderer = FontManager(cache), FontManager(cache)
+        font = Font(name="Arial", size=11)
+        layout.measure_text(font, "North")
+        renderer.get_metrics(font)
+        
+        renderer.clear_cache()
+        assert renderer._metrics_cache == {}
+        assert cache.info() == {"hits": 0, "misses": 1, "size": 1}
+    
+    def test_lru_cache_concurrent_access(self):
+        """Test lookups racing with evictions never raise"""
+        import threading
+        from pyxslxview.utils.cache import LRUCache
+        
+        cache = LRUCache(max_size=8)
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(20000):
+                    cache.set((offset + i) % 32, i)
+                    cache.get((offset + i + 1) % 32)
+            except Exception as exc:
+                errors.append(exc)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert cache.size() <= 8
 
 
 if __name__ == "__main__":
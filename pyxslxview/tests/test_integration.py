@@ -239,6 +239,36 @@ class TestPDFOutput:
         """Test PDF output creation"""
         output = PDFOutput(scale=1.0)
         assert output.scale == 1.0
+    
+    def test_pages_reuse_paginator_calculator(self, monkeypatch):
+        """Test pages are laid out with the paginator's calculator"""
+        from pyxslxview.core import Workbook
+        from pyxslxview.layout.paginator import Paginator
+        from pyxslxview.output import pdf_output
+        
+        worksheet = Workbook().add_worksheet("Sheet1")
+        for row in range(1, 201):
+            for col in range(1, 4):
+                worksheet.cell(row, col).value = row * col
+        paginator = Paginator(worksheet)
+        pages = paginator.paginate()
+        
+        def fail(worksheet):
+            raise AssertionError("calculator built per page")
+        
+        drawn = []
+        monkeypatch.setattr(pdf_output, "LayoutCalculator", fail)
+        monkeypatch.setattr(PDFOutput, "_draw_cell_to_pdf", lambda self, cell, *args: drawn.append(cell))
+        
+        class FakeCanvas:
+            _pagesize = (595.0, 842.0)
+        
+        output = PDFOutput(scale=1.0)
+        for page in pages:
+            output._render_page(worksheet, page, FakeCanvas(), paginator.calculator)
+        
+        assert len(pages) > 1
+        assert len(drawn) == 600
 
 
 if __name__ == "__main__":
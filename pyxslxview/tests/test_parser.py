@@ -0,0 +1,770 @@
+"""
+Tests for XLSX parsing
+"""
+
+import os
+import sys
+import zipfile
+from array import array
+
+import pytest
+from pyxslxview import Document
+from pyxslxview.core import Color
+from pyxslxview.parser import XLSXParser, SharedStringsParser, SharedStringTable, LazySharedStringTable
+from pyxslxview.parser import xml_backend, SnapshotCache
+
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def write_xlsx(path, sheets, shared_strings=None, styles=None):
+    """Write a minimal XLSX file
+
+    ``sheets`` maps sheet names to the inner XML of their worksheet element.
+    """
+    workbook_sheets = []
+    rels = []
+
+    with zipfile.ZipFile(path, "w") as zf:
+        for i, (name, body) in enumerate(sheets.items(), start=1):
+            workbook_sheets.append(f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>')
+            rels.append(
+                f'<Relationship Id="rId{i}" Target="worksheets/sheet{i}.xml" '
+                f'Type="{REL_NS}/worksheet"/>'
+            )
+            zf.writestr(
+                f"xl/worksheets/sheet{i}.xml",
+                f'<worksheet xmlns="{MAIN_NS}">{body}</worksheet>',
+            )
+
+        zf.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">'
+            f'<sheets>{"".join(workbook_sheets)}</sheets></workbook>',
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{"".join(rels)}</Relationships>',
+        )
+
+        if shared_strings is not None:
+            items = "".join(f"<si><t>{s}</t></si>" for s in shared_strings)
+            zf.writestr(
+                "xl/sharedStrings.xml",
+                f'<sst xmlns="{MAIN_NS}" count="{len(shared_strings)}">{items}</sst>',
+            )
+
+        if styles is not None:
+            zf.writestr("xl/styles.xml", f'<styleSheet xmlns="{MAIN_NS}">{styles}</styleSheet>')
+
+    return str(path)
+
+
+def sheet_data(rows):
+    """Build <sheetData> XML from {row: [(col_letter, value[, type]), ...]}"""
+    parts = []
+    for row, cells in rows.items():
+        cell_xml = "".join(
+            f'<c r="{col}{row}" t="{cell_type[0] if cell_type else "n"}"><v>{value}</v></c>'
+            for col, value, *cell_type in cells
+        )
+        parts.append(f'<row r="{row}">{cell_xml}</row>')
+    return f'<sheetData>{"".join(parts)}</sheetData>'
+
+
+@pytest.fixture
+def simple_xlsx(tmp_path):
+    """Workbook with a single 3x2 numeric sheet"""
+    rows = {r: [("A", r * 10), ("B", r * 10 + 1)] for r in range(1, 4)}
+    return write_xlsx(tmp_path / "simple.xlsx", {"Data": sheet_data(rows)})
+
+
+class TestStreamingParser:
+    """Test iterparse-based worksheet parsing"""
+
+    def test_streaming_matches_tree_parse(self, simple_xlsx):
+        """Test streaming and tree modes produce the same cells"""
+        streamed = XLSXParser(simple_xlsx).parse().worksheets[0]
+        tree = XLSXParser(simple_xlsx, streaming=False).parse().worksheets[0]
+
+        assert sorted(streamed.cells) == sorted(tree.cells)
+        for key, cell in streamed.cells.items():
+            assert cell.value == tree.cells[key].value
+
+    def test_streaming_reads_all_rows(self, simple_xlsx):
+        """Test every row of the sheet is consumed"""
+        worksheet = XLSXParser(simple_xlsx).parse().worksheets[0]
+
+        assert len(worksheet.cells) == 6
+        assert worksheet.max_row == 3
+        assert worksheet.max_col == 2
+
+
+class TestColumnarStorage:
+    """Test parsing into the columnar cell store"""
+
+    def test_columnar_matches_dict(self, tmp_path):
+        """Test a columnar parse exposes the same cells as the dict backend"""
+        rows = {1: [("A", 0, "s"), ("B", 2.5)], 3: [("A", 1, "b"), ("C", 1, "s")]}
+        path = write_xlsx(tmp_path / "store.xlsx", {"Data": sheet_data(rows)}, shared_strings=["x", "y"])
+
+        doc = Document()
+        doc.load(path, storage="columnar")
+        columnar = doc.worksheets[0]
+        eager = XLSXParser(path).parse().worksheets[0]
+
+        assert type(columnar.cells).__name__ == "ColumnarCellStore"
+        assert {k: (c.value, c.data_type) for k, c in columnar.cells.items()} == {
+            k: (c.value, c.data_type) for k, c in eager.cells.items()
+        }
+
+
+class TestLazyWorksheets:
+    """Test on-demand worksheet loading"""
+
+    def test_sheets_parse_on_first_access(self, tmp_path):
+        """Test only the accessed sheet is parsed"""
+        rows = {1: [("A", 1)], 2: [("A", 2)]}
+        path = write_xlsx(
+            tmp_path / "multi.xlsx",
+            {"One": sheet_data(rows), "Two": sheet_data(rows)},
+        )
+
+        doc = Document()
+        doc.load(path, lazy=True)
+        first, second = doc.worksheets
+
+        assert not first.is_loaded
+        assert not second.is_loaded
+
+        assert len(first.cells) == 2
+        assert first.is_loaded
+        assert not second.is_loaded
+
+    def test_lazy_matches_eager(self, simple_xlsx):
+        """Test lazy handles expose the same cells as an eager parse"""
+        lazy = XLSXParser(simple_xlsx, lazy=True).parse().worksheets[0]
+        eager = XLSXParser(simple_xlsx).parse().worksheets[0]
+
+        assert {k: c.value for k, c in lazy.cells.items()} == {
+            k: c.value for k, c in eager.cells.items()
+        }
+
+
+class TestIterRows:
+    """Test read-only row iteration"""
+
+    @pytest.fixture
+    def gapped_xlsx(self, tmp_path):
+        rows = {1: [("A", 11), ("C", 13)], 3: [("B", 32)], 4: [("A", 41)]}
+        return write_xlsx(tmp_path / "gapped.xlsx", {"Data": sheet_data(rows)})
+
+    def test_streams_without_loading(self, gapped_xlsx):
+        """Test a lazy sheet is scanned without materialising cells"""
+        worksheet = XLSXParser(gapped_xlsx, lazy=True).parse().worksheets[0]
+
+        rows = list(worksheet.iter_rows(max_col=3, values_only=True))
+
+        assert not worksheet.is_loaded
+        assert rows == [
+            (11, None, 13),
+            (None, None, None),
+            (None, 32, None),
+            (41, None, None),
+        ]
+
+    def test_window(self, gapped_xlsx):
+        """Test row and column bounds restrict the scan"""
+        worksheet = XLSXParser(gapped_xlsx, lazy=True).parse().worksheets[0]
+
+        rows = list(worksheet.iter_rows(min_row=3, max_row=3, min_col=2, max_col=3))
+
+        assert len(rows) == 1
+        record = rows[0][0]
+        assert (record.row, record.col, record.value) == (3, 2, 32)
+        assert rows[0][1] is None
+
+    def test_streamed_matches_loaded(self, gapped_xlsx):
+        """Test streamed and in-memory iteration agree"""
+        lazy = XLSXParser(gapped_xlsx, lazy=True).parse().worksheets[0]
+        eager = XLSXParser(gapped_xlsx).parse().worksheets[0]
+
+        assert list(lazy.iter_rows(values_only=True)) == list(
+            eager.iter_rows(values_only=True)
+        )
+
+
+class TestViewportParsing:
+    """Test window-restricted parsing"""
+
+    @pytest.fixture
+    def grid_xlsx(self, tmp_path):
+        rows = {r: [("A", r), ("B", r), ("C", r)] for r in range(1, 101)}
+        return write_xlsx(tmp_path / "grid.xlsx", {"Data": sheet_data(rows)})
+
+    @pytest.mark.parametrize("window", ["B2:C5", (2, 5, 2, 3)])
+    def test_window_limits_cells(self, grid_xlsx, window):
+        """Test only cells inside the window are parsed"""
+        worksheet = XLSXParser(grid_xlsx, window=window).parse().worksheets[0]
+
+        assert sorted(worksheet.cells) == [
+            (row, col) for row in range(2, 6) for col in range(2, 4)
+        ]
+
+    def test_tree_mode_honours_window(self, grid_xlsx):
+        """Test the non-streaming path applies the same window"""
+        streamed = XLSXParser(grid_xlsx, window="A1:B3").parse().worksheets[0]
+        tree = XLSXParser(grid_xlsx, streaming=False, window="A1:B3").parse().worksheets[0]
+
+        assert sorted(streamed.cells) == sorted(tree.cells)
+
+    def test_document_window(self, grid_xlsx):
+        """Test Document.load forwards the window"""
+        doc = Document()
+        doc.load(grid_xlsx, window="A1:A10")
+
+        assert len(doc.worksheets[0].cells) == 10
+
+
+class TestSheetBounds:
+    """Test <dimension> capture and tracked bounds"""
+
+    @pytest.fixture
+    def dimension_xlsx(self, tmp_path):
+        rows = {1: [("A", 1)], 7: [("D", 2)]}
+        body = '<dimension ref="A1:D7"/>' + sheet_data(rows)
+        return write_xlsx(tmp_path / "dimension.xlsx", {"Data": body})
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_dimension_captured(self, dimension_xlsx, streaming):
+        """Test the declared dimension is recorded on the worksheet"""
+        worksheet = XLSXParser(dimension_xlsx, streaming=streaming).parse().worksheets[0]
+
+        dimension = worksheet.dimension
+        assert (dimension.min_row, dimension.max_row) == (1, 7)
+        assert (dimension.min_col, dimension.max_col) == (1, 4)
+        assert (worksheet.max_row, worksheet.max_col) == (7, 4)
+
+    def test_lazy_bounds_without_loading(self, dimension_xlsx):
+        """Test a lazy sheet reports its bounds before any cell is parsed"""
+        worksheet = XLSXParser(dimension_xlsx, lazy=True).parse().worksheets[0]
+
+        assert (worksheet.max_row, worksheet.max_col) == (7, 4)
+        assert not worksheet.is_loaded
+
+    def test_spans_skip_rows_outside_window(self, tmp_path):
+        """Test rows whose spans miss the window contribute no cells"""
+        body = (
+            '<sheetData>'
+            '<row r="1" spans="1:1"><c r="A1" t="n"><v>1</v></c></row>'
+            '<row r="2" spans="5:6"><c r="E2" t="n"><v>2</v></c></row>'
+            '</sheetData>'
+        )
+        path = write_xlsx(tmp_path / "spans.xlsx", {"Data": body})
+
+        worksheet = XLSXParser(path, window="A1:B2").parse().worksheets[0]
+
+        assert list(worksheet.cells) == [(1, 1)]
+
+
+class TestSharedStrings:
+    """Test the compact shared strings table"""
+
+    def test_table_round_trip(self):
+        """Test strings decode from the blob by index"""
+        table = SharedStringTable(cache_size=2)
+        for text in ["alpha", "", "ünïcode", "omega"]:
+            table.append(text)
+
+        assert len(table) == 4
+        assert list(table) == ["alpha", "", "ünïcode", "omega"]
+        assert table[-1] == "omega"
+        assert table.get_string(4) is None
+        with pytest.raises(IndexError):
+            table[4]
+
+    def test_parsed_from_workbook(self, tmp_path):
+        """Test sharedStrings.xml is streamed into a SharedStringTable"""
+        path = write_xlsx(
+            tmp_path / "strings.xlsx",
+            {"Data": sheet_data({1: [("A", 1)]})},
+            shared_strings=["first", "second"],
+        )
+
+        doc = XLSXParser(path).parse()
+
+        assert isinstance(doc.shared_strings, SharedStringTable)
+        assert list(doc.shared_strings) == ["first", "second"]
+
+    def test_repeated_lookups_share_one_str(self):
+        """Test cached lookups return one str that is freed with the table"""
+        import gc
+        import weakref
+
+        table = SharedStringTable(cache_size=64)
+        for index in range(50):
+            table.append(f"label {index}")
+
+        values = [table.get_string(index % 50) for index in range(1000)]
+        assert len({id(value) for value in values}) == 50
+
+        ref = weakref.ref(table)
+        del table, values
+        gc.collect()
+        assert ref() is None
+
+    def test_parse_twice_starts_fresh(self, tmp_path):
+        """Test parsing again does not append to the previous table"""
+        path = write_xlsx(
+            tmp_path / "strings.xlsx",
+            {"Data": sheet_data({1: [("A", 1)]})},
+            shared_strings=["first", "second"],
+        )
+        parser = SharedStringsParser()
+
+        with zipfile.ZipFile(path) as zf:
+            first = parser.parse(zf)
+            second = parser.parse(zf)
+
+        assert second is not first
+        assert list(second) == ["first", "second"]
+
+    def test_lazy_decodes_on_demand(self, tmp_path):
+        """Test lazy mode indexes every <si> but decodes only requested ones"""
+        path = write_xlsx(
+            tmp_path / "strings.xlsx",
+            {"Data": sheet_data({1: [("A", 1)]})},
+            shared_strings=["first", "second", "third"],
+        )
+
+        doc = XLSXParser(path, lazy=True).parse()
+        strings = doc.shared_strings
+
+        assert isinstance(strings, LazySharedStringTable)
+        assert len(strings) == 3
+        assert strings.decoded_count == 0
+        assert strings[1] == "second"
+        assert strings.decoded_count == 1
+
+    def test_lazy_handles_prefixes_and_rich_text(self):
+        """Test prefixed, empty and rich-text <si> entries decode like eager mode"""
+        xml = (
+            f'<x:sst xmlns:x="{MAIN_NS}">'
+            '<x:si><x:t>plain</x:t></x:si>'
+            '<x:si/>'
+            '<x:si><x:r><x:t>rich</x:t></x:r><x:r><x:t> text</x:t></x:r></x:si>'
+            '</x:sst>'
+        ).encode()
+
+        strings = LazySharedStringTable(xml)
+
+        assert list(strings) == ["plain", "", "rich text"]
+
+
+class TestParallelParsing:
+    """Test process-pool worksheet parsing"""
+
+    @pytest.fixture
+    def multi_xlsx(self, tmp_path):
+        sheets = {
+            f"Sheet{i}": '<dimension ref="A1:C20"/>' + sheet_data(
+                {r: [("A", r * i), ("C", 0, "s")] for r in range(1, 21)}
+            )
+            for i in range(1, 4)
+        }
+        return write_xlsx(tmp_path / "multi.xlsx", sheets, shared_strings=["zero"])
+
+    def test_matches_serial(self, multi_xlsx):
+        """Test worker processes produce the same sheets as a serial parse"""
+        serial = XLSXParser(multi_xlsx).parse()
+        parallel = XLSXParser(multi_xlsx, workers=2).parse()
+
+        for expected, actual in zip(serial.worksheets, parallel.worksheets):
+            assert {k: c.value for k, c in actual.cells.items()} == {
+                k: c.value for k, c in expected.cells.items()
+            }
+            assert actual.dimension == expected.dimension
+
+        assert parallel.worksheets[0].cell(1, 3).value == "zero"
+
+    def test_cells_created_on_first_access(self, multi_xlsx):
+        """Test worker payloads are only turned into cells when a sheet is used"""
+        doc = XLSXParser(multi_xlsx, workers=2).parse()
+        first, second, _ = doc.worksheets
+
+        assert not first.is_loaded and not second.is_loaded
+        assert first.max_row == 20
+        assert first.cell(20, 1).value == 20
+        assert first.is_loaded and not second.is_loaded
+
+    def test_wide_column_and_style_indexes(self, tmp_path):
+        """Test indexes past 65535 survive the worker payload"""
+        body = '<sheetData><row r="1"><c r="A1" s="70000"><v>1</v></c><c r="CYNH1"><v>2</v></c></row></sheetData>'
+        path = write_xlsx(tmp_path / "wide.xlsx", {"One": body, "Two": body})
+
+        worksheet = XLSXParser(path, workers=2).parse().worksheets[0]
+
+        assert worksheet.cell(1, 1).style_id == 70000
+        assert worksheet.cell(1, 70000).value == 2
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_oversized_integers(self, tmp_path, workers):
+        """Test values with more digits than int() converts do not fail the parse"""
+        digits = "9" * 5000
+        body = sheet_data({1: [("A", digits), ("B", digits, "s")]})
+        path = write_xlsx(tmp_path / "digits.xlsx", {"One": body, "Two": body}, shared_strings=["a"])
+
+        worksheet = XLSXParser(path, workers=workers).parse().worksheets[0]
+
+        limited = hasattr(sys, "get_int_max_str_digits")
+        assert worksheet.cell(1, 1).value == (float("inf") if limited else int(digits))
+        assert worksheet.cell(1, 2).value == digits
+
+    def test_window_applies_in_workers(self, multi_xlsx):
+        """Test the parser window is honoured by worker processes"""
+        doc = Document()
+        doc.load(multi_xlsx, window="A1:A5", workers=2)
+
+        for worksheet in doc.worksheets:
+            assert sorted(worksheet.cells) == [(row, 1) for row in range(1, 6)]
+
+
+class TestXMLBackend:
+    """Test XML backend selection"""
+
+    @pytest.fixture
+    def restore_backend(self):
+        backend = xml_backend.backend
+        yield
+        xml_backend.use_backend(backend)
+
+    def test_stdlib_backend(self, simple_xlsx, restore_backend):
+        """Test the stdlib backend can always be selected"""
+        xml_backend.use_backend("stdlib")
+
+        worksheet = XLSXParser(simple_xlsx).parse().worksheets[0]
+
+        assert xml_backend.backend == "stdlib"
+        assert worksheet.cell(3, 2).value == 31
+
+    def test_unknown_backend(self, restore_backend):
+        """Test unknown backend names are rejected"""
+        with pytest.raises(ValueError):
+            xml_backend.use_backend("expat")
+
+    @pytest.mark.skipif(not xml_backend.HAS_LXML, reason="lxml not installed")
+    def test_lxml_does_not_resolve_entities(self, tmp_path, restore_backend):
+        """Test the lxml backend leaves external entities unresolved"""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("secret")
+        xml_backend.use_backend("lxml")
+
+        root = xml_backend.fromstring(
+            f'<!DOCTYPE r [<!ENTITY e SYSTEM "{secret.as_uri()}">]><r>&e;</r>'.encode()
+        )
+
+        assert "secret" not in (root.text or "")
+
+    @pytest.mark.skipif(not xml_backend.HAS_LXML, reason="lxml not installed")
+    def test_lxml_matches_stdlib(self, simple_xlsx, restore_backend):
+        """Test both backends produce the same cells"""
+        xml_backend.use_backend("stdlib")
+        expected = XLSXParser(simple_xlsx).parse().worksheets[0]
+        xml_backend.use_backend("lxml")
+        actual = XLSXParser(simple_xlsx).parse().worksheets[0]
+
+        assert {k: c.value for k, c in actual.cells.items()} == {
+            k: c.value for k, c in expected.cells.items()
+        }
+
+
+class TestSnapshotCache:
+    """Test binary document snapshots"""
+
+    @pytest.fixture
+    def styled_xlsx(self, tmp_path):
+        body = (
+            '<dimension ref="A1:B2"/><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" s="1"><v>12</v></c></row>'
+            '<row r="2"><c r="A2" t="str"><v>ünï</v></c></row>'
+            '</sheetData>'
+        )
+        return write_xlsx(tmp_path / "styled.xlsx", {"Data": body}, shared_strings=["shared"])
+
+    def test_round_trip(self, styled_xlsx, tmp_path):
+        """Test a snapshot restores cells, styles, strings and bounds"""
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        parsed = XLSXParser(styled_xlsx).parse()
+        cache.store(parsed)
+
+        restored = cache.load(styled_xlsx)
+        expected, actual = parsed.worksheets[0], restored.worksheets[0]
+
+        assert restored.filepath == styled_xlsx
+        assert list(restored.shared_strings) == ["shared"]
+        assert {k: c.value for k, c in actual.cells.items()} == {
+            k: c.value for k, c in expected.cells.items()
+        }
+        assert {k: (c.style_id, c.data_type) for k, c in actual.cells.items()} == {
+            k: (c.style_id, c.data_type) for k, c in expected.cells.items()
+        }
+        assert actual.dimension == expected.dimension
+        assert (actual.max_row, actual.max_col) == (2, 2)
+
+    def test_hit_skips_parsing(self, styled_xlsx, tmp_path, monkeypatch):
+        """Test a second load is served from the snapshot"""
+        cache_dir = str(tmp_path / "cache")
+        Document().load(styled_xlsx, cache_dir=cache_dir)
+
+        def fail(self):
+            raise AssertionError("parsed despite a cached snapshot")
+
+        monkeypatch.setattr(XLSXParser, "parse", fail)
+        doc = Document()
+        doc.load(styled_xlsx, cache_dir=cache_dir)
+
+        assert doc.worksheets[0].cell(1, 2).value == 12
+
+    def test_changed_file_misses(self, styled_xlsx, tmp_path):
+        """Test rewriting the workbook invalidates its snapshot"""
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        cache.store(XLSXParser(styled_xlsx).parse())
+
+        write_xlsx(styled_xlsx, {"Data": sheet_data({1: [("A", 5)]})})
+
+        assert cache.load(styled_xlsx) is None
+
+    def test_touched_file_hashes_once(self, styled_xlsx, tmp_path, monkeypatch):
+        """Test only an mtime change makes a load hash the workbook"""
+        from pyxslxview.parser import snapshot
+
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        cache.store(XLSXParser(styled_xlsx).parse())
+        hashed = []
+        digest = snapshot._file_digest
+        monkeypatch.setattr(snapshot, "_file_digest", lambda path: hashed.append(path) or digest(path))
+
+        assert cache.load(styled_xlsx) is not None
+        assert hashed == []
+
+        stat = os.stat(styled_xlsx)
+        os.utime(styled_xlsx, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert cache.load(styled_xlsx) is not None
+        assert hashed == [styled_xlsx]
+
+    def test_cells_restored_on_first_access(self, styled_xlsx, tmp_path):
+        """Test a hit copies sections out and defers creating cells"""
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        cache.store(XLSXParser(styled_xlsx).parse())
+
+        restored = cache.load(styled_xlsx)
+        ws = restored.worksheets[0]
+
+        assert not ws.is_loaded
+        assert all(isinstance(buffer, (bytes, array)) for buffer in restored.shared_strings.buffers)
+        assert ws.cell(2, 1).value == "ünï"
+        assert ws.is_loaded
+
+    def test_prune_keeps_recent_snapshots(self, tmp_path):
+        """Test the cache directory is capped at max_snapshots files"""
+        cache_dir = tmp_path / "cache"
+        cache = SnapshotCache(str(cache_dir), max_snapshots=2)
+        paths = []
+        for index in range(3):
+            path = write_xlsx(tmp_path / f"book{index}.xlsx", {"Data": sheet_data({1: [("A", index)]})})
+            paths.append(cache.store(XLSXParser(path).parse()))
+            os.utime(paths[-1], ns=(index * 10 ** 9, index * 10 ** 9))
+
+        cache.prune()
+
+        assert sorted(os.listdir(cache_dir)) == sorted(os.path.basename(p) for p in paths[1:])
+
+    def test_truncated_snapshot_misses(self, styled_xlsx, tmp_path):
+        """Test a truncated snapshot is re-parsed instead of raising"""
+        cache_dir = str(tmp_path / "cache")
+        cache = SnapshotCache(cache_dir)
+        path = cache.store(XLSXParser(styled_xlsx).parse())
+
+        with open(path, "rb") as f:
+            data = f.read()
+        for size in (40, len(data) - 8):
+            with open(path, "wb") as f:
+                f.write(data[:size])
+            assert cache.load(styled_xlsx) is None
+
+        doc = Document()
+        doc.load(styled_xlsx, cache_dir=cache_dir)
+
+        assert doc.worksheets[0].cell(1, 2).value == 12
+        assert cache.load(styled_xlsx) is not None
+
+    def test_merged_cells_keep_worksheet(self, styled_xlsx, tmp_path):
+        """Test restored merged ranges point back at their worksheet"""
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        parsed = XLSXParser(styled_xlsx).parse()
+        parsed.worksheets[0].merge_cells("A1:B2")
+        cache.store(parsed)
+
+        ws = cache.load(styled_xlsx).worksheets[0]
+
+        assert [str(r) for r in ws.merged_cells] == ["A1:B2"]
+        assert ws.merged_cells[0].worksheet is ws
+
+
+class TestReload:
+    """Test incremental re-parsing of changed parts"""
+
+    def write(self, path, second_value, shared_strings=("a", "b")):
+        return write_xlsx(
+            path,
+            {
+                "One": sheet_data({1: [("A", 1)]}),
+                "Two": sheet_data({1: [("A", second_value)]}),
+            },
+            shared_strings=list(shared_strings),
+        )
+
+    def test_unchanged_file(self, tmp_path):
+        """Test reloading an unchanged file does nothing"""
+        path = self.write(tmp_path / "book.xlsx", 2)
+        doc = Document()
+        doc.load(path)
+
+        assert doc.reload() == []
+
+    def test_only_changed_sheet_is_parsed(self, tmp_path):
+        """Test an edit to one sheet keeps the other sheet's cells"""
+        path = self.write(tmp_path / "book.xlsx", 2)
+        doc = Document()
+        doc.load(path)
+        first, second = doc.worksheets
+        first_cells = first.cells
+
+        self.write(path, 3)
+        changed = doc.reload()
+
+        assert changed == ["xl/worksheets/sheet2.xml"]
+        assert doc.worksheets == [first, second]
+        assert first.cells is first_cells
+        assert second.cell(1, 1).value == 3
+
+    def test_appended_strings_keep_sheets(self, tmp_path):
+        """Test appending shared strings does not re-parse unchanged sheets"""
+        path = self.write(tmp_path / "book.xlsx", 2)
+        doc = Document()
+        doc.load(path)
+        first_cells = doc.worksheets[0].cells
+
+        self.write(path, 2, shared_strings=("a", "b", "c"))
+        changed = doc.reload()
+
+        assert changed == ["xl/sharedStrings.xml"]
+        assert doc.worksheets[0].cells is first_cells
+        assert list(doc.shared_strings) == ["a", "b", "c"]
+
+    def test_rewritten_strings_reparse_all(self, tmp_path):
+        """Test replacing shared strings re-parses every sheet"""
+        path = self.write(tmp_path / "book.xlsx", 2)
+        doc = Document()
+        doc.load(path)
+        first_cells = doc.worksheets[0].cells
+
+        self.write(path, 2, shared_strings=("z",))
+        doc.reload()
+
+        assert doc.worksheets[0].cells is not first_cells
+        assert doc.worksheets[0].cell(1, 1).value == 1
+
+
+class TestStylesParser:
+    """Test single-pass styles parsing"""
+
+    STYLES = (
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.000"/></numFmts>'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><i val="0"/><sz val="14"/><color rgb="FFFF0000"/><name val="Arial"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="solid"><fgColor rgb="FF00FF00"/></patternFill></fill></fills>'
+        '<borders count="2"><border/><border><left style="thin"><color rgb="FF0000FF"/></left>'
+        '<right/><top/><bottom style="double"/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="1"/></cellStyleXfs>'
+        '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+        '<xf numFmtId="164" fontId="1" fillId="1" borderId="1">'
+        '<alignment horizontal="center" wrapText="1"/></xf>'
+        '<xf numFmtId="10" fontId="1"><protection locked="0"/></xf></cellXfs>'
+        '<dxfs count="1"><dxf><font><b/></font></dxf></dxfs>'
+    )
+
+    def test_resolved_table(self, tmp_path):
+        """Test each cellXfs entry resolves to a CellStyle"""
+        path = write_xlsx(tmp_path / "styles.xlsx", {"Data": sheet_data({})}, styles=self.STYLES)
+
+        doc = XLSXParser(path).parse()
+        styles = doc.styles
+        plain, styled, percent = doc.style_table
+
+        assert len(styles.fonts) == 2
+        assert len(styles.fills) == 2
+        assert len(styles.borders) == 2
+        assert len(doc.style_table) == 3
+
+        assert plain.font.name == "Calibri"
+        assert styled.font.name == "Arial"
+        assert styled.font.bold is True
+        assert styled.font.italic is False
+        assert styled.font.size == 14.0
+        assert styled.fill.fill_type == "solid"
+        assert styled.fill.fg_color == Color.from_hex("FF00FF00")
+        assert styled.border.left.style == "thin"
+        assert styled.border.bottom.style == "double"
+        assert styled.alignment.horizontal == "center"
+        assert styled.alignment.wrap_text is True
+        assert styled.number_format == "0.000"
+        assert percent.number_format == "0.00%"
+        assert percent.protection_locked is False
+
+
+class TestTypedDecoding:
+    """Test decoding by the t and s cell attributes"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_cell_types(self, tmp_path, workers):
+        """Test each cell type decodes to the right value and data type"""
+        body = (
+            '<sheetData><row r="1">'
+            '<c r="A1" t="s"><v>1</v></c>'
+            '<c r="B1"><v>42</v></c>'
+            '<c r="C1" t="n"><v>-2.5E1</v></c>'
+            '<c r="D1" t="b"><v>1</v></c>'
+            '<c r="E1" t="str"><f>A1</f><v>0123</v></c>'
+            '<c r="F1" t="inlineStr"><is><r><t>in</t></r><r><t>line</t></r></is></c>'
+            '<c r="G1" t="e"><v>#DIV/0!</v></c>'
+            '<c r="H1" t="s"><v>7</v></c>'
+            '<c r="I1" s="2"/>'
+            '</row></sheetData>'
+        )
+        path = write_xlsx(tmp_path / "types.xlsx", {"Data": body, "Copy": body}, shared_strings=["a", "b"])
+
+        worksheet = XLSXParser(path, workers=workers).parse().worksheets[0]
+        decoded = {col: (cell.value, cell.data_type) for (_, col), cell in worksheet.cells.items()}
+
+        assert decoded == {
+            1: ("b", "string"),
+            2: (42, "number"),
+            3: (-25.0, "number"),
+            4: (True, "boolean"),
+            5: ("0123", "string"),
+            6: ("inline", "string"),
+            7: ("#DIV/0!", "error"),
+            8: ("7", "string"),
+            9: (None, "blank"),
+        }
+        assert worksheet.cell(1, 9).style_id == 2
+        assert worksheet.cell(1, 2).style_id == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
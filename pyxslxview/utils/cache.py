@@ -2,10 +2,12 @@
 Cache management
 """
 
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Callable
 from functools import wraps
 import hashlib
 import pickle
+import threading
 import time
 
 
@@ -75,52 +77,46 @@ class Cache:
 
 
 class LRUCache:
-    """Least Recently Used cache"""
+    """Least Recently Used cache, safe to share between threads"""
     
     def __init__(self, max_size: int = 1000):
-        self._cache: Dict[str, Any] = {}
-        self._order: Dict[str, int] = {}
+        self._cache: "OrderedDict[Any, Any]" = OrderedDict()
         self._max_size = max_size
-        self._counter = 0
+        self._lock = threading.Lock()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Any) -> Optional[Any]:
         """Get value from cache"""
-        if key not in self._cache:
-            return None
-        
-        self._order[key] = self._counter
-        self._counter += 1
-        return self._cache[key]
-    
-    def set(self, key: str, value: Any):
+        with self._lock:
+            try:
+                self._cache.move_to_end(key)
+            except KeyError:
+                return None
+            return self._cache[key]
+    
+    def set(self, key: Any, value: Any):
         """Set value in cache"""
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            self._evict_lru()
-        
-        self._cache[key] = value
-        self._order[key] = self._counter
-        self._counter += 1
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                self._evict_lru()
+            
+            self._cache[key] = value
     
-    def remove(self, key: str):
+    def remove(self, key: Any):
         """Remove value from cache"""
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._order:
-            del self._order[key]
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self):
         """Clear all cache entries"""
-        self._cache.clear()
-        self._order.clear()
-        self._counter = 0
+        with self._lock:
+            self._cache.clear()
     
     def _evict_lru(self):
         """Evict least recently used entry"""
-        if not self._order:
-            return
-        
-        lru_key = min(self._order, key=self._order.get)
-        self.remove(lru_key)
+        if self._cache:
+            self._cache.popitem(last=False)
     
     def size(self) -> int:
         """Get cache size"""
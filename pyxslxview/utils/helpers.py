@@ -3,14 +3,31 @@ Helper functions
 """
 
 import re
-from typing import Tuple
+from array import array
+from typing import Iterable, Sequence, Tuple
+
+from .references import COLUMN_LETTERS, MAX_COLUMN, column_letter, column_number, coordinate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+INT64_MAX = (1 << 63) - 1
+
+# Longest letter and digit runs that cannot overflow int64 in the vectorized parse
+NP_MAX_LETTERS = 13
+NP_MAX_DIGITS = 18
 
 
 class Helpers:
     """Helper functions"""
     
-    CELL_REF_PATTERN = re.compile(r"^([A-Z]+)(\d+)$")
-    RANGE_REF_PATTERN = re.compile(r"^([A-Z]+)(\d+):([A-Z]+)(\d+)$")
+    CELL_REF_PATTERN = re.compile(r"([A-Z]+)([0-9]+)\Z")
+    RANGE_REF_PATTERN = re.compile(r"([A-Z]+)([0-9]+):([A-Z]+)([0-9]+)\Z")
     
     @staticmethod
     def parse_cell_reference(ref: str) -> Tuple[int, int]:
@@ -20,13 +37,7 @@ class Helpers:
             raise ValueError(f"Invalid cell reference: {ref}")
         
         col_str, row_str = match.groups()
-        
-        col = 0
-        for char in col_str:
-            col = col * 26 + (ord(char.upper()) - ord('A') + 1)
-        
-        row = int(row_str)
-        return (row, col)
+        return (int(row_str), column_number(col_str))
     
     @staticmethod
     def cell_reference_to_tuple(ref: str) -> Tuple[int, int]:
@@ -36,13 +47,7 @@ class Helpers:
     @staticmethod
     def tuple_to_cell_reference(row: int, col: int) -> str:
         """Convert (row, col) tuple to cell reference (e.g., 'A1')"""
-        col_str = ""
-        temp = col
-        while temp > 0:
-            temp -= 1
-            col_str = chr(65 + (temp % 26)) + col_str
-            temp //= 26
-        return f"{col_str}{row}"
+        return coordinate(row, col)
     
     @staticmethod
     def parse_range_reference(ref: str) -> Tuple[int, int, int, int]:
@@ -52,19 +57,63 @@ class Helpers:
             raise ValueError(f"Invalid range reference: {ref}")
         
         col1_str, row1_str, col2_str, row2_str = match.groups()
+        return (int(row1_str), column_number(col1_str), int(row2_str), column_number(col2_str))
+    
+    @staticmethod
+    def tuples_to_cell_references(rows: Sequence[int], cols: Sequence[int]):
+        """Convert arrays of rows and cols to a list of cell references in one call"""
+        if np is not None:
+            return _np_cell_references(_np_vector(rows, np.int64), _np_vector(cols, np.int64)).tolist()
         
-        col1 = 0
-        for char in col1_str:
-            col1 = col1 * 26 + (ord(char.upper()) - ord('A') + 1)
-        
-        col2 = 0
-        for char in col2_str:
-            col2 = col2 * 26 + (ord(char.upper()) - ord('A') + 1)
+        references = []
+        for row, col in zip(rows, cols):
+            if not 1 <= col <= MAX_COLUMN:
+                raise ValueError(f"Column out of range: {col}")
+            references.append(f"{COLUMN_LETTERS[col]}{row}")
+        return references
+    
+    @staticmethod
+    def parse_cell_references(refs: Iterable[str]):
+        """Parse many cell references to (rows, cols) array('q') pairs in one call"""
+        if np is not None:
+            rows, cols = _np_parse_cell_references(_np_vector(refs, str), "cell")
+            return _int64_array(rows), _int64_array(cols)
         
-        row1 = int(row1_str)
-        row2 = int(row2_str)
+        rows, cols = array("q"), array("q")
+        match = Helpers.CELL_REF_PATTERN.match
+        for ref in refs:
+            parts = match(ref)
+            if not parts:
+                raise ValueError(f"Invalid cell reference: {ref}")
+            rows.append(int(parts.group(2)))
+            cols.append(column_number(parts.group(1)))
+        return rows, cols
+    
+    @staticmethod
+    def parse_range_references(refs: Iterable[str]):
+        """Parse many range references to (row1, col1, row2, col2) array('q')s in one call"""
+        if np is not None:
+            refs = _np_vector(refs, str)
+            parts = np.char.partition(refs, ":")
+            invalid = parts[..., 1] != ":"
+            if invalid.any():
+                raise ValueError(f"Invalid range reference: {refs[invalid][0]}")
+            row1, col1 = _np_parse_cell_references(parts[..., 0], "range", refs)
+            row2, col2 = _np_parse_cell_references(parts[..., 2], "range", refs)
+            return _int64_array(row1), _int64_array(col1), _int64_array(row2), _int64_array(col2)
         
-        return (row1, col1, row2, col2)
+        row1, col1, row2, col2 = array("q"), array("q"), array("q"), array("q")
+        match = Helpers.RANGE_REF_PATTERN.match
+        for ref in refs:
+            parts = match(ref)
+            if not parts:
+                raise ValueError(f"Invalid range reference: {ref}")
+            col1_str, row1_str, col2_str, row2_str = parts.groups()
+            row1.append(int(row1_str))
+            col1.append(column_number(col1_str))
+            row2.append(int(row2_str))
+            col2.append(column_number(col2_str))
+        return row1, col1, row2, col2
     
     @staticmethod
     def tuple_to_range_reference(row1: int, col1: int, row2: int, col2: int) -> str:
@@ -76,21 +125,12 @@ class Helpers:
     @staticmethod
     def get_column_letter(col: int) -> str:
         """Get column letter from column number (1-indexed)"""
-        col_str = ""
-        temp = col
-        while temp > 0:
-            temp -= 1
-            col_str = chr(65 + (temp % 26)) + col_str
-            temp //= 26
-        return col_str
+        return column_letter(col)
     
     @staticmethod
     def get_column_number(letter: str) -> int:
         """Get column number from column letter"""
-        col = 0
-        for char in letter:
-            col = col * 26 + (ord(char.upper()) - ord('A') + 1)
-        return col
+        return column_number(letter)
     
     @staticmethod
     def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -134,4 +174,85 @@ class Helpers:
         """Truncate text to max length"""
         if len(text) <= max_length:
             return text
-        return text[:max_length - len(suffix)] + suffix
\ No newline at end of file
+        return text[:max_length - len(suffix)] + suffix
+
+
+def _np_vector(values, dtype):
+    """Convert a batch argument to a 1-D NumPy array
+    
+    Nested input is rejected with TypeError, as the fallback loops fail on
+    non-scalar items.
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim != 1:
+        raise TypeError(f"Expected a 1-D sequence, got {values.ndim}-D input")
+    return values
+
+
+def _np_cell_references(rows, cols):
+    """Vectorized tuples_to_cell_references"""
+    if cols.size and (cols.min() < 1 or cols.max() > MAX_COLUMN):
+        invalid = cols[(cols < 1) | (cols > MAX_COLUMN)][0]
+        raise ValueError(f"Column out of range: {invalid}")
+    
+    letters = np.array(COLUMN_LETTERS, dtype="U3")
+    digits = max(len(str(int(rows.max()))), len(str(int(rows.min())))) if rows.size else 1
+    return np.char.add(letters[cols], rows.astype(f"U{digits}"))
+
+
+def _np_parse_cell_references(refs, kind: str, sources=None):
+    """Vectorized parse of 'A1' strings to int64 (rows, cols) arrays
+    
+    Works on the UCS-4 code points of the string array: each reference must
+    be uppercase letters, then digits, then padding. References with runs
+    too long for int64 arithmetic are converted one by one and raise
+    OverflowError past int64, like the array('q') fallback.
+    """
+    width = refs.dtype.itemsize // 4
+    if not refs.size or not width:
+        if refs.size:
+            raise ValueError(f"Invalid {kind} reference: {(refs if sources is None else sources).flat[0]}")
+        return np.zeros(refs.shape, dtype=np.int64), np.zeros(refs.shape, dtype=np.int64)
+    
+    codes = np.ascontiguousarray(refs).view(np.uint32).reshape(refs.shape + (width,))
+    used = np.flatnonzero(codes.reshape(-1, width).any(axis=0))
+    width = int(used[-1]) + 1 if used.size else 1
+    codes = codes[..., :width].astype(np.int64)
+    letter = (codes >= 65) & (codes <= 90)
+    digit = (codes >= 48) & (codes <= 57)
+    
+    # Letters are class 0, digits 1 and padding 2; classes must never decrease
+    classes = np.where(letter, 0, np.where(digit, 1, np.where(codes == 0, 2, -1)))
+    valid = (letter[..., 0] & digit.any(axis=-1) & (classes >= 0).all(axis=-1)
+             & (np.diff(classes, axis=-1) >= 0).all(axis=-1))
+    if not valid.all():
+        source = (refs if sources is None else sources)[~valid][0]
+        raise ValueError(f"Invalid {kind} reference: {source}")
+    
+    letter_counts = letter.sum(axis=-1)
+    overlong = (letter_counts > NP_MAX_LETTERS) | (digit.sum(axis=-1) > NP_MAX_DIGITS)
+    
+    rows = np.zeros(refs.shape, dtype=np.int64)
+    cols = np.zeros(refs.shape, dtype=np.int64)
+    for i in range(width):
+        code = codes[..., i]
+        cols = np.where(letter[..., i], cols * 26 + code - 64, cols)
+        rows = np.where(digit[..., i], rows * 10 + code - 48, rows)
+    
+    for index in map(tuple, np.argwhere(overlong)):
+        ref = str(refs[index])
+        split = int(letter_counts[index])
+        row, col = int(ref[split:]), column_number(ref[:split])
+        if row > INT64_MAX or col > INT64_MAX:
+            source = ref if sources is None else sources[index]
+            raise OverflowError(f"Reference out of int64 range: {source}")
+        rows[index], cols[index] = row, col
+    
+    return rows, cols
+
+
+def _int64_array(values) -> array:
+    """Copy an int64 NumPy array into an array('q')"""
+    result = array("q")
+    result.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return result
@@ -0,0 +1,113 @@
+"""
+A1 cell reference decoding with precomputed column labels
+"""
+
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+DIGITS = "0123456789"
+
+
+def _build_column_letters() -> Tuple[str, ...]:
+    """Build the label of every column, indexed by column number"""
+    letters = [""]
+    for col in range(1, MAX_COLUMN + 1):
+        label = ""
+        temp = col
+        while temp > 0:
+            temp -= 1
+            label = chr(65 + (temp % 26)) + label
+            temp //= 26
+        letters.append(label)
+    return tuple(letters)
+
+
+COLUMN_LETTERS: Tuple[str, ...] = _build_column_letters()
+COLUMN_NUMBERS: Dict[str, int] = {label: col for col, label in enumerate(COLUMN_LETTERS) if col}
+
+
+def column_letter(col: int) -> str:
+    """Get column letter from column number (1-indexed)"""
+    if 0 <= col <= MAX_COLUMN:
+        return COLUMN_LETTERS[col]
+    
+    label = ""
+    while col > 0:
+        col -= 1
+        label = chr(65 + (col % 26)) + label
+        col //= 26
+    return label
+
+
+def column_number(label: str) -> int:
+    """Get column number from column letter"""
+    col = COLUMN_NUMBERS.get(label)
+    if col is not None:
+        return col
+    
+    col = 0
+    for char in label.upper():
+        col = col * 26 + (ord(char) - ord('A') + 1)
+    return col
+
+
+def coordinate(row: int, col: int) -> str:
+    """Get the A1 reference of a cell"""
+    return f"{column_letter(col)}{row}"
+
+
+def split_reference(ref: str) -> Tuple[int, int]:
+    """Parse cell reference (e.g., 'A1' or '$A$1') to (row, col)"""
+    if "$" in ref:
+        ref = ref.replace("$", "")
+    
+    label = ref.rstrip(DIGITS)
+    if not label or len(label) == len(ref):
+        raise ValueError(f"Invalid cell reference: {ref}")
+    
+    col = COLUMN_NUMBERS.get(label)
+    if col is None:
+        if not label.isalpha():
+            raise ValueError(f"Invalid cell reference: {ref}")
+        col = column_number(label)
+    return int(ref[len(label):]), col
+
+
+def split_range(ref: str) -> Tuple[int, int, int, int]:
+    """Parse range reference ('A1:D10', or a single 'A1') to (min_row, min_col, max_row, max_col)"""
+    start, _, end = ref.partition(":")
+    min_row, min_col = split_reference(start)
+    if not end:
+        return min_row, min_col, min_row, min_col
+    max_row, max_col = split_reference(end)
+    return min_row, min_col, max_row, max_col
+
+
+def parse_references(refs: Iterable[Optional[str]], row: int = 0) -> Tuple[array, array]:
+    """Decode many cell references at once into (rows, cols) arrays
+    
+    A missing reference (None or '') is taken to be the column after the
+    previous cell, on the previous cell's row (``row`` for the first one),
+    as allowed for <c> elements without an ``r`` attribute.
+    """
+    rows, cols = array("I"), array("I")
+    col = 0
+    numbers = COLUMN_NUMBERS
+    
+    for ref in refs:
+        if not ref:
+            col += 1
+        else:
+            label = ref.rstrip(DIGITS)
+            col = numbers.get(label)
+            if col is None or len(label) == len(ref):
+                row, col = split_reference(ref)
+            else:
+                row = int(ref[len(label):])
+        rows.append(row)
+        cols.append(col)
+    
+    return rows, cols
@@ -0,0 +1,42 @@
+"""
+__slots__ support for dataclasses
+"""
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__ for its fields
+    
+    Equivalent to ``dataclass(slots=True)`` on Python 3.10+, which this
+    package cannot require. Apply it on top of ``@dataclass``. Frozen
+    classes get __getstate__/__setstate__ so they still pickle and copy.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    
+    inherited = {slot for base in cls.__mro__[1:] for slot in getattr(base, "__slots__", ())}
+    namespace["__slots__"] = tuple(name for name in names if name not in inherited)
+    
+    if cls.__dataclass_params__.frozen:
+        namespace["__getstate__"] = _frozen_getstate
+        namespace["__setstate__"] = _frozen_setstate
+    
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _frozen_getstate(self) -> list:
+    """Get the field values of a frozen slotted dataclass"""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self, state: list):
+    """Restore the field values of a frozen slotted dataclass"""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)